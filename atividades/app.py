@@ -1,37 +1,54 @@
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
+import requests
+from flask import Flask, jsonify
 from flasgger import Swagger
 
 # Importa apenas o db aqui
 from models import db
-
-app = Flask(__name__)
-
-# Configuração do banco SQLite local
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///atividades.db'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SWAGGER'] = {
-    'title': 'API de Atividades',
-    'uiversion': 3
-}
-
-db.init_app(app)
-swagger = Swagger(app)
-
-# Importa os blueprints *depois* de inicializar o app e db
+from config import Config
+from models.migracoes import aplicar_migracoes
+import models.sqlite  # registra os pragmas do SQLite em cada conexão
+from utils.provedor_json import ProvedorJSON
 from controllers.atividade_controller import atividade_bp
 from controllers.nota_controller import nota_bp
+from controllers.cache_controller import cache_bp
 
-app.register_blueprint(atividade_bp, url_prefix="/api/atividades")
-app.register_blueprint(nota_bp, url_prefix="/api/notas")
 
-# Cria tabelas
-with app.app_context():
-    db.create_all()
+# Timeout, circuito aberto ou falha de rede ao validar ids em outro microsserviço
+def servico_indisponivel(e):
+    return jsonify({"erro": f"Falha na comunicação com outro microsserviço: {e}"}), 503
+
 
-@app.route("/")
 def home():
     return {"mensagem": "API de Atividades e Notas está rodando com sucesso 🚀"}
 
+
+def create_app():
+    app = Flask(__name__)
+
+    # Banco, pool de conexões e integrações vêm do Config (variáveis de ambiente)
+    app.config.from_object(Config)
+    app.json = ProvedorJSON(app)  # orjson quando instalado, datas em ISO 8601
+
+    db.init_app(app)
+    Swagger(app)
+
+    app.register_blueprint(atividade_bp, url_prefix="/api/atividades")
+    app.register_blueprint(nota_bp, url_prefix="/api/notas")
+    app.register_blueprint(cache_bp, url_prefix="/api/_cache")
+    app.register_error_handler(requests.exceptions.RequestException, servico_indisponivel)
+    app.add_url_rule("/", "home", home)
+
+    # Cria tabelas e aplica as migrações em bancos já existentes
+    with app.app_context():
+        db.create_all()
+        aplicar_migracoes()
+        # com preload no gunicorn o app é criado antes do fork: nenhuma conexão
+        # aberta aqui pode ser herdada pelos workers
+        db.engine.dispose()
+
+    return app
+
+
 if __name__ == "__main__":
+    app = create_app()
     app.run(debug=True)
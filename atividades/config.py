@@ -1,9 +1,48 @@
 import os
 
 class Config:
-    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///atividades.db")
+    # "postgres://" (Heroku/Render) não é aceito pelo SQLAlchemy 2
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///atividades.db").replace("postgres://", "postgresql://", 1)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Pool de conexões para bancos servidor (PostgreSQL); o SQLite usa o padrão do SQLAlchemy
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))                 # conexões mantidas abertas por processo
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))          # conexões extras em picos
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))        # segundos esperando uma conexão livre
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))        # segundos até reabrir (evita conexões mortas)
+    SQLALCHEMY_ENGINE_OPTIONS = {} if SQLALCHEMY_DATABASE_URI.startswith("sqlite") else {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True
+    }
     SWAGGER = {
         "title": "API de Atividades e Notas",
         "uiversion": 3
     }
+
+    # Cache das validações de existência feitas no microsserviço de gerenciamento
+    VALIDACAO_CACHE_TAMANHO = int(os.getenv("VALIDACAO_CACHE_TAMANHO", "10000"))
+    VALIDACAO_CACHE_TTL = float(os.getenv("VALIDACAO_CACHE_TTL", "300"))                  # segundos, ids encontrados
+    VALIDACAO_CACHE_TTL_NEGATIVO = float(os.getenv("VALIDACAO_CACHE_TTL_NEGATIVO", "10"))  # segundos, ids inexistentes (404)
+    # Turma e professor consultados ao mesmo tempo em criar/atualizar atividade (opcional)
+    VALIDACAO_PARALELA = os.getenv("VALIDACAO_PARALELA", "false").lower() in ("1", "true")
+    VALIDACAO_PARALELA_THREADS = int(os.getenv("VALIDACAO_PARALELA_THREADS", "8"))       # threads do pool por processo
+
+    # Comunicação com os outros microsserviços (cliente HTTP compartilhado)
+    GERENCIAMENTO_URL = os.getenv("GERENCIAMENTO_URL", "http://gerenciamento:5001")
+    HTTP_POOL_TAMANHO = int(os.getenv("HTTP_POOL_TAMANHO", "20"))                     # conexões keep-alive por serviço
+    HTTP_TIMEOUT_CONEXAO = float(os.getenv("HTTP_TIMEOUT_CONEXAO", "2"))              # segundos
+    HTTP_TIMEOUT_LEITURA = float(os.getenv("HTTP_TIMEOUT_LEITURA", "5"))              # segundos
+    HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+    HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.2"))                # 0.2s, 0.4s, 0.8s...
+    CIRCUITO_LIMITE_FALHAS = int(os.getenv("CIRCUITO_LIMITE_FALHAS", "5"))            # falhas seguidas até abrir
+    CIRCUITO_TEMPO_ABERTO = float(os.getenv("CIRCUITO_TEMPO_ABERTO", "30"))           # segundos antes de testar de novo
+
+    # Perfil do SQLite aplicado em cada conexão (models/sqlite.py)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")               # leitores não bloqueiam o escritor
+    SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))         # ms esperando o lock antes de "database is locked"
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")              # seguro com WAL, sem fsync a cada commit
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-20000"))           # negativo = KiB (~20 MB por conexão)
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))  # bytes lidos via mmap
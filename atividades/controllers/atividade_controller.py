@@ -1,14 +1,28 @@
 from flask import Blueprint, jsonify, request
 from models import db
 from models.atividade import Atividade
+from utils.paginacao import listar_paginado
+from utils.ndjson import pediu_ndjson, resposta_ndjson
+from utils.validacao import primeiro_inexistente, validar_em_paralelo
+from utils.filtros import filtrar, data_iso
+from utils.condicional import lista_condicional, etag_conteudo
 from datetime import datetime
-import requests  # para comunicação síncrona entre microsserviços
+import asyncio
 
 atividade_bp = Blueprint('atividade_bp', __name__)
 
-# Endpoints dos microsserviços
-URL_TURMAS = "http://gerenciamento:5001/api/turmas/"      # microsserviço de Turmas
-URL_PROFESSORES = "http://gerenciamento:5001/api/professores/"  # microsserviço de Professores
+
+def mensagem_inexistente(recurso, recurso_id):
+    if recurso == "turmas":
+        return f"Turma com ID {recurso_id} não encontrada"
+    return f"Professor com ID {recurso_id} não encontrado"
+
+# Filtros aceitos em GET /api/atividades/ (colunas indexadas)
+FILTROS_ATIVIDADE = {
+    "turma_id": (Atividade.turma_id, int),
+    "professor_id": (Atividade.professor_id, int),
+    "data_entrega": (Atividade.data_entrega, data_iso)
+}
 
 # 🟢 Criar uma nova atividade
 @atividade_bp.route('/', methods=['POST'])
@@ -61,16 +75,16 @@ def criar_atividade():
     """
     data = request.get_json()
     
-    # ✅ Validação via microsserviço de Turmas
-    resp_turma = requests.get(f"{URL_TURMAS}{data['turma_id']}")
-    if resp_turma.status_code != 200:
-        return jsonify({"erro": f"Turma com ID {data['turma_id']} não encontrada"}), 400
+    # ✅ Validação via microsserviço de Turmas e Professores (em paralelo com VALIDACAO_PARALELA)
+    inexistente = primeiro_inexistente([("turmas", data['turma_id']), ("professores", data['professor_id'])])
+    if inexistente:
+        return jsonify({"erro": mensagem_inexistente(*inexistente)}), 400
 
-    # ✅ Validação via microsserviço de Professores
-    resp_prof = requests.get(f"{URL_PROFESSORES}{data['professor_id']}")
-    if resp_prof.status_code != 200:
-        return jsonify({"erro": f"Professor com ID {data['professor_id']} não encontrado"}), 400
+    return salvar_atividade(data)
 
+
+def salvar_atividade(data):
+    """Grava a atividade já validada (usado pelas rotas síncrona e assíncrona)."""
     try:
         nova = Atividade(
             nome_atividade=data['nome_atividade'],
@@ -88,24 +102,129 @@ def criar_atividade():
         return jsonify({"erro": str(e)}), 400
 
 
+# ⚡ Criar uma nova atividade (validações em paralelo)
+@atividade_bp.route('/async', methods=['POST'])
+async def criar_atividade_async():
+    """
+    Cria uma nova atividade validando turma e professor ao mesmo tempo
+    Mesmo corpo e mesmas respostas do POST /api/atividades/. As duas consultas
+    ao gerenciamento saem juntas (asyncio.gather num cliente httpx com pool
+    compartilhado), então a latência é a da mais lenta e não a soma.
+    ---
+    tags:
+      - Atividades
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        description: Dados da nova atividade (mesmo formato do POST /api/atividades/)
+        required: true
+        schema:
+          type: object
+          required:
+            - nome_atividade
+            - peso_porcento
+            - data_entrega
+            - turma_id
+            - professor_id
+    responses:
+      201:
+        description: Atividade criada com sucesso
+      400:
+        description: Erro ao criar a atividade
+      503:
+        description: Gerenciamento indisponível
+    """
+    data = request.get_json()
+    try:
+        pares = (("turmas", data['turma_id']), ("professores", data['professor_id']))
+    except KeyError as e:
+        return jsonify({"erro": f"Campo {e} é obrigatório"}), 400
+
+    turma_ok, professor_ok = await asyncio.wrap_future(validar_em_paralelo(*pares))
+    if not turma_ok:
+        return jsonify({"erro": f"Turma com ID {data['turma_id']} não encontrada"}), 400
+    if not professor_ok:
+        return jsonify({"erro": f"Professor com ID {data['professor_id']} não encontrado"}), 400
+
+    return salvar_atividade(data)
+
+
 # 🟡 Listar todas as atividades
 @atividade_bp.route('/', methods=['GET'])
+@lista_condicional("atividades")
 def listar_atividades():
     """
-    Lista todas as atividades
+    Lista as atividades (paginação por cursor)
+    Filtros opcionais viram cláusulas WHERE no banco; cada campo aceita os
+    sufixos __gt, __gte, __lt, __lte, __in (a,b,c) e __between (a,b).
     ---
     tags:
       - Atividades
+    parameters:
+      - name: turma_id
+        in: query
+        type: integer
+        required: false
+      - name: professor_id
+        in: query
+        type: integer
+        required: false
+      - name: data_entrega__gte
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Entregas a partir desta data (AAAA-MM-DD)
+      - name: data_entrega__lte
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Entregas até esta data (AAAA-MM-DD)
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
+      - name: stream
+        in: query
+        type: boolean
+        required: false
+        description: Se true (ou Accept application/x-ndjson), exporta todas as linhas em NDJSON via streaming
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
-        description: Lista de atividades
+        description: Página de atividades ({"items": [...], "next_cursor": 42})
+      400:
+        description: Parâmetros de paginação ou filtros inválidos
     """
-    atividades = Atividade.query.all()
-    return jsonify([a.to_dict() for a in atividades])
+    try:
+        consulta = filtrar(Atividade.query, FILTROS_ATIVIDADE)
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    if pediu_ndjson():
+        return resposta_ndjson(consulta, Atividade.id, lambda a: a.to_dict())
+    return listar_paginado(consulta, Atividade.id, lambda a: a.to_dict())
 
 
 # 🔵 Obter uma atividade por ID
 @atividade_bp.route('/<int:id>', methods=['GET'])
+@etag_conteudo
 def obter_atividade(id):
     """
     Obtém uma atividade pelo ID
@@ -170,24 +289,26 @@ def atualizar_atividade(id):
         description: Atividade atualizada com sucesso
       404:
         description: Atividade não encontrada
+      503:
+        description: Gerenciamento indisponível
     """
     data = request.get_json()
     atividade = Atividade.query.get(id)
     if not atividade:
         return jsonify({"erro": "Atividade não encontrada"}), 404
 
+    # Validação via microsserviço (em paralelo com VALIDACAO_PARALELA); falha de
+    # comunicação sobe para o handler de 503, como na criação
+    pares = [(recurso, data[campo]) for recurso, campo in
+             (("turmas", "turma_id"), ("professores", "professor_id")) if campo in data]
+    inexistente = primeiro_inexistente(pares)
+    if inexistente:
+        return jsonify({"erro": mensagem_inexistente(*inexistente)}), 400
+
     try:
-        # Validação via microsserviço
         if 'turma_id' in data:
-            resp_turma = requests.get(f"{URL_TURMAS}{data['turma_id']}")
-            if resp_turma.status_code != 200:
-                return jsonify({"erro": f"Turma com ID {data['turma_id']} não encontrada"}), 400
             atividade.turma_id = data['turma_id']
-
         if 'professor_id' in data:
-            resp_prof = requests.get(f"{URL_PROFESSORES}{data['professor_id']}")
-            if resp_prof.status_code != 200:
-                return jsonify({"erro": f"Professor com ID {data['professor_id']} não encontrado"}), 400
             atividade.professor_id = data['professor_id']
 
         atividade.nome_atividade = data.get('nome_atividade', atividade.nome_atividade)
@@ -0,0 +1,61 @@
+from flask import Blueprint, jsonify, request
+from utils.validacao import RECURSOS, cache_validacao, invalidar_validacao
+
+cache_bp = Blueprint('cache_bp', __name__)
+
+
+# 📊 Estatísticas do cache de validações
+@cache_bp.route('/validacao', methods=['GET'])
+def estatisticas_cache_validacao():
+    """
+    Estatísticas do cache de validações entre microsserviços
+    ---
+    tags:
+      - Cache
+    responses:
+      200:
+        description: Contadores de hits/misses e ocupação do cache
+    """
+    return jsonify(cache_validacao.estatisticas()), 200
+
+
+# 🧹 Invalidação do cache de validações
+@cache_bp.route('/validacao', methods=['DELETE'])
+def invalidar_cache_validacao():
+    """
+    Invalida o cache de validações (um id específico ou tudo)
+    ---
+    tags:
+      - Cache
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: false
+        description: Sem corpo, limpa o cache inteiro
+        schema:
+          type: object
+          properties:
+            recurso:
+              type: string
+              example: "turmas"
+            id:
+              type: integer
+              example: 3
+    responses:
+      200:
+        description: Cache invalidado
+      400:
+        description: Recurso desconhecido ou id ausente
+    """
+    dados = request.get_json(silent=True) or {}
+    if not dados:
+        invalidar_validacao()
+        return jsonify({"mensagem": "Cache de validações limpo"}), 200
+
+    if dados.get("recurso") not in RECURSOS or not isinstance(dados.get("id"), int):
+        return jsonify({"erro": f"Informe 'recurso' ({', '.join(RECURSOS)}) e 'id'"}), 400
+
+    invalidar_validacao(dados["recurso"], dados["id"])
+    return jsonify({"mensagem": "Entrada removida do cache"}), 200
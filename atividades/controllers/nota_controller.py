@@ -1,13 +1,31 @@
 from flask import Blueprint, jsonify, request
+from sqlalchemy import select
 from models import db
 from models.nota import Nota
-import requests  # comunicação síncrona entre microsserviços
+from models.atividade import Atividade
+from utils.paginacao import listar_paginado
+from utils.ndjson import pediu_ndjson, resposta_ndjson
+from utils.validacao import recurso_existe, ids_existentes
+from utils.medias import medias_por_turma, medias_do_aluno
+from utils.filtros import filtrar, usa_filtro
+from utils.condicional import lista_condicional, etag_conteudo
+from models.versoes import registrar_alteracao
 
 nota_bp = Blueprint('nota_bp', __name__)
 
-# Endpoints dos microsserviços
-URL_ALUNOS = "http://gerenciamento:5001/api/alunos/"      # microsserviço de Alunos
-URL_ATIVIDADES = "http://atividades:5002/api/atividades/"  # microsserviço de Atividades
+# Filtros aceitos em GET /api/notas/; turma_id vem da atividade (JOIN só quando usado)
+FILTROS_NOTA = {
+    "aluno_id": (Nota.aluno_id, int),
+    "atividade_id": (Nota.atividade_id, int),
+    "turma_id": (Atividade.turma_id, int),
+    "nota": (Nota.nota, float)
+}
+
+# Máximo de linhas aceitas em um único POST /api/notas/bulk
+LIMITE_NOTAS_LOTE = 10000
+
+# Colunas da listagem: lidas como linhas simples, sem montar objetos Nota
+COLUNAS_NOTA = (Nota.id, Nota.nota, Nota.aluno_id, Nota.atividade_id)
 
 # 🟢 CRIAR UMA NOVA NOTA
 @nota_bp.route("/", methods=["POST"])
@@ -47,16 +65,14 @@ def criar_nota():
     """
     data = request.get_json()
 
+    # valida atividade no próprio banco (a tabela de atividades é deste serviço)
+    if not db.session.get(Atividade, data['atividade_id']):
+        return jsonify({"erro": "Atividade não encontrada"}), 400
+
     # valida aluno via microsserviço
-    resp_aluno = requests.get(f"{URL_ALUNOS}{data['aluno_id']}")
-    if resp_aluno.status_code != 200:
+    if not recurso_existe("alunos", data['aluno_id']):
         return jsonify({"erro": "Aluno não encontrado"}), 400
 
-    # valida atividade via microsserviço
-    resp_atividade = requests.get(f"{URL_ATIVIDADES}{data['atividade_id']}")
-    if resp_atividade.status_code != 200:
-        return jsonify({"erro": "Atividade não encontrada"}), 400
-
     try:
         nova = Nota(
             nota=data["nota"],
@@ -71,31 +87,247 @@ def criar_nota():
         return jsonify({"erro": str(e)}), 400
 
 
+# 📦 CRIAR NOTAS EM LOTE
+@nota_bp.route("/bulk", methods=["POST"])
+def criar_notas_lote():
+    """
+    Cria várias notas de uma vez (ex.: notas de uma turma inteira)
+    Os ids de atividade são validados com uma única consulta local e os de
+    aluno com uma única chamada ao gerenciamento; as linhas válidas são
+    inseridas numa só transação.
+    ---
+    tags:
+      - Notas
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - nota
+              - aluno_id
+              - atividade_id
+            properties:
+              nota:
+                type: number
+                example: 8.5
+              aluno_id:
+                type: integer
+                example: 1
+              atividade_id:
+                type: integer
+                example: 2
+    responses:
+      201:
+        description: Linhas válidas inseridas; erros das demais em "erros"
+        examples:
+          application/json: {
+            "inseridas": 2,
+            "erros": [{"indice": 2, "erro": "Aluno não encontrado"}]
+          }
+      400:
+        description: Nenhuma linha válida ou corpo inválido
+    """
+    linhas = request.get_json(silent=True)
+    if not isinstance(linhas, list) or not linhas:
+        return jsonify({"erro": "Envie uma lista de notas"}), 400
+    if len(linhas) > LIMITE_NOTAS_LOTE:
+        return jsonify({"erro": f"Máximo de {LIMITE_NOTAS_LOTE} notas por lote"}), 400
+
+    erros = []
+    candidatas = []
+    for indice, linha in enumerate(linhas):
+        if not isinstance(linha, dict) or not all(k in linha for k in ("nota", "aluno_id", "atividade_id")):
+            erros.append({"indice": indice, "erro": "Campos obrigatórios: nota, aluno_id, atividade_id"})
+        elif not all(isinstance(linha[k], int) and not isinstance(linha[k], bool) for k in ("aluno_id", "atividade_id")):
+            erros.append({"indice": indice, "erro": "aluno_id e atividade_id devem ser inteiros"})
+        elif not isinstance(linha["nota"], (int, float)) or isinstance(linha["nota"], bool):
+            erros.append({"indice": indice, "erro": "nota deve ser numérica"})
+        else:
+            candidatas.append((indice, linha))
+
+    # uma consulta para todas as atividades e uma chamada para todos os alunos
+    ids_atividades = {linha["atividade_id"] for _, linha in candidatas}
+    atividades_ok = set(db.session.execute(
+        db.select(Atividade.id).where(Atividade.id.in_(ids_atividades))
+    ).scalars()) if ids_atividades else set()
+    alunos_ok = ids_existentes("alunos", [linha["aluno_id"] for _, linha in candidatas]) if candidatas else set()
+
+    validas = []
+    for indice, linha in candidatas:
+        if linha["atividade_id"] not in atividades_ok:
+            erros.append({"indice": indice, "erro": "Atividade não encontrada"})
+        elif linha["aluno_id"] not in alunos_ok:
+            erros.append({"indice": indice, "erro": "Aluno não encontrado"})
+        else:
+            validas.append({
+                "nota": linha["nota"],
+                "aluno_id": linha["aluno_id"],
+                "atividade_id": linha["atividade_id"]
+            })
+    erros.sort(key=lambda e: e["indice"])
+
+    if not validas:
+        return jsonify({"inseridas": 0, "erros": erros}), 400
+
+    try:
+        db.session.bulk_insert_mappings(Nota, validas)
+        registrar_alteracao(db.session.connection(), "notas")  # bulk não dispara o flush do ORM
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"erro": str(e)}), 400
+
+    return jsonify({"inseridas": len(validas), "erros": erros}), 201
+
+
 # 🟡 LISTAR TODAS AS NOTAS
 @nota_bp.route("/", methods=["GET"])
+@lista_condicional("notas", "atividades")
 def listar_notas():
     """
-    Lista todas as notas
+    Lista as notas (paginação por cursor)
+    Filtros opcionais viram cláusulas WHERE no banco; cada campo aceita os
+    sufixos __gt, __gte, __lt, __lte, __in (a,b,c) e __between (a,b).
+    ---
+    tags:
+      - Notas
+    parameters:
+      - name: aluno_id
+        in: query
+        type: integer
+        required: false
+      - name: atividade_id
+        in: query
+        type: integer
+        required: false
+      - name: turma_id
+        in: query
+        type: integer
+        required: false
+        description: Notas das atividades desta turma
+      - name: nota__gte
+        in: query
+        type: number
+        required: false
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
+      - name: stream
+        in: query
+        type: boolean
+        required: false
+        description: Se true (ou Accept application/x-ndjson), exporta todas as linhas em NDJSON via streaming
+    produces:
+      - application/json
+      - application/x-ndjson
+    responses:
+      200:
+        description: Página de notas cadastradas ({"items": [...], "next_cursor": 42})
+      400:
+        description: Parâmetros de paginação ou filtros inválidos
+    """
+    consulta = select(*COLUNAS_NOTA)
+    if usa_filtro("turma_id"):
+        consulta = consulta.join(Atividade, Nota.atividade_id == Atividade.id)
+    try:
+        consulta = filtrar(consulta, FILTROS_NOTA)
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    if pediu_ndjson():
+        return resposta_ndjson(consulta, Nota.id, dict)
+    return listar_paginado(consulta, Nota.id, dict)
+
+
+# 📊 MÉDIAS PONDERADAS POR TURMA
+@nota_bp.route("/medias", methods=["GET"])
+@lista_condicional("notas", "atividades")
+def listar_medias():
+    """
+    Médias ponderadas (pelo peso_porcento das atividades) por aluno e por turma
+    Calculadas no banco com GROUP BY. Sem turma_id, retorna todas as turmas
+    (recálculo da escola inteira em uma única consulta).
     ---
     tags:
       - Notas
+    parameters:
+      - name: turma_id
+        in: query
+        type: integer
+        required: false
+        description: Restringe o cálculo a uma turma
+    responses:
+      200:
+        description: Médias por turma
+        examples:
+          application/json: [
+            {
+              "turma_id": 3,
+              "media_turma": 7.9,
+              "alunos": [
+                {"aluno_id": 1, "turma_id": 3, "media_ponderada": 7.9, "peso_total": 100.0, "total_notas": 4}
+              ]
+            }
+          ]
+      400:
+        description: turma_id inválido
+    """
+    turma_id = request.args.get("turma_id")
+    if turma_id is not None:
+        if not turma_id.isdigit():
+            return jsonify({"erro": "turma_id deve ser um inteiro"}), 400
+        turma_id = int(turma_id)
+    return jsonify(medias_por_turma(turma_id)), 200
+
+
+# 📊 MÉDIAS PONDERADAS DE UM ALUNO
+@nota_bp.route("/medias/aluno/<int:aluno_id>", methods=["GET"])
+@lista_condicional("notas", "atividades")
+def obter_medias_aluno(aluno_id):
+    """
+    Médias ponderadas de um aluno em cada turma
+    ---
+    tags:
+      - Notas
+    parameters:
+      - in: path
+        name: aluno_id
+        required: true
+        type: integer
+        description: ID do aluno
     responses:
       200:
-        description: Lista de notas cadastradas
+        description: Média ponderada do aluno por turma
+        examples:
+          application/json: {
+            "aluno_id": 1,
+            "medias": [{"aluno_id": 1, "turma_id": 3, "media_ponderada": 7.9, "peso_total": 100.0, "total_notas": 4}]
+          }
     """
-    notas = Nota.query.all()
-    return jsonify([
-        {
-            "id": n.id,
-            "nota": n.nota,
-            "aluno_id": n.aluno_id,
-            "atividade_id": n.atividade_id
-        } for n in notas
-    ]), 200
+    return jsonify({"aluno_id": aluno_id, "medias": medias_do_aluno(aluno_id)}), 200
 
 
 # 🔵 OBTER NOTA POR ID
 @nota_bp.route("/<int:id>", methods=["GET"])
+@etag_conteudo
 def obter_nota(id):
     """
     Obtém uma nota pelo ID
@@ -159,22 +391,24 @@ def atualizar_nota(id):
         description: Nota não encontrada
       400:
         description: Erro ao atualizar nota
+      503:
+        description: Gerenciamento indisponível
     """
     data = request.get_json()
     nota = Nota.query.get(id)
     if not nota:
         return jsonify({"erro": "Nota não encontrada"}), 404
 
+    # fora do try: falha de comunicação com o gerenciamento vira 503 no handler do app
+    if "aluno_id" in data and not recurso_existe("alunos", data['aluno_id']):
+        return jsonify({"erro": "Aluno não encontrado"}), 400
+
     try:
         if "aluno_id" in data:
-            resp_aluno = requests.get(f"{URL_ALUNOS}{data['aluno_id']}")
-            if resp_aluno.status_code != 200:
-                return jsonify({"erro": "Aluno não encontrado"}), 400
             nota.aluno_id = data["aluno_id"]
 
         if "atividade_id" in data:
-            resp_atividade = requests.get(f"{URL_ATIVIDADES}{data['atividade_id']}")
-            if resp_atividade.status_code != 200:
+            if not db.session.get(Atividade, data['atividade_id']):
                 return jsonify({"erro": "Atividade não encontrada"}), 400
             nota.atividade_id = data["atividade_id"]
 
@@ -8,9 +8,9 @@ class Atividade(db.Model):
     nome_atividade = db.Column(db.String(50), nullable=False)
     descricao = db.Column(db.String(100), nullable=True)
     peso_porcento = db.Column(db.Float, nullable=False)
-    data_entrega = db.Column(db.Date, nullable=False)
-    turma_id = db.Column(db.Integer, nullable=False)
-    professor_id = db.Column(db.Integer, nullable=False)
+    data_entrega = db.Column(db.Date, nullable=False, index=True)
+    turma_id = db.Column(db.Integer, nullable=False, index=True)
+    professor_id = db.Column(db.Integer, nullable=False, index=True)
 
     def to_dict(self):
         return {
@@ -18,7 +18,7 @@ class Atividade(db.Model):
             "nome_atividade": self.nome_atividade,
             "descricao": self.descricao,
             "peso_porcento": self.peso_porcento,
-            "data_entrega": self.data_entrega.isoformat(),
+            "data_entrega": self.data_entrega,
             "turma_id": self.turma_id,
             "professor_id": self.professor_id
         }
@@ -0,0 +1,19 @@
+from models import db
+from models.versoes import garantir_versoes
+
+
+def criar_indices_faltantes():
+    """
+    create_all() não cria índices novos em tabelas que já existem (bancos
+    criados por versões antigas). Cria os índices declarados nos models que
+    ainda não estão no banco.
+    """
+    for tabela in db.metadata.sorted_tables:
+        for indice in tabela.indexes:
+            indice.create(bind=db.engine, checkfirst=True)
+
+
+def aplicar_migracoes():
+    """Deve ser chamada logo depois do db.create_all(), dentro do app_context."""
+    criar_indices_faltantes()
+    garantir_versoes()
@@ -5,5 +5,5 @@ class Nota(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     nota = db.Column(db.Float, nullable=False)
-    aluno_id = db.Column(db.Integer, nullable=False)
-    atividade_id = db.Column(db.Integer, db.ForeignKey('atividades.id'), nullable=False)
+    aluno_id = db.Column(db.Integer, nullable=False, index=True)
+    atividade_id = db.Column(db.Integer, db.ForeignKey('atividades.id'), nullable=False, index=True)
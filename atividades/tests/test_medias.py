@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+from models import db
+from models.atividade import Atividade
+from models.nota import Nota
+
+
+@pytest.fixture
+def notas(app):
+    """
+    Turma 10: pesos 30 e 70, a média ponderada difere da simples.
+    Turma 20: uma atividade de peso 0; o aluno 3 só tem nota nela (soma de pesos 0).
+    """
+    with app.app_context():
+        atividades = {}
+        for nome, turma_id, peso in [('A', 10, 30), ('B', 10, 70), ('C', 20, 0), ('D', 20, 50)]:
+            atividades[nome] = Atividade(nome_atividade=nome, peso_porcento=peso, data_entrega=date(2025, 11, 20),
+                                         turma_id=turma_id, professor_id=1)
+        db.session.add_all(atividades.values())
+        db.session.flush()
+        for aluno_id, nome, nota in [(1, 'A', 10), (1, 'B', 5), (2, 'A', 4), (2, 'B', 9),
+                                     (3, 'C', 8), (4, 'C', 2), (4, 'D', 9)]:
+            db.session.add(Nota(nota=nota, aluno_id=aluno_id, atividade_id=atividades[nome].id))
+        db.session.commit()
+
+
+TURMA_10 = {
+    "turma_id": 10,
+    "media_turma": 7.0,
+    "alunos": [
+        {"aluno_id": 1, "turma_id": 10, "media_ponderada": 6.5, "peso_total": 100.0, "total_notas": 2},
+        {"aluno_id": 2, "turma_id": 10, "media_ponderada": 7.5, "peso_total": 100.0, "total_notas": 2},
+    ],
+}
+TURMA_20 = {
+    "turma_id": 20,
+    "media_turma": 9.0,  # o aluno sem peso (None) fica fora da média da turma
+    "alunos": [
+        {"aluno_id": 3, "turma_id": 20, "media_ponderada": None, "peso_total": 0.0, "total_notas": 1},
+        {"aluno_id": 4, "turma_id": 20, "media_ponderada": 9.0, "peso_total": 50.0, "total_notas": 2},
+    ],
+}
+
+
+def test_medias_ponderadas_de_todas_as_turmas(cliente, notas):
+    resposta = cliente.get('/api/notas/medias')
+    assert resposta.status_code == 200
+    assert resposta.get_json() == [TURMA_10, TURMA_20]
+
+
+def test_medias_filtradas_por_turma(cliente, notas):
+    assert cliente.get('/api/notas/medias?turma_id=20').get_json() == [TURMA_20]
+    assert cliente.get('/api/notas/medias?turma_id=99').get_json() == []
+
+
+@pytest.mark.parametrize('turma_id', ['abc', '-1', '1.5'])
+def test_turma_id_invalido(cliente, turma_id):
+    resposta = cliente.get(f'/api/notas/medias?turma_id={turma_id}')
+    assert resposta.status_code == 400
+    assert resposta.get_json() == {"erro": "turma_id deve ser um inteiro"}
+
+
+def test_medias_do_aluno(cliente, notas):
+    resposta = cliente.get('/api/notas/medias/aluno/4')
+    assert resposta.status_code == 200
+    assert resposta.get_json() == {"aluno_id": 4, "medias": [TURMA_20["alunos"][1]]}
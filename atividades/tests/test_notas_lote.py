@@ -0,0 +1,99 @@
+from datetime import date
+
+import pytest
+
+from models import db
+from models.atividade import Atividade
+from models.nota import Nota
+
+ALUNOS_EXISTENTES = {1, 2}
+
+
+@pytest.fixture
+def atividades(app):
+    """Duas atividades gravadas direto no banco; devolve os ids."""
+    with app.app_context():
+        novas = [Atividade(nome_atividade=f'Prova {i}', peso_porcento=50, data_entrega=date(2025, 11, 20),
+                           turma_id=1, professor_id=1) for i in range(2)]
+        db.session.add_all(novas)
+        db.session.commit()
+        return [a.id for a in novas]
+
+
+@pytest.fixture
+def chamadas_gerenciamento(monkeypatch):
+    """Troca a consulta ao gerenciamento por ALUNOS_EXISTENTES e registra cada chamada."""
+    chamadas = []
+
+    def ids_existentes(recurso, ids):
+        chamadas.append((recurso, sorted(set(ids))))
+        return ALUNOS_EXISTENTES & set(ids)
+
+    monkeypatch.setattr('controllers.nota_controller.ids_existentes', ids_existentes)
+    return chamadas
+
+
+def test_lote_misto_insere_validas_e_relata_erros_por_indice(app, cliente, atividades, chamadas_gerenciamento,
+                                                             contar_consultas):
+    a1, a2 = atividades
+    lote = [
+        {"nota": 8.5, "aluno_id": 1, "atividade_id": a1},
+        {"nota": 7.0},                                          # faltam campos
+        {"nota": 7.0, "aluno_id": "1", "atividade_id": a1},     # id como texto
+        {"nota": 6.0, "aluno_id": 2, "atividade_id": 999},      # atividade inexistente
+        {"nota": 5.0, "aluno_id": 3, "atividade_id": a2},       # aluno inexistente
+        {"nota": 9.0, "aluno_id": 2, "atividade_id": a2},
+        {"nota": "dez", "aluno_id": 1, "atividade_id": a1},     # nota não numérica
+        "não é objeto",
+    ]
+
+    with contar_consultas() as comandos:
+        resposta = cliente.post('/api/notas/bulk', json=lote)
+
+    assert resposta.status_code == 201
+    corpo = resposta.get_json()
+    assert corpo["inseridas"] == 2
+    assert corpo["erros"] == [
+        {"indice": 1, "erro": "Campos obrigatórios: nota, aluno_id, atividade_id"},
+        {"indice": 2, "erro": "aluno_id e atividade_id devem ser inteiros"},
+        {"indice": 3, "erro": "Atividade não encontrada"},
+        {"indice": 4, "erro": "Aluno não encontrado"},
+        {"indice": 6, "erro": "nota deve ser numérica"},
+        {"indice": 7, "erro": "Campos obrigatórios: nota, aluno_id, atividade_id"},
+    ]
+
+    # uma consulta IN para as atividades, uma chamada ao gerenciamento para os alunos
+    consultas_atividades = [c for c in comandos if c.lstrip().upper().startswith('SELECT') and 'FROM atividades' in c]
+    assert len(consultas_atividades) == 1
+    assert ' IN ' in consultas_atividades[0]
+    assert chamadas_gerenciamento == [("alunos", [1, 2, 3])]
+    assert len([c for c in comandos if c.lstrip().upper().startswith('INSERT INTO NOTAS')]) == 1
+
+    with app.app_context():
+        gravadas = db.session.execute(
+            db.select(Nota.nota, Nota.aluno_id, Nota.atividade_id).order_by(Nota.id)
+        ).all()
+    assert gravadas == [(8.5, 1, a1), (9.0, 2, a2)]
+
+
+def test_lote_sem_linhas_validas_nao_grava_nada(app, cliente, atividades, chamadas_gerenciamento):
+    resposta = cliente.post('/api/notas/bulk', json=[
+        {"nota": 5.0, "aluno_id": 3, "atividade_id": atividades[0]},
+        {"nota": True, "aluno_id": 1, "atividade_id": atividades[0]},
+    ])
+
+    assert resposta.status_code == 400
+    assert resposta.get_json() == {"inseridas": 0, "erros": [
+        {"indice": 0, "erro": "Aluno não encontrado"},
+        {"indice": 1, "erro": "nota deve ser numérica"},
+    ]}
+    with app.app_context():
+        assert db.session.query(Nota).count() == 0
+
+
+@pytest.mark.parametrize('corpo', [[], {"nota": 5}, None])
+def test_lote_exige_lista_nao_vazia(cliente, chamadas_gerenciamento, corpo):
+    resposta = cliente.post('/api/notas/bulk', json=corpo)
+    assert resposta.status_code == 400
+    assert resposta.get_json() == {"erro": "Envie uma lista de notas"}
+    assert chamadas_gerenciamento == []
@@ -0,0 +1,66 @@
+from itertools import groupby
+
+from sqlalchemy import func, select
+
+from models import db
+from models.atividade import Atividade
+from models.nota import Nota
+
+
+def consulta_medias(turma_id=None, aluno_id=None):
+    """
+    Média ponderada por (turma, aluno) calculada no banco:
+    SUM(nota * peso) / SUM(peso) agrupado por turma_id e aluno_id.
+    """
+    soma_pesos = func.sum(Atividade.peso_porcento)
+    consulta = (
+        select(
+            Atividade.turma_id,
+            Nota.aluno_id,
+            (func.sum(Nota.nota * Atividade.peso_porcento) / func.nullif(soma_pesos, 0)).label("media_ponderada"),
+            soma_pesos.label("peso_total"),
+            func.count(Nota.id).label("total_notas")
+        )
+        .join(Atividade, Nota.atividade_id == Atividade.id)
+        .group_by(Atividade.turma_id, Nota.aluno_id)
+        .order_by(Atividade.turma_id, Nota.aluno_id)
+    )
+    if turma_id is not None:
+        consulta = consulta.where(Atividade.turma_id == turma_id)
+    if aluno_id is not None:
+        consulta = consulta.where(Nota.aluno_id == aluno_id)
+    return consulta
+
+
+def _linha_para_dict(linha):
+    return {
+        "aluno_id": linha.aluno_id,
+        "turma_id": linha.turma_id,
+        "media_ponderada": round(linha.media_ponderada, 2) if linha.media_ponderada is not None else None,
+        "peso_total": linha.peso_total,
+        "total_notas": linha.total_notas
+    }
+
+
+def medias_por_turma(turma_id=None):
+    """
+    Médias ponderadas de todos os alunos agrupadas por turma, com a média da turma.
+    Sem turma_id faz o recálculo da escola inteira com a mesma consulta agregada
+    (uma única ida ao banco, agrupada em memória numa só passada).
+    """
+    linhas = db.session.execute(consulta_medias(turma_id=turma_id)).all()
+    turmas = []
+    for tid, grupo in groupby(linhas, key=lambda linha: linha.turma_id):
+        alunos = [_linha_para_dict(linha) for linha in grupo]
+        medias = [a["media_ponderada"] for a in alunos if a["media_ponderada"] is not None]
+        turmas.append({
+            "turma_id": tid,
+            "media_turma": round(sum(medias) / len(medias), 2) if medias else None,
+            "alunos": alunos
+        })
+    return turmas
+
+
+def medias_do_aluno(aluno_id):
+    """Média ponderada do aluno em cada turma em que tem notas."""
+    return [_linha_para_dict(linha) for linha in db.session.execute(consulta_medias(aluno_id=aluno_id))]
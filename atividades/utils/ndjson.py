@@ -0,0 +1,36 @@
+from flask import Response, current_app, request, stream_with_context
+from sqlalchemy import Select
+
+from models import db
+
+MIMETYPE_NDJSON = 'application/x-ndjson'
+
+# Quantidade de linhas buscadas do banco por vez durante a exportação
+TAMANHO_LOTE = 1000
+
+
+def pediu_ndjson():
+    """Indica se o cliente pediu a exportação em NDJSON (Accept: application/x-ndjson ou ?stream=1)."""
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return True
+    return request.accept_mimetypes.best_match(['application/json', MIMETYPE_NDJSON]) == MIMETYPE_NDJSON
+
+
+def resposta_ndjson(consulta, coluna_id, serializar):
+    """
+    Exporta a consulta inteira como NDJSON, um objeto JSON por linha.
+
+    As linhas são lidas em lotes com yield_per e enviadas conforme são
+    serializadas, então o consumo de memória não depende do tamanho da tabela.
+    """
+    def gerar():
+        if isinstance(consulta, Select):  # linhas leves, sem hidratar objetos do ORM
+            linhas = db.session.execute(
+                consulta.order_by(coluna_id).execution_options(yield_per=TAMANHO_LOTE)
+            ).mappings()
+        else:
+            linhas = consulta.order_by(coluna_id).yield_per(TAMANHO_LOTE)
+        for item in linhas:
+            yield current_app.json.dumps(serializar(item)) + "\n"
+
+    return Response(stream_with_context(gerar()), mimetype=MIMETYPE_NDJSON)
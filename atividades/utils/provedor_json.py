@@ -0,0 +1,44 @@
+from datetime import date, time
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # sem orjson o provedor usa o json da biblioteca padrão
+    orjson = None
+
+# Opções equivalentes às do provedor padrão do Flask (chaves ordenadas, chaves não-str)
+OPCOES_ORJSON = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def _padrao(obj):
+    """Tipos que nem o orjson nem o json padrão serializam sozinhos."""
+    if isinstance(obj, (date, time)):  # ISO 8601, como o orjson (o Flask usaria a data HTTP)
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+class ProvedorJSON(DefaultJSONProvider):
+    """
+    Provedor JSON do app (`app.json`): usa o orjson quando instalado e cai no
+    json da biblioteca padrão quando não há orjson ou quando a chamada pede
+    opções que o orjson não tem. Datas saem em ISO 8601 nos dois casos, então
+    os modelos podem devolver date/datetime direto no to_dict.
+    """
+
+    default = staticmethod(_padrao)
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs.keys() - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+        opcoes = OPCOES_ORJSON
+        if kwargs.get('indent'):
+            opcoes |= orjson.OPT_INDENT_2
+        # sem indent a saída do orjson já é compacta, como separators=(',', ':')
+        return orjson.dumps(obj, default=_padrao, option=opcoes).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import threading
+
+import httpx
+import requests
+
+from config import Config
+from utils import servicos
+
+
+class ClienteServicoAsync:
+    """
+    Versão assíncrona do ClienteServico, sobre httpx.AsyncClient.
+
+    O Flask executa cada view async num event loop criado só para aquela
+    requisição, e um AsyncClient fica preso ao loop em que foi usado. Para o
+    pool de conexões ser compartilhado por todas as requisições, o cliente
+    vive num event loop próprio, numa thread de fundo; as views submetem
+    corrotinas a esse loop (submeter) e aguardam o resultado.
+
+    Usa os mesmos timeouts e o mesmo circuit breaker do cliente síncrono, e
+    converte as falhas do httpx nas exceções do requests, para que os
+    tratadores de erro existentes (503 / "Erro ao validar") continuem valendo.
+    """
+
+    def __init__(self, url_base, circuito):
+        self.url_base = url_base.rstrip("/")
+        self.circuito = circuito
+        self._lock = threading.Lock()
+        self._pid = None
+        self._loop = None
+        self._cliente = None
+
+    def _iniciar(self):
+        # a thread do loop não sobrevive ao fork dos workers do gunicorn: recria por processo
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="cliente-async", daemon=True).start()
+            self._loop = loop
+            self._cliente = httpx.AsyncClient(
+                timeout=httpx.Timeout(Config.HTTP_TIMEOUT_LEITURA, connect=Config.HTTP_TIMEOUT_CONEXAO),
+                limits=httpx.Limits(max_connections=Config.HTTP_POOL_TAMANHO,
+                                    max_keepalive_connections=Config.HTTP_POOL_TAMANHO),
+                # httpx só repete falhas de conexão (não 502/503/504 como o Retry do requests)
+                transport=httpx.AsyncHTTPTransport(retries=Config.HTTP_RETRIES)
+            )
+            self._pid = os.getpid()
+
+    def submeter(self, corrotina):
+        """Agenda a corrotina no loop do cliente e devolve um concurrent.futures.Future."""
+        self._iniciar()
+        return asyncio.run_coroutine_threadsafe(corrotina, self._loop)
+
+    async def get(self, caminho, **kwargs):
+        return await self._requisitar("GET", caminho, **kwargs)
+
+    async def post(self, caminho, **kwargs):
+        return await self._requisitar("POST", caminho, **kwargs)
+
+    async def _requisitar(self, metodo, caminho, **kwargs):
+        # deve rodar no loop do cliente (via submeter)
+        if not self.circuito.permitir():
+            raise servicos.CircuitoAberto(f"Serviço {self.url_base} indisponível (circuito aberto)")
+
+        try:
+            resp = await self._cliente.request(metodo, f"{self.url_base}{caminho}", **kwargs)
+        except httpx.TimeoutException as e:
+            self.circuito.registrar_falha()
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            self.circuito.registrar_falha()
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        if resp.status_code >= 500:
+            self.circuito.registrar_falha()
+        else:
+            self.circuito.registrar_sucesso()
+        return resp
+
+
+# Cliente assíncrono compartilhado; divide o circuit breaker com o cliente síncrono
+gerenciamento = ClienteServicoAsync(Config.GERENCIAMENTO_URL, servicos.gerenciamento.circuito)
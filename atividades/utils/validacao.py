@@ -0,0 +1,152 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from config import Config
+from utils.cache import CacheTTL
+from utils import servicos, servicos_async
+
+# Recursos validados em lote no gerenciamento (POST /api/_exists)
+RECURSOS = ("turmas", "professores", "alunos")
+
+cache_validacao = CacheTTL(Config.VALIDACAO_CACHE_TAMANHO, Config.VALIDACAO_CACHE_TTL)
+
+
+def ids_existentes(recurso, ids):
+    """
+    Retorna o conjunto dos `ids` que existem no gerenciamento.
+
+    Os ids já conhecidos saem do cache; os demais são consultados numa única
+    chamada ao POST /api/_exists. Ids encontrados ficam em cache por
+    VALIDACAO_CACHE_TTL segundos e ids inexistentes por VALIDACAO_CACHE_TTL_NEGATIVO.
+    """
+    existentes, pendentes = set(), []
+    for recurso_id in set(ids):
+        encontrado, existe = cache_validacao.obter((recurso, recurso_id))
+        if not encontrado:
+            pendentes.append(recurso_id)
+        elif existe:
+            existentes.add(recurso_id)
+
+    if pendentes:
+        resp = servicos.gerenciamento.post("/api/_exists", json={recurso: pendentes})
+        resp.raise_for_status()
+        encontrados = set(resp.json()[recurso])
+        for recurso_id in pendentes:
+            if recurso_id in encontrados:
+                cache_validacao.definir((recurso, recurso_id), True)
+                existentes.add(recurso_id)
+            else:
+                cache_validacao.definir((recurso, recurso_id), False, ttl=Config.VALIDACAO_CACHE_TTL_NEGATIVO)
+
+    return existentes
+
+
+def recurso_existe(recurso, recurso_id):
+    """Verifica se um único id existe no microsserviço dono do recurso."""
+    try:
+        recurso_id = int(recurso_id)
+    except (TypeError, ValueError):
+        return False
+    return recurso_id in ids_existentes(recurso, [recurso_id])
+
+
+async def ids_existentes_async(recurso, ids):
+    """Igual a ids_existentes, mas pelo cliente assíncrono (roda no loop dele)."""
+    existentes, pendentes = set(), []
+    for recurso_id in set(ids):
+        encontrado, existe = cache_validacao.obter((recurso, recurso_id))
+        if not encontrado:
+            pendentes.append(recurso_id)
+        elif existe:
+            existentes.add(recurso_id)
+
+    if pendentes:
+        resp = await servicos_async.gerenciamento.post("/api/_exists", json={recurso: pendentes})
+        if resp.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{resp.status_code} ao consultar {resp.url}")
+        encontrados = set(resp.json()[recurso])
+        for recurso_id in pendentes:
+            if recurso_id in encontrados:
+                cache_validacao.definir((recurso, recurso_id), True)
+                existentes.add(recurso_id)
+            else:
+                cache_validacao.definir((recurso, recurso_id), False, ttl=Config.VALIDACAO_CACHE_TTL_NEGATIVO)
+
+    return existentes
+
+
+async def recurso_existe_async(recurso, recurso_id):
+    try:
+        recurso_id = int(recurso_id)
+    except (TypeError, ValueError):
+        return False
+    return recurso_id in await ids_existentes_async(recurso, [recurso_id])
+
+
+def validar_em_paralelo(*pares):
+    """
+    Dispara as validações (recurso, id) ao mesmo tempo com asyncio.gather no
+    cliente assíncrono e devolve na hora um Future com a lista de booleanos.
+    Quem chama pode fazer trabalho local enquanto espera e depois usar
+    `await asyncio.wrap_future(futuro)`; a latência total é a da validação
+    mais lenta, não a soma delas.
+    """
+    async def todas():
+        return await asyncio.gather(*(recurso_existe_async(recurso, recurso_id) for recurso, recurso_id in pares))
+    return servicos_async.gerenciamento.submeter(todas())
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _pool_validacao():
+    # criado sob demanda em cada processo (threads não sobrevivem ao fork do gunicorn)
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool_pid != os.getpid():
+            _pool = ThreadPoolExecutor(max_workers=Config.VALIDACAO_PARALELA_THREADS, thread_name_prefix="validacao")
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def primeiro_inexistente(pares):
+    """
+    Valida os pares (recurso, id) e retorna o primeiro que não existe, ou None.
+
+    Sem VALIDACAO_PARALELA as consultas são feitas uma após a outra, na ordem
+    recebida. Com ela, saem todas ao mesmo tempo num pool de threads limitado
+    e a função retorna assim que chega a primeira resposta negativa (as demais
+    terminam em segundo plano e só alimentam o cache). Falhas de comunicação
+    são propagadas.
+    """
+    if not Config.VALIDACAO_PARALELA or len(pares) < 2:
+        for recurso, recurso_id in pares:
+            if not recurso_existe(recurso, recurso_id):
+                return recurso, recurso_id
+        return None
+
+    pool = _pool_validacao()
+    pendentes = {pool.submit(recurso_existe, recurso, recurso_id): (recurso, recurso_id) for recurso, recurso_id in pares}
+    while pendentes:
+        prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+        for futuro in prontos:
+            par = pendentes.pop(futuro)
+            if not futuro.result():
+                for restante in pendentes:
+                    restante.cancel()
+                return par
+    return None
+
+
+def invalidar_validacao(recurso=None, recurso_id=None):
+    """Remove do cache um id específico ou, sem argumentos, limpa o cache inteiro."""
+    if recurso is None:
+        cache_validacao.limpar()
+    else:
+        cache_validacao.invalidar((recurso, int(recurso_id)))
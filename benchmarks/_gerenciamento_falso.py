@@ -0,0 +1,39 @@
+"""
+Gerenciamento falso para os benchmarks de validação remota: responde
+POST /api/_exists depois de um atraso configurável por recurso.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# recurso -> segundos de espera antes de responder
+ATRASOS = {'turmas': 0.2, 'professores': 0.2, 'alunos': 0.2}
+# ids até este valor existem; acima dele são tratados como inexistentes
+MAIOR_ID = 999
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        corpo = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(max((ATRASOS.get(recurso, 0) for recurso in corpo), default=0))
+        resposta = json.dumps({
+            recurso: sorted({i for i in ids if 1 <= i <= MAIOR_ID}) for recurso, ids in corpo.items()
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(resposta)))
+        self.end_headers()
+        self.wfile.write(resposta)
+
+
+def iniciar(porta):
+    """Sobe o servidor em um thread daemon e devolve a URL base."""
+    servidor = ThreadingHTTPServer(('127.0.0.1', porta), _Handler)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{porta}'
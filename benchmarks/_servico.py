@@ -0,0 +1,26 @@
+"""
+Apoio comum aos benchmarks: cada serviço importa os próprios módulos
+(`app`, `models`, `config`...) a partir da sua pasta, então um script
+mede um serviço por processo.
+"""
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICOS = ('gerenciamento', 'atividades', 'reservas')
+
+
+def usar_servico(nome, banco=None):
+    """Põe a pasta do serviço no sys.path e, se dado, aponta o DATABASE_URL para o arquivo `banco`."""
+    if nome not in SERVICOS:
+        raise SystemExit(f"serviço desconhecido: {nome} (use {', '.join(SERVICOS)})")
+    if banco is not None:
+        os.environ['DATABASE_URL'] = f"sqlite:///{banco}"
+    sys.path.insert(0, os.path.join(RAIZ, nome))
+
+
+def rodar_por_servico(script, servicos=SERVICOS):
+    """Roda `script <serviço>` em um processo novo para cada serviço."""
+    for nome in servicos:
+        subprocess.run([sys.executable, script, nome], check=True)
@@ -0,0 +1,122 @@
+"""
+Buscas pelas colunas de filtro com e sem os índices declarados nos modelos.
+
+Cria as tabelas do serviço a partir dos modelos (create_all) em um SQLite
+temporário, insere N linhas aleatórias e mede o tempo médio de cada busca
+antes e depois de criar os índices.
+
+    python benchmarks/indices.py [gerenciamento|atividades|reservas] [--linhas N]
+"""
+import argparse
+import importlib
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from _servico import rodar_por_servico, usar_servico
+
+
+def _data():
+    return f"2025-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"
+
+
+MODELOS = {
+    'gerenciamento': ('models.professor', 'models.turma', 'models.aluno'),
+    'atividades': ('models.atividade', 'models.nota'),
+    'reservas': ('models.serie_reserva', 'models.reserva'),
+}
+
+# tabela -> (gerador de linha, [(descrição, SQL, gerador de parâmetros)])
+CASOS = {
+    'gerenciamento': {
+        'turmas': (
+            lambda i: dict(descricao=f"T{i}", professor_id=random.randint(1, 500), ativo=True),
+            [("turmas.professor_id", "SELECT * FROM turmas WHERE professor_id = ?", lambda: (random.randint(1, 500),))],
+        ),
+        'alunos': (
+            lambda i: dict(nome=f"A{i}", idade=15, turma_id=random.randint(1, 3000)),
+            [("alunos.turma_id", "SELECT * FROM alunos WHERE turma_id = ?", lambda: (random.randint(1, 3000),))],
+        ),
+    },
+    'atividades': {
+        'atividades': (
+            lambda i: dict(nome_atividade=f"P{i}", peso_porcento=10.0, data_entrega=_data(),
+                           turma_id=random.randint(1, 2000), professor_id=random.randint(1, 500)),
+            [("atividades.turma_id", "SELECT * FROM atividades WHERE turma_id = ?", lambda: (random.randint(1, 2000),)),
+             ("atividades.professor_id", "SELECT * FROM atividades WHERE professor_id = ?", lambda: (random.randint(1, 500),)),
+             ("atividades.data_entrega (faixa)", "SELECT * FROM atividades WHERE data_entrega BETWEEN ? AND ?",
+              lambda: ("2025-03-01", "2025-03-02"))],
+        ),
+        'notas': (
+            lambda i: dict(nota=random.random() * 10, aluno_id=random.randint(1, 20000), atividade_id=random.randint(1, 5000)),
+            [("notas.aluno_id", "SELECT * FROM notas WHERE aluno_id = ?", lambda: (random.randint(1, 20000),)),
+             ("notas.atividade_id", "SELECT * FROM notas WHERE atividade_id = ?", lambda: (random.randint(1, 5000),))],
+        ),
+    },
+    'reservas': {
+        'reservas': (
+            lambda i: dict(num_sala=str(random.randint(100, 160)), lab=False, data=_data(), turma_id=random.randint(1, 3000)),
+            [("reservas.turma_id", "SELECT * FROM reservas WHERE turma_id = ?", lambda: (random.randint(1, 3000),)),
+             ("reservas.data", "SELECT * FROM reservas WHERE data = ?", lambda: (_data(),))],
+        ),
+    },
+}
+
+
+def medir(conexao, sql, parametros, repeticoes):
+    """Tempo médio por busca, em microssegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        conexao.execute(sql, parametros()).fetchall()
+    return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('servico', nargs='?')
+    parser.add_argument('--linhas', type=int, default=100_000)
+    args = parser.parse_args()
+    if args.servico is None:
+        rodar_por_servico(__file__)
+        return
+
+    usar_servico(args.servico)
+    from sqlalchemy import create_engine
+    from models import db
+    for modulo in MODELOS[args.servico]:
+        importlib.import_module(modulo)
+
+    random.seed(1)
+    banco = os.path.join(tempfile.mkdtemp(), 'indices.db')
+    db.metadata.create_all(create_engine(f"sqlite:///{banco}"))
+    conexao = sqlite3.connect(banco)
+
+    print(f"== {args.servico}: {args.linhas} linhas por tabela, média por busca")
+    for nome_tabela, (linha, buscas) in CASOS[args.servico].items():
+        tabela = db.metadata.tables[nome_tabela]
+        colunas = list(linha(0))
+        conexao.executemany(
+            f"INSERT INTO {nome_tabela} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})",
+            ([*linha(i).values()] for i in range(args.linhas)),
+        )
+        for indice in tabela.indexes:
+            conexao.execute(f"DROP INDEX IF EXISTS {indice.name}")
+        conexao.commit()
+        sem_indice = [medir(conexao, sql, parametros, 200) for _, sql, parametros in buscas]
+
+        for indice in tabela.indexes:
+            colunas_indice = ', '.join(coluna.name for coluna in indice.columns)
+            conexao.execute(f"CREATE INDEX {indice.name} ON {nome_tabela} ({colunas_indice})")
+        conexao.execute("ANALYZE")
+        com_indice = [medir(conexao, sql, parametros, 2000) for _, sql, parametros in buscas]
+
+        for (descricao, _, _), antes, depois in zip(buscas, sem_indice, com_indice):
+            print(f"  {descricao:32s} {antes:9.0f} us -> {depois:7.1f} us  ({antes / depois:.0f}x)")
+    conexao.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
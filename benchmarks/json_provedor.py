@@ -0,0 +1,91 @@
+"""
+Serialização de listagens com o provedor JSON padrão do Flask e com o
+ProvedorJSON (utils/provedor_json.py), com e sem orjson.
+
+O caminho antigo é o provedor padrão com as datas já convertidas por
+isoformat() no to_dict(); o ProvedorJSON recebe os objetos date direto.
+As três saídas são conferidas como o mesmo JSON antes da medição.
+
+    python benchmarks/json_provedor.py [--linhas 100000] [--repeticoes 3]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date
+
+from _servico import usar_servico
+
+usar_servico('gerenciamento')
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+import utils.provedor_json as provedor_json  # noqa: E402
+
+
+def _dia(i):
+    return date(2025, 1 + i % 12, 1 + i % 28)
+
+
+# formato de cada item das listagens, como sai do to_dict() atual
+LINHAS = {
+    'Atividade': lambda i: {"id": i, "nome_atividade": f"Prova {i}", "descricao": "Avaliação bimestral",
+                            "peso_porcento": 25.0, "data_entrega": _dia(i), "turma_id": i % 50, "professor_id": i % 20},
+    'Reserva': lambda i: {"id": i, "num_sala": f"LAB{i % 9}", "lab": True, "data": _dia(i), "hora_inicio": "08:00",
+                          "hora_fim": "10:00", "turma_id": i % 50, "serie_id": None},
+    'Aluno': lambda i: {"id": i, "nome": f"Aluno {i}", "idade": 15, "data_nascimento": _dia(i), "turma_id": i % 50,
+                        "media_final": 7.25},
+}
+
+
+def com_isoformat(itens):
+    """Como o to_dict() antigo entregava os itens: datas já em texto."""
+    return [{chave: valor.isoformat() if isinstance(valor, date) else valor for chave, valor in item.items()}
+            for item in itens]
+
+
+def medir(funcao, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--linhas', type=int, default=100_000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+    if provedor_json.orjson is None:
+        raise SystemExit("orjson não está instalado")
+
+    app = Flask(__name__)
+    padrao = DefaultJSONProvider(app)
+    novo = provedor_json.ProvedorJSON(app)
+    orjson = provedor_json.orjson
+
+    def sem_orjson(itens):
+        provedor_json.orjson = None
+        try:
+            return novo.dumps({"items": itens})
+        finally:
+            provedor_json.orjson = orjson
+
+    print(f"{args.linhas} itens em {{\"items\": [...]}}, saída compacta, melhor de {args.repeticoes}")
+    for nome, linha in LINHAS.items():
+        itens = [linha(i) for i in range(args.linhas)]
+        saidas = (padrao.dumps({"items": com_isoformat(itens)}), sem_orjson(itens), novo.dumps({"items": itens}))
+        assert all(json.loads(saida) == json.loads(saidas[0]) for saida in saidas[1:])
+
+        antigo = medir(lambda: padrao.dumps({"items": com_isoformat(itens)}), args.repeticoes)
+        stdlib = medir(lambda: sem_orjson(itens), args.repeticoes)
+        rapido = medir(lambda: novo.dumps({"items": itens}), args.repeticoes)
+        print(f"  {nome:10s} padrão+isoformat {antigo * 1000:5.0f} ms | ProvedorJSON sem orjson {stdlib * 1000:5.0f} ms"
+              f" | com orjson {rapido * 1000:4.0f} ms ({antigo / rapido:.1f}x)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Listagem completa (?all=true) pelo ORM e pelo select() só das colunas da
+resposta: notas (atividades), reservas e alunos (gerenciamento).
+
+A rota atual é comparada com uma rota auxiliar que reproduz o caminho
+anterior (Model.query + serializador sobre as instâncias), registrada só
+neste processo. As duas respostas são conferidas byte a byte; o tempo é
+o melhor de algumas execuções e a memória é o pico medido pelo tracemalloc.
+
+    python benchmarks/projecao.py [gerenciamento|atividades|reservas] [--linhas 100000]
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, time as hora
+
+from _servico import SERVICOS, rodar_por_servico, usar_servico
+
+
+def preparar_atividades(db, linhas):
+    """Popula notas e devolve (rota atual, consulta ORM, coluna id, serializador antigo)."""
+    from sqlalchemy import insert
+    from models.atividade import Atividade
+    from models.nota import Nota
+
+    db.session.execute(insert(Atividade), [
+        dict(nome_atividade='Prova', peso_porcento=10, data_entrega=date(2025, 1, 1), turma_id=i % 20, professor_id=1)
+        for i in range(200)
+    ])
+    db.session.execute(insert(Nota), [
+        dict(nota=i % 10, aluno_id=i % 3000, atividade_id=1 + i % 200) for i in range(linhas)
+    ])
+    return '/api/notas/', lambda: Nota.query, Nota.id, lambda n: {
+        "id": n.id, "nota": n.nota, "aluno_id": n.aluno_id, "atividade_id": n.atividade_id
+    }
+
+
+def preparar_reservas(db, linhas):
+    from sqlalchemy import insert
+    from models.reserva import Reserva
+
+    db.session.execute(insert(Reserva), [
+        dict(num_sala=f'S{i % 40}', lab=bool(i % 2), data=date(2025, 1 + i % 12, 1 + i % 28),
+             hora_inicio=hora(8 + i % 8), hora_fim=hora(9 + i % 8), turma_id=i % 50)
+        for i in range(linhas)
+    ])
+    return '/api/reservas/', lambda: Reserva.query, Reserva.id, lambda r: r.to_dict()
+
+
+def preparar_gerenciamento(db, linhas):
+    from sqlalchemy import insert
+    from models.aluno import Aluno
+    from models.professor import Professor
+    from models.turma import Turma
+
+    db.session.add(Professor(nome='Professor', idade=40, materia='Matemática'))
+    db.session.flush()
+    db.session.execute(insert(Turma), [dict(descricao=f'Turma {i}', professor_id=1, ativo=True) for i in range(50)])
+    db.session.execute(insert(Aluno), [
+        dict(nome=f'Aluno {i}', idade=15, turma_id=(1 + i % 50) if i % 7 else None, data_nascimento=date(2010, 1, 1),
+             nota_primeiro_semestre=7.0, media_final=7.0)
+        for i in range(linhas)
+    ])
+    return '/api/alunos', lambda: Aluno.query, Aluno.id, lambda a: {
+        'id': a.id, 'nome': a.nome, 'idade': a.idade, 'data_nascimento': a.data_nascimento,
+        'nota_primeiro_semestre': a.nota_primeiro_semestre, 'nota_segundo_semestre': a.nota_segundo_semestre,
+        'media_final': a.media_final, 'turma_id': a.turma_id, 'turma': a.turma.descricao if a.turma else None
+    }
+
+
+PREPARAR = {
+    'atividades': preparar_atividades,
+    'reservas': preparar_reservas,
+    'gerenciamento': preparar_gerenciamento,
+}
+
+
+def medir(cliente, url, repeticoes):
+    """(melhor tempo em s, pico de memória em bytes, corpo da resposta)."""
+    cliente.get(url)  # aquecimento
+    tracemalloc.start()
+    resposta = cliente.get(url)
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        cliente.get(url)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, pico, resposta.data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('servico', nargs='?', choices=SERVICOS)
+    parser.add_argument('--linhas', type=int, default=100_000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+    if args.servico is None:
+        rodar_por_servico(__file__)
+        return
+
+    usar_servico(args.servico, os.path.join(tempfile.mkdtemp(), 'projecao.db'))
+    from app import create_app
+    from models import db
+    from utils.paginacao import listar_paginado
+
+    app = create_app()
+    with app.app_context():
+        rota, consulta_orm, coluna_id, serializar = PREPARAR[args.servico](db, args.linhas)
+        db.session.commit()
+    app.add_url_rule('/_orm', 'listagem_orm', lambda: listar_paginado(consulta_orm(), coluna_id, serializar))
+    cliente = app.test_client()
+
+    resultados = {}
+    for nome, url in (('ORM', '/_orm?all=true'), ('select', f'{rota}?all=true')):
+        resultados[nome] = medir(cliente, url, args.repeticoes)
+    corpos = {hashlib.md5(corpo).hexdigest() for _, _, corpo in resultados.values()}
+    if len(corpos) != 1:
+        raise SystemExit(f"{args.servico}: respostas diferentes entre ORM e select")
+
+    print(f"== GET {rota}?all=true ({args.servico}), {args.linhas} linhas, respostas idênticas")
+    for nome, (tempo, pico, _) in resultados.items():
+        print(f"  {nome:7s} {tempo * 1000:6.0f} ms  {args.linhas / tempo / 1000:4.0f}k linhas/s  pico {pico / 2 ** 20:6.1f} MiB")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
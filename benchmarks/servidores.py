@@ -0,0 +1,151 @@
+"""
+Vazão e latência do gerenciamento no servidor de desenvolvimento do Flask
+e no gunicorn (gunicorn.conf.py, workers gthread).
+
+Monta um banco SQLite temporário com turmas e alunos, sobe cada servidor
+em um processo separado e dispara clientes HTTP keep-alive contra as
+rotas escolhidas. O cache de respostas é desligado (TTL 0) para medir o
+servidor e não o cache. Erros no gunicorn vêm da reciclagem de workers
+(max_requests), que fecha as conexões keep-alive abertas; para isolar,
+rode com GUNICORN_MAX_REQUESTS=0.
+
+    python benchmarks/servidores.py [--segundos 8] [--clientes 16] [--caminho /api/turmas/7 ...]
+"""
+import argparse
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+from _servico import RAIZ, usar_servico
+
+PASTA = os.path.join(RAIZ, 'gerenciamento')
+PORTA = 5101
+CAMINHOS = ('/api/turmas?limit=50', '/api/turmas/7')
+
+
+def servidores(porta):
+    """(nome, comando) de cada servidor comparado."""
+    flask = [sys.executable, '-m', 'flask', '--app', 'app:create_app', 'run', '--port', str(porta)]
+    gunicorn = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '-b', f'127.0.0.1:{porta}']
+    return [
+        ('flask run --debug', flask + ['--debug']),
+        ('flask run', flask),
+        ('gunicorn 1x8 gthread', gunicorn + ['-w', '1', '--threads', '8']),
+        ('gunicorn 2x4 gthread', gunicorn + ['-w', '2', '--threads', '4']),
+    ]
+
+
+def popular(banco, turmas, alunos):
+    usar_servico('gerenciamento', banco)
+    from sqlalchemy import insert
+    from app import create_app
+    from models import db
+    from models.aluno import Aluno
+    from models.professor import Professor
+    from models.turma import Turma
+
+    app = create_app()
+    with app.app_context():
+        db.session.add(Professor(nome='Professor', idade=40, materia='Matemática'))
+        db.session.flush()
+        db.session.execute(insert(Turma), [dict(descricao=f'Turma {i}', professor_id=1, ativo=True) for i in range(turmas)])
+        db.session.execute(insert(Aluno), [
+            dict(nome=f'Aluno {i}', idade=15, turma_id=1 + i % turmas, data_nascimento=date(2010, 1, 1),
+                 nota_primeiro_semestre=7.0, nota_segundo_semestre=8.0, media_final=7.5)
+            for i in range(alunos)
+        ])
+        db.session.commit()
+        db.engine.dispose()
+
+
+def esperar_porta(porta, limite=30):
+    fim = time.monotonic() + limite
+    while time.monotonic() < fim:
+        try:
+            socket.create_connection(('127.0.0.1', porta), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"servidor não respondeu na porta {porta}")
+
+
+def carga(porta, caminho, clientes, segundos):
+    """Clientes keep-alive em loop; devolve (req/s, p50 ms, p99 ms, erros)."""
+    latencias = []
+    erros = [0]
+    trava = threading.Lock()
+    fim = time.monotonic() + segundos
+
+    def cliente():
+        conexao = http.client.HTTPConnection('127.0.0.1', porta, timeout=10)
+        locais = []
+        falhas = 0
+        while time.monotonic() < fim:
+            inicio = time.perf_counter()
+            try:
+                conexao.request('GET', caminho)
+                resposta = conexao.getresponse()
+                resposta.read()
+                if resposta.status != 200:
+                    falhas += 1
+                if resposta.getheader('Connection', '').lower() == 'close':
+                    conexao.close()
+            except (OSError, http.client.HTTPException):
+                falhas += 1
+                conexao.close()
+            locais.append(time.perf_counter() - inicio)
+        conexao.close()
+        with trava:
+            latencias.extend(locais)
+            erros[0] += falhas
+
+    threads = [threading.Thread(target=cliente) for _ in range(clientes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencias.sort()
+    return (len(latencias) / segundos, latencias[len(latencias) // 2] * 1000,
+            latencias[int(len(latencias) * 0.99)] * 1000, erros[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segundos', type=float, default=8)
+    parser.add_argument('--clientes', type=int, default=16)
+    parser.add_argument('--turmas', type=int, default=200)
+    parser.add_argument('--alunos', type=int, default=2000)
+    parser.add_argument('--caminho', action='append', dest='caminhos')
+    args = parser.parse_args()
+    caminhos = args.caminhos or CAMINHOS
+
+    banco = os.path.join(tempfile.mkdtemp(), 'servidores.db')
+    popular(banco, args.turmas, args.alunos)
+    ambiente = {**os.environ, 'DATABASE_URL': f'sqlite:///{banco}', 'CACHE_RESPOSTAS_TTL': '0',
+                'GUNICORN_LOGLEVEL': 'warning'}
+
+    print(f"{args.turmas} turmas, {args.alunos} alunos, {args.clientes} clientes por {args.segundos:g} s, {os.cpu_count()} CPU(s)")
+    for nome, comando in servidores(PORTA):
+        # sessão própria: o reloader do flask e os workers do gunicorn saem junto com o grupo
+        processo = subprocess.Popen(comando, cwd=PASTA, env=ambiente, start_new_session=True,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            esperar_porta(PORTA)
+            for caminho in caminhos:
+                carga(PORTA, caminho, 2, 1)  # aquecimento
+                vazao, p50, p99, erros = carga(PORTA, caminho, args.clientes, args.segundos)
+                print(f"  {nome:22s} GET {caminho:24s} {vazao:6.0f} req/s  p50 {p50:6.1f} ms  p99 {p99:6.1f} ms  erros {erros}")
+        finally:
+            os.killpg(processo.pid, signal.SIGTERM)
+            processo.wait()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
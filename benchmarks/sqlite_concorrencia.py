@@ -0,0 +1,107 @@
+"""
+Escritas e leituras concorrentes no SQLite com e sem o perfil de
+models/sqlite.py (WAL, synchronous=NORMAL, busy_timeout, cache e mmap).
+
+Usa a tabela de reservas em um arquivo temporário: alguns threads gravam
+uma reserva por transação e outros contam reservas de uma turma pelo
+índice. Cada perfil roda por alguns segundos em um banco novo.
+
+    python benchmarks/sqlite_concorrencia.py [--segundos 5] [--escritores 4] [--leitores 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+from _servico import usar_servico
+
+usar_servico('reservas')
+
+from sqlalchemy import create_engine, func, insert, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.pool import QueuePool  # noqa: E402
+
+from config import Config  # noqa: E402
+import models.sqlite  # noqa: E402,F401  listener que aplica os PRAGMAs
+from models import db  # noqa: E402
+from models.reserva import Reserva  # noqa: E402
+import models.serie_reserva  # noqa: E402,F401
+
+# Valores padrão do próprio SQLite; o timeout de 5 s é o padrão do módulo sqlite3
+PADRAO_SQLITE = dict(SQLITE_JOURNAL_MODE='DELETE', SQLITE_SYNCHRONOUS='FULL', SQLITE_BUSY_TIMEOUT=5000,
+                     SQLITE_CACHE_SIZE=-2000, SQLITE_MMAP_SIZE=0)
+PERFIS = {
+    'padrão do SQLite (timeout 5 s)': PADRAO_SQLITE,
+    'padrão do SQLite sem espera': {**PADRAO_SQLITE, 'SQLITE_BUSY_TIMEOUT': 0},
+    'perfil do Config': {},
+}
+LINHAS_INICIAIS = 20_000
+
+
+def rodar(pragmas, segundos, escritores, leitores):
+    originais = {nome: getattr(Config, nome) for nome in pragmas}
+    for nome, valor in pragmas.items():
+        setattr(Config, nome, valor)
+    try:
+        banco = os.path.join(tempfile.mkdtemp(), 'concorrencia.db')
+        engine = create_engine(f"sqlite:///{banco}", poolclass=QueuePool, pool_size=escritores + leitores)
+        db.metadata.create_all(engine)
+        with engine.begin() as conexao:
+            conexao.execute(insert(Reserva), [
+                dict(num_sala='101', data=date(2025, 1, 1), turma_id=i % 500) for i in range(LINHAS_INICIAIS)
+            ])
+
+        fim = time.monotonic() + segundos
+        totais = {'escritas': 0, 'leituras': 0, 'erros': 0}
+        trava = threading.Lock()
+
+        def trabalhar(tipo, indice):
+            feitos = erros = 0
+            while time.monotonic() < fim:
+                try:
+                    if tipo == 'escritas':
+                        with engine.begin() as conexao:
+                            conexao.execute(insert(Reserva).values(num_sala='102', data=date(2025, 2, 2), turma_id=indice))
+                    else:
+                        with engine.connect() as conexao:
+                            conexao.execute(select(func.count()).where(Reserva.turma_id == feitos % 500)).scalar()
+                    feitos += 1
+                except OperationalError:  # "database is locked"
+                    erros += 1
+            with trava:
+                totais[tipo] += feitos
+                totais['erros'] += erros
+
+        threads = [threading.Thread(target=trabalhar, args=('escritas', i)) for i in range(escritores)]
+        threads += [threading.Thread(target=trabalhar, args=('leituras', i)) for i in range(leitores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        engine.dispose()
+        return totais
+    finally:
+        for nome, valor in originais.items():
+            setattr(Config, nome, valor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--segundos', type=float, default=5)
+    parser.add_argument('--escritores', type=int, default=4)
+    parser.add_argument('--leitores', type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{args.escritores} escritores e {args.leitores} leitores por {args.segundos:g} s, "
+          f"{LINHAS_INICIAIS} reservas iniciais")
+    for nome, pragmas in PERFIS.items():
+        totais = rodar(pragmas, args.segundos, args.escritores, args.leitores)
+        print(f"  {nome:32s} escritas/s={totais['escritas'] / args.segundos:7.0f}  "
+              f"leituras/s={totais['leituras'] / args.segundos:7.0f}  'database is locked'={totais['erros']}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
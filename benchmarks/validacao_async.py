@@ -0,0 +1,73 @@
+"""
+Latência do POST síncrono e do POST /async de atividades e reservas com
+um gerenciamento lento.
+
+Sobe um gerenciamento falso que responde /api/_exists depois de um atraso,
+limpa o cache de validação antes de cada requisição e compara a mediana
+das duas rotas pelo test client do Flask, com banco SQLite temporário.
+
+    python benchmarks/validacao_async.py [atividades|reservas] [--atraso 0.2] [--requisicoes 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import _gerenciamento_falso
+from _servico import rodar_por_servico, usar_servico
+
+PORTA = 5399
+
+
+def corpo_atividade(i):
+    return {"nome_atividade": "Prova", "peso_porcento": 10, "data_entrega": "2025-11-20",
+            "turma_id": 1 + i, "professor_id": 2 + i}
+
+
+def corpo_reserva(i, rota):
+    # sala diferente por rota e dia diferente por requisição: nenhuma cai em conflito
+    return {"num_sala": rota.strip('/').replace('/', '-'), "data": f"2025-11-{1 + i:02d}", "turma_id": 1 + i}
+
+
+ROTAS = {
+    'atividades': (('/api/atividades/', '/api/atividades/async'), lambda i, rota: corpo_atividade(i)),
+    'reservas': (('/api/reservas/', '/api/reservas/async'), corpo_reserva),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('servico', nargs='?', choices=tuple(ROTAS))
+    parser.add_argument('--atraso', type=float, default=0.2, help='segundos por consulta ao gerenciamento')
+    parser.add_argument('--requisicoes', type=int, default=10)
+    args = parser.parse_args()
+    if args.servico is None:
+        rodar_por_servico(__file__, ROTAS)
+        return
+
+    _gerenciamento_falso.ATRASOS.update(turmas=args.atraso, professores=args.atraso)
+    os.environ['GERENCIAMENTO_URL'] = _gerenciamento_falso.iniciar(PORTA)
+    usar_servico(args.servico, os.path.join(tempfile.mkdtemp(), 'validacao.db'))
+    from app import create_app
+    from utils.validacao import cache_validacao
+
+    cliente = create_app().test_client()
+    rotas, corpo = ROTAS[args.servico]
+    print(f"== {args.servico}: gerenciamento com {args.atraso * 1000:.0f} ms por consulta, "
+          f"cache limpo, mediana de {args.requisicoes}")
+    for rota in rotas:
+        tempos = []
+        for i in range(args.requisicoes):
+            cache_validacao.limpar()
+            inicio = time.perf_counter()
+            resposta = cliente.post(rota, json=corpo(i, rota))
+            tempos.append(time.perf_counter() - inicio)
+            if resposta.status_code != 201:
+                raise SystemExit(f"{rota}: {resposta.status_code} {resposta.get_json()}")
+        tempos.sort()
+        print(f"  POST {rota:24s} {tempos[len(tempos) // 2] * 1000:5.0f} ms")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
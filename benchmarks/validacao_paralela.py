@@ -0,0 +1,77 @@
+"""
+Validação de turma e professor nas rotas síncronas de atividades, em
+sequência e com VALIDACAO_PARALELA.
+
+Sobe um gerenciamento falso com atraso por recurso, limpa o cache de
+validação antes de cada requisição e mede a mediana de POST e PUT com as
+duas validações lentas, e de um POST com professor inexistente em que a
+turma é a consulta mais lenta (a paralela retorna na primeira negativa).
+
+    python benchmarks/validacao_paralela.py [--requisicoes 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import _gerenciamento_falso
+from _servico import usar_servico
+
+PORTA = 5398
+PROFESSOR_INEXISTENTE = _gerenciamento_falso.MAIOR_ID + 1
+
+
+def corpo(turma_id, professor_id):
+    return {"nome_atividade": "Prova", "peso_porcento": 10, "data_entrega": "2025-11-20",
+            "turma_id": turma_id, "professor_id": professor_id}
+
+
+# (descrição, atrasos turma/professor, método, gerador do corpo, status esperado)
+CASOS = [
+    ("POST, turma 200 ms + professor 200 ms", (0.2, 0.2), 'post', lambda i: corpo(1 + i, 2 + i), 201),
+    ("PUT,  turma 200 ms + professor 200 ms", (0.2, 0.2), 'put', lambda i: {"turma_id": 1 + i, "professor_id": 2 + i}, 200),
+    ("POST, professor inexistente (turma 500 ms, professor 100 ms)", (0.5, 0.1), 'post',
+     lambda i: corpo(1 + i, PROFESSOR_INEXISTENTE), 400),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requisicoes', type=int, default=10)
+    args = parser.parse_args()
+
+    os.environ['GERENCIAMENTO_URL'] = _gerenciamento_falso.iniciar(PORTA)
+    usar_servico('atividades', os.path.join(tempfile.mkdtemp(), 'validacao.db'))
+    from app import create_app
+    from config import Config
+    from utils.validacao import cache_validacao
+
+    cliente = create_app().test_client()
+    assert cliente.post('/api/atividades/', json=corpo(1, 1)).status_code == 201  # alvo dos PUTs
+
+    print(f"cache limpo por requisição, mediana de {args.requisicoes}")
+    print(f"  {'':62s} {'sequencial':>10s} {'paralela':>9s}")
+    for descricao, (atraso_turma, atraso_professor), metodo, gerar, esperado in CASOS:
+        _gerenciamento_falso.ATRASOS.update(turmas=atraso_turma, professores=atraso_professor)
+        medianas = []
+        for paralela in (False, True):
+            Config.VALIDACAO_PARALELA = paralela
+            tempos = []
+            for i in range(args.requisicoes):
+                cache_validacao.limpar()
+                inicio = time.perf_counter()
+                if metodo == 'put':
+                    resposta = cliente.put('/api/atividades/1', json=gerar(i))
+                else:
+                    resposta = cliente.post('/api/atividades/', json=gerar(i))
+                tempos.append(time.perf_counter() - inicio)
+                if resposta.status_code != esperado:
+                    raise SystemExit(f"{descricao}: {resposta.status_code} {resposta.get_json()}")
+            tempos.sort()
+            medianas.append(tempos[len(tempos) // 2] * 1000)
+        print(f"  {descricao:62s} {medianas[0]:7.0f} ms {medianas[1]:6.0f} ms")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
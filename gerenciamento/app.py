@@ -1,109 +1,132 @@
 import os
-from flask import Flask, request, jsonify
-from flask.json.provider import DefaultJSONProvider
+from flask import Blueprint, Flask, request, jsonify
 from flasgger import Swagger
-from datetime import datetime, date
+from sqlalchemy import select
+from datetime import datetime
 from models import db
 from config import Config
 from models.aluno import Aluno
 from models.turma import Turma
 from models.professor import Professor
-
-class CustomJSONProvider(DefaultJSONProvider):
-    def default(self, obj):
-        if isinstance(obj, date):
-            return obj.strftime('%Y-%m-%d')
-        return super().default(obj)
-
-app = Flask(__name__)
-app.config.from_object(Config)
-app.json = CustomJSONProvider(app)
-
-Swagger(app)
-
-db.init_app(app)
-
-
-with app.app_context():
-    db.create_all()
-
-
-
-
-@app.route('/api/alunos', methods=['GET'])
+from models.migracoes import aplicar_migracoes
+import models.sqlite  # registra os pragmas do SQLite em cada conexão
+from utils.paginacao import listar_paginado
+from utils.campos import campos_e_expansoes, anexar_lista
+from utils.condicional import lista_condicional, etag_conteudo
+from utils.cache_respostas import em_cache
+from utils.provedor_json import ProvedorJSON
+
+# Rotas da API; registradas no app por create_app()
+api_bp = Blueprint('api', __name__)
+
+# Colunas que podem ser pedidas em ?fields= nas listagens
+COLUNAS_PROFESSOR = {
+    'id': Professor.id,
+    'nome': Professor.nome,
+    'idade': Professor.idade,
+    'materia': Professor.materia,
+    'observacao': Professor.observacao
+}
+COLUNAS_TURMA = {
+    'id': Turma.id,
+    'descricao': Turma.descricao,
+    'professor_id': Turma.professor_id,
+    'ativo': Turma.ativo,
+    'media_turma': Turma.media_turma,
+    'total_avaliados': Turma.total_avaliados,
+    'total_aprovados': Turma.total_aprovados
+}
+
+
+@api_bp.route('/api/alunos', methods=['GET'])
+@lista_condicional('alunos', 'turmas')
 def api_list_alunos():
     """
-    Lista todos os alunos.
+    Lista os alunos (paginação por cursor).
     ---
     tags:
       - Alunos
-    description: Retorna todos os alunos cadastrados em JSON
+    description: Retorna os alunos cadastrados em páginas ordenadas por id
     produces:
       - application/json
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
     responses:
       200:
-        description: Lista de alunos
+        description: Página de alunos
         schema:
-          type: array
-          items:
-            type: object
-            properties:
-              id:
-                type: integer
-                example: 1
-              nome:
-                type: string
-                example: João da Silva
-              idade:
-                type: integer
-                example: 15
-              data_nascimento:
-                type: string
-                format: date
-                example: 2010-05-12
-              nota_primeiro_semestre:
-                type: number
-                example: 7.5
-              nota_segundo_semestre:
-                type: number
-                example: 8.0
-              media_final:
-                type: number
-                example: 7.75
-              turma_id:
-                type: integer
-                example: 2
-              turma:
-                type: string
-                example: Turma A
+          type: object
+          properties:
+            next_cursor:
+              type: integer
+              example: 42
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  id:
+                    type: integer
+                    example: 1
+                  nome:
+                    type: string
+                    example: João da Silva
+                  idade:
+                    type: integer
+                    example: 15
+                  data_nascimento:
+                    type: string
+                    format: date
+                    example: 2010-05-12
+                  nota_primeiro_semestre:
+                    type: number
+                    example: 7.5
+                  nota_segundo_semestre:
+                    type: number
+                    example: 8.0
+                  media_final:
+                    type: number
+                    example: 7.75
+                    description: Calculada pelo servidor (média das notas semestrais)
+                  turma_id:
+                    type: integer
+                    example: 2
+                  turma:
+                    type: string
+                    example: Turma A
     """
-    alunos = Aluno.query.all()
-    resultado = [
-        {
-            'id': a.id,
-            'nome': a.nome,
-            'idade': a.idade,
-            'data_nascimento': a.data_nascimento,
-            'nota_primeiro_semestre': a.nota_primeiro_semestre,
-            'nota_segundo_semestre': a.nota_segundo_semestre,
-            'media_final': a.media_final,
-            'turma_id': a.turma_id,
-            'turma': a.turma.descricao if a.turma else None
-        }
-        for a in alunos
-    ]
-    return jsonify(resultado), 200
+    # só as colunas da resposta, com a descrição da turma via LEFT JOIN: linhas simples, sem objetos do ORM
+    consulta = select(
+        Aluno.id, Aluno.nome, Aluno.idade, Aluno.data_nascimento,
+        Aluno.nota_primeiro_semestre, Aluno.nota_segundo_semestre, Aluno.media_final,
+        Aluno.turma_id, Turma.descricao.label('turma')
+    ).outerjoin(Turma, Aluno.turma_id == Turma.id)
+    return listar_paginado(consulta, Aluno.id, dict)
 
 
 # POST Aluno
-@app.route('/api/alunos', methods=['POST'])
+@api_bp.route('/api/alunos', methods=['POST'])
 def api_create_aluno():
     """
     Cria um novo aluno.
     ---
     tags:
       - Alunos
-    description: Cria um aluno com JSON
+    description: Cria um aluno com JSON (media_final é calculada pelo servidor a partir das notas semestrais)
     consumes:
       - application/json
     produces:
@@ -135,9 +158,6 @@ def api_create_aluno():
             nota_segundo_semestre:
               type: number
               example: 8.0
-            media_final:
-              type: number
-              example: 7.75
             turma_id:
               type: integer
               example: 2
@@ -181,8 +201,7 @@ def api_create_aluno():
         turma_id=dados['turma_id'],
         data_nascimento=data_nasc,
         nota_primeiro_semestre=dados.get('nota_primeiro_semestre'),
-        nota_segundo_semestre=dados.get('nota_segundo_semestre'),
-        media_final=dados.get('media_final')
+        nota_segundo_semestre=dados.get('nota_segundo_semestre')
     )
     db.session.add(novo_aluno)
     db.session.commit()
@@ -194,14 +213,14 @@ def api_create_aluno():
     }), 201
 
 
-@app.route('/api/alunos/<int:id>', methods=['PUT'])
+@api_bp.route('/api/alunos/<int:id>', methods=['PUT'])
 def api_update_aluno(id):
     """
     Atualiza um aluno existente pelo ID.
     ---
     tags:
       - Alunos
-    description: Atualiza os dados do aluno
+    description: Atualiza os dados do aluno (media_final é recalculada pelo servidor)
     consumes:
       - application/json
     produces:
@@ -234,9 +253,6 @@ def api_update_aluno(id):
             nota_segundo_semestre:
               type: number
               example: 8.0
-            media_final:
-              type: number
-              example: 7.75
             turma_id:
               type: integer
               example: 2
@@ -278,7 +294,6 @@ def api_update_aluno(id):
 
     aluno.nota_primeiro_semestre = dados.get('nota_primeiro_semestre', aluno.nota_primeiro_semestre)
     aluno.nota_segundo_semestre = dados.get('nota_segundo_semestre', aluno.nota_segundo_semestre)
-    aluno.media_final = dados.get('media_final', aluno.media_final)
 
     if 'turma_id' in dados:
         turma = Turma.query.get(dados['turma_id'])
@@ -295,7 +310,7 @@ def api_update_aluno(id):
     }), 200
 
 
-@app.route('/api/alunos/<int:id>', methods=['DELETE'])
+@api_bp.route('/api/alunos/<int:id>', methods=['DELETE'])
 def api_delete_aluno(id):
     """
     Deleta um aluno existente pelo ID.
@@ -336,59 +351,93 @@ def api_delete_aluno(id):
 
     return jsonify({"message": "Aluno deletado com sucesso"}), 200
 
-@app.route('/api/professores', methods=['GET'])
+@api_bp.route('/api/professores', methods=['GET'])
+@lista_condicional('professores', 'turmas')
+@em_cache('professores', 'turmas')
 def api_list_professores():
     """
-    Lista todos os professores.
+    Lista os professores (paginação por cursor).
     ---
     tags:
       - Professores
     produces:
       - application/json
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Colunas retornadas, separadas por vírgula (id, nome, idade, materia, observacao). O id sempre vem
+      - name: expand
+        in: query
+        type: string
+        required: false
+        description: Relacionamentos incluídos (turmas). Sem fields nem expand, retorna todas as colunas e as turmas
     responses:
       200:
-        description: Lista de professores
+        description: Página de professores
         schema:
-          type: array
-          items:
-            type: object
-            properties:
-              id:
-                type: integer
-                example: 1
-              nome:
-                type: string
-                example: João da Silva
-              idade:
-                type: integer
-                example: 40
-              materia:
-                type: string
-                example: Matemática
-              observacao:
-                type: string
-                example: Professor com experiência em ensino médio
-              turmas:
-                type: array
-                items:
-                  type: string
-                  example: Turma A
+          type: object
+          properties:
+            next_cursor:
+              type: integer
+              example: 42
+            items:
+              type: array
+              items:
+                type: object
+                properties:
+                  id:
+                    type: integer
+                    example: 1
+                  nome:
+                    type: string
+                    example: João da Silva
+                  idade:
+                    type: integer
+                    example: 40
+                  materia:
+                    type: string
+                    example: Matemática
+                  observacao:
+                    type: string
+                    example: Professor com experiência em ensino médio
+                  turmas:
+                    type: array
+                    items:
+                      type: string
+                      example: Turma A
     """
-    professores = Professor.query.all()
-    resultado = [
-        {
-            'id': p.id,
-            'nome': p.nome,
-            'idade': p.idade,
-            'materia': p.materia,
-            'observacao': p.observacao,
-            'turmas': [t.descricao for t in p.turmas] if hasattr(p, 'turmas') else []
-        }
-        for p in professores
-    ]
-    return jsonify(resultado), 200
+    try:
+        campos, expandir = campos_e_expansoes(COLUNAS_PROFESSOR, ['turmas'])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # só as colunas pedidas; turmas só são lidas se expandidas (um SELECT ... IN por página)
+    consulta = select(*[COLUNAS_PROFESSOR[c] for c in campos])
 
-@app.route('/api/professores', methods=['POST'])
+    def completar(itens):
+        if 'turmas' in expandir:
+            anexar_lista(itens, 'turmas', Turma.professor_id, Turma.descricao, Turma.id)
+
+    return listar_paginado(consulta, Professor.id, dict, completar)
+
+@api_bp.route('/api/professores', methods=['POST'])
 def api_create_professor():
     """
     Cria um novo professor.
@@ -447,7 +496,9 @@ def api_create_professor():
     return jsonify({'mensagem': 'Professor criado', 'id': novo.id}), 201
 
 
-@app.route('/api/professores/<int:id>', methods=['GET'])
+@api_bp.route('/api/professores/<int:id>', methods=['GET'])
+@etag_conteudo
+@em_cache('professores', 'turmas')
 def api_get_professor(id):
     """
     Retorna os dados de um professor específico.
@@ -481,7 +532,7 @@ def api_get_professor(id):
     return jsonify(resultado), 200
 
 
-@app.route('/api/professores/<int:id>', methods=['PUT'])
+@api_bp.route('/api/professores/<int:id>', methods=['PUT'])
 def api_update_professor(id):
     """
     Atualiza um professor existente.
@@ -534,7 +585,7 @@ def api_update_professor(id):
     db.session.commit()
     return jsonify({'mensagem': 'Professor atualizado.'})
 
-@app.route('/api/professores/<int:id>', methods=['DELETE'])
+@api_bp.route('/api/professores/<int:id>', methods=['DELETE'])
 def api_delete_professor(id):
     """
     Deleta um professor existente.
@@ -562,34 +613,69 @@ def api_delete_professor(id):
     return jsonify({'mensagem': 'Professor deletado.'})
 
 
-@app.route('/api/turmas', methods=['GET'])
+@api_bp.route('/api/turmas', methods=['GET'])
+@lista_condicional('turmas', 'alunos', 'professores')
+@em_cache('turmas', 'alunos', 'professores')
 def api_list_turmas():
     """
-    Lista todas as turmas.
+    Lista as turmas (paginação por cursor).
     ---
     tags:
       - Turmas
     produces:
       - application/json
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Colunas retornadas, separadas por vírgula (id, descricao, professor_id, ativo, media_turma, total_avaliados, total_aprovados). O id sempre vem
+      - name: expand
+        in: query
+        type: string
+        required: false
+        description: Relacionamentos incluídos (alunos, professor). Sem fields nem expand, retorna todas as colunas, o professor e os alunos
     responses:
       200:
-        description: Lista de turmas
+        description: Página de turmas ({"items": [...], "next_cursor": 42})
+      400:
+        description: Parâmetros de paginação inválidos
     """
-    turmas = Turma.query.all()
-    resultado = [
-        {
-            'id': t.id,
-            'descricao': t.descricao,
-            'professor_id': t.professor_id,
-            'professor': t.professor.nome if t.professor else None,
-            'ativo': t.ativo,
-            'alunos': [a.nome for a in t.alunos] if hasattr(t, 'alunos') else []
-        }
-        for t in turmas
-    ]
-    return jsonify(resultado), 200
-
-@app.route('/api/turmas/<int:id>', methods=['GET'])
+    try:
+        campos, expandir = campos_e_expansoes(COLUNAS_TURMA, ['alunos', 'professor'])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # só as colunas pedidas; professor via JOIN e alunos via um SELECT ... IN por página, apenas se expandidos
+    consulta = select(*[COLUNAS_TURMA[c] for c in campos])
+    if 'professor' in expandir:
+        consulta = consulta.add_columns(Professor.nome.label('professor')).outerjoin(
+            Professor, Turma.professor_id == Professor.id)
+
+    def completar(itens):
+        if 'alunos' in expandir:
+            anexar_lista(itens, 'alunos', Aluno.turma_id, Aluno.nome, Aluno.id)
+
+    return listar_paginado(consulta, Turma.id, dict, completar)
+
+@api_bp.route('/api/turmas/<int:id>', methods=['GET'])
+@etag_conteudo
+@em_cache('turmas', 'alunos', 'professores')
 def api_get_turma(id):
     """
     Retorna uma turma específica pelo ID.
@@ -617,10 +703,13 @@ def api_get_turma(id):
         "professor_id": turma.professor_id,
         "professor": turma.professor.nome if turma.professor else None,
         "ativo": turma.ativo,
+        "media_turma": turma.media_turma,
+        "total_avaliados": turma.total_avaliados,
+        "total_aprovados": turma.total_aprovados,
         "alunos": [a.nome for a in turma.alunos] if hasattr(turma, 'alunos') else []
     }), 200
 
-@app.route('/api/turmas', methods=['POST'])
+@api_bp.route('/api/turmas', methods=['POST'])
 def api_create_turma():
     """
     Cria uma nova turma.
@@ -676,7 +765,7 @@ def api_create_turma():
     }), 201
 
 
-@app.route('/api/turmas/<int:id>', methods=['PUT'])
+@api_bp.route('/api/turmas/<int:id>', methods=['PUT'])
 def api_update_turma(id):
     """
     Atualiza uma turma existente pelo ID.
@@ -736,7 +825,7 @@ def api_update_turma(id):
     return jsonify({'mensagem': 'Turma atualizada'}), 200
 
 
-@app.route('/api/turmas/<int:id>', methods=['DELETE'])
+@api_bp.route('/api/turmas/<int:id>', methods=['DELETE'])
 def api_delete_turma(id):
     """
     Remove uma turma existente pelo ID.
@@ -784,5 +873,108 @@ def api_delete_turma(id):
     return jsonify({'mensagem': 'Turma deletada, alunos ficaram sem turma'}), 200
 
 
+# Tabelas que podem ser consultadas no /api/_exists
+MODELOS_EXISTENCIA = {'turmas': Turma, 'professores': Professor, 'alunos': Aluno}
+# Máximo de ids por tabela numa única consulta (fica abaixo do limite de parâmetros do SQLite)
+LIMITE_IDS_EXISTENCIA = 10000
+
+@api_bp.route('/api/_exists', methods=['POST'])
+def api_exists():
+    """
+    Verifica em lote quais ids existem.
+    Usado pelos outros microsserviços para validar referências numa única chamada:
+    uma consulta IN por tabela, sem serializar os registros.
+    ---
+    tags:
+      - Validação
+    consumes:
+      - application/json
+    produces:
+      - application/json
+    parameters:
+      - in: body
+        name: ids
+        required: true
+        schema:
+          type: object
+          properties:
+            turmas:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+            professores:
+              type: array
+              items:
+                type: integer
+              example: [4]
+            alunos:
+              type: array
+              items:
+                type: integer
+              example: [10, 11]
+    responses:
+      200:
+        description: Ids existentes de cada tabela consultada
+        schema:
+          type: object
+          properties:
+            turmas:
+              type: array
+              items:
+                type: integer
+              example: [1, 3]
+      400:
+        description: Corpo inválido
+        schema:
+          type: object
+          properties:
+            error:
+              type: string
+              example: "'turmas' deve ser uma lista de ids inteiros"
+    """
+    dados = request.get_json(silent=True)
+    if not isinstance(dados, dict) or not any(k in dados for k in MODELOS_EXISTENCIA):
+        return jsonify({"error": f"Informe ao menos uma das listas: {', '.join(MODELOS_EXISTENCIA)}"}), 400
+
+    resultado = {}
+    for chave, modelo in MODELOS_EXISTENCIA.items():
+        if chave not in dados:
+            continue
+
+        ids = dados[chave]
+        if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            return jsonify({"error": f"'{chave}' deve ser uma lista de ids inteiros"}), 400
+        ids = set(ids)
+        if len(ids) > LIMITE_IDS_EXISTENCIA:
+            return jsonify({"error": f"Máximo de {LIMITE_IDS_EXISTENCIA} ids por lista"}), 400
+
+        existentes = db.session.execute(select(modelo.id).where(modelo.id.in_(ids))).scalars().all() if ids else []
+        resultado[chave] = sorted(existentes)
+
+    return jsonify(resultado), 200
+
+
+def create_app():
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.json = ProvedorJSON(app)  # orjson quando instalado, datas em ISO 8601
+
+    Swagger(app)
+
+    db.init_app(app)
+    app.register_blueprint(api_bp)
+
+    with app.app_context():
+        db.create_all()
+        aplicar_migracoes()
+        # com preload no gunicorn o app é criado antes do fork: nenhuma conexão
+        # aberta aqui pode ser herdada pelos workers
+        db.engine.dispose()
+
+    return app
+
+
 if __name__ == '__main__':
+    app = create_app()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -1,9 +1,37 @@
 import os
 
 class Config:               
-                            # tipo do banco e a sua localização (arquivo)
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///database.db'
+                            # tipo do banco e a sua localização (arquivo); DATABASE_URL aponta para um banco servidor
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///database.db').replace('postgres://', 'postgresql://', 1)
     #  desabilita o recurso de o SQLAlchemy monitorar e emitir sinais quando um objeto é alterado, o que é a prática recomendada
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Pool de conexões para bancos servidor (PostgreSQL); o SQLite usa o padrão do SQLAlchemy
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))                 # conexões mantidas abertas por processo
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))          # conexões extras em picos
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))        # segundos esperando uma conexão livre
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))        # segundos até reabrir (evita conexões mortas)
+    SQLALCHEMY_ENGINE_OPTIONS = {} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {
+        'pool_size': DB_POOL_SIZE,
+        'max_overflow': DB_MAX_OVERFLOW,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': True
+    }
     # chave secreta e única usada pelo Flask para a segurança da aplicação, assinar os cookies de sessão e proteger formulários
-    SECRET_KEY = os.urandom(24)
\ No newline at end of file
+    SECRET_KEY = os.urandom(24)
+    # média final mínima para o aluno contar como aprovado nas estatísticas da turma
+    MEDIA_APROVACAO = float(os.getenv('MEDIA_APROVACAO', '6'))
+
+    # Perfil do SQLite aplicado em cada conexão (models/sqlite.py)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")               # leitores não bloqueiam o escritor
+    SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))         # ms esperando o lock antes de "database is locked"
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")              # seguro com WAL, sem fsync a cada commit
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-20000"))           # negativo = KiB (~20 MB por conexão)
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))  # bytes lidos via mmap
+
+    # Cache de respostas dos GETs mais acessados (turma/professor e listagens)
+    CACHE_RESPOSTAS_BACKEND = os.getenv('CACHE_RESPOSTAS_BACKEND', 'memoria')     # 'memoria' (por processo) ou 'redis'
+    CACHE_RESPOSTAS_TAMANHO = int(os.getenv('CACHE_RESPOSTAS_TAMANHO', '5000'))   # respostas por processo (memoria)
+    CACHE_RESPOSTAS_TTL = float(os.getenv('CACHE_RESPOSTAS_TTL', '60'))           # segundos
+    CACHE_RESPOSTAS_REDIS_URL = os.getenv('CACHE_RESPOSTAS_REDIS_URL', 'redis://localhost:6379/0')
@@ -6,11 +6,11 @@ class Aluno(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
     idade = db.Column(db.Integer, nullable=False)
-    turma_id = db.Column(db.Integer, db.ForeignKey("turmas.id"), nullable=True)
+    turma_id = db.Column(db.Integer, db.ForeignKey("turmas.id"), nullable=True, index=True)
     data_nascimento = db.Column(db.Date)
     nota_primeiro_semestre = db.Column(db.Float)
     nota_segundo_semestre = db.Column(db.Float)
-    media_final = db.Column(db.Float)
+    media_final = db.Column(db.Float)  # calculada pelo servidor a partir das notas semestrais
 
     turma = db.relationship("Turma", back_populates="alunos")
 
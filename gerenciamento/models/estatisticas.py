@@ -0,0 +1,106 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import Numeric, case, cast, event, func, inspect, select, update
+from sqlalchemy.orm import Session
+
+from config import Config
+from models.aluno import Aluno
+from models.turma import Turma
+from models.versoes import registrar_alteracao
+
+alunos = Aluno.__table__
+turmas = Turma.__table__
+
+COLUNAS_ESTATISTICAS = ('media_turma', 'total_avaliados', 'total_aprovados')
+
+
+def arredondar_nota(valor):
+    """
+    Duas casas com meio para cima sobre o valor decimal (7.625 -> 7.63), a
+    mesma regra do ROUND do banco em arredondar(). O round() do Python
+    arredonda para o par e daria 7.62.
+    """
+    return float(Decimal(repr(valor)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
+
+
+def calcular_media_final(nota_primeiro_semestre, nota_segundo_semestre):
+    """Média das notas semestrais lançadas (None se nenhuma foi lançada)."""
+    notas = [n for n in (nota_primeiro_semestre, nota_segundo_semestre) if n is not None]
+    return arredondar_nota(sum(notas) / len(notas)) if notas else None
+
+
+def arredondar(expressao):
+    """
+    ROUND(x, 2) portátil: o PostgreSQL só arredonda NUMERIC com casas decimais.
+    SQLite e PostgreSQL arredondam o meio para cima, como arredondar_nota().
+    """
+    return func.round(cast(expressao, Numeric), 2)
+
+
+def atualizar_estatisticas_turmas(conexao, turma_ids=None):
+    """
+    Recalcula média da turma, alunos avaliados e aprovados a partir da tabela
+    de alunos. Sem turma_ids recalcula todas as turmas.
+    """
+    def subconsulta(expressao, *filtros):
+        return select(expressao).where(alunos.c.turma_id == turmas.c.id, *filtros).scalar_subquery()
+
+    comando = update(turmas).values(
+        media_turma=subconsulta(arredondar(func.avg(alunos.c.media_final))),
+        total_avaliados=subconsulta(func.count(alunos.c.media_final)),
+        total_aprovados=subconsulta(func.count(), alunos.c.media_final >= Config.MEDIA_APROVACAO)
+    )
+    if turma_ids is not None:
+        comando = comando.where(turmas.c.id.in_(turma_ids))
+    conexao.execute(comando)
+    registrar_alteracao(conexao, 'turmas')
+
+
+def recalcular_tudo(conexao):
+    """Recalcula media_final de todos os alunos e as estatísticas de todas as turmas."""
+    n1, n2 = alunos.c.nota_primeiro_semestre, alunos.c.nota_segundo_semestre
+    conexao.execute(update(alunos).values(media_final=case(
+        (n1.is_(None), arredondar(n2)),
+        (n2.is_(None), arredondar(n1)),
+        else_=arredondar((n1 + n2) / 2.0)
+    )))
+    registrar_alteracao(conexao, 'alunos')
+    atualizar_estatisticas_turmas(conexao)
+
+
+# As notas dos alunos só mudam pela sessão do ORM, então os eventos abaixo mantêm
+# media_final e as estatísticas das turmas afetadas em dia a cada flush.
+
+@event.listens_for(Session, 'before_flush')
+def _antes_do_flush(session, flush_context, instances):
+    afetadas = session.info.setdefault('turmas_afetadas', set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if not isinstance(obj, Aluno):
+            continue
+        # turma gravada no banco antes desta alteração
+        historico = inspect(obj).attrs.turma_id.history
+        afetadas.update(t for t in [*historico.unchanged, *historico.deleted] if t is not None)
+        if obj not in session.deleted:
+            obj.media_final = calcular_media_final(obj.nota_primeiro_semestre, obj.nota_segundo_semestre)
+
+
+@event.listens_for(Session, 'after_flush')
+def _depois_do_flush(session, flush_context):
+    afetadas = session.info.setdefault('turmas_afetadas', set())
+    for obj in list(session.new) + list(session.dirty):
+        # depois do flush o turma_id já reflete mudanças feitas via relacionamento
+        if isinstance(obj, Aluno) and obj.turma_id is not None:
+            afetadas.add(obj.turma_id)
+        elif isinstance(obj, Turma) and obj.id is not None:
+            afetadas.add(obj.id)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _atualizar_turmas_afetadas(session, flush_context):
+    afetadas = session.info.pop('turmas_afetadas', None)
+    if not afetadas:
+        return
+    atualizar_estatisticas_turmas(session.connection(), afetadas)
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Turma) and obj.id in afetadas:
+            session.expire(obj, COLUNAS_ESTATISTICAS)
@@ -0,0 +1,45 @@
+from sqlalchemy import inspect, text
+
+from models import db
+from models.estatisticas import recalcular_tudo
+from models.versoes import garantir_versoes
+
+
+def adicionar_colunas_faltantes():
+    """
+    Bancos criados por versões antigas não ganham colunas novas com create_all().
+    Adiciona via ALTER TABLE as colunas dos models que ainda não existem e
+    retorna o conjunto (tabela, coluna) do que foi criado.
+    """
+    inspetor = inspect(db.engine)
+    adicionadas = set()
+    for tabela in db.metadata.sorted_tables:
+        existentes = {c['name'] for c in inspetor.get_columns(tabela.name)}
+        for coluna in tabela.columns:
+            if coluna.name not in existentes:
+                tipo = coluna.type.compile(dialect=db.engine.dialect)
+                db.session.execute(text(f'ALTER TABLE {tabela.name} ADD COLUMN {coluna.name} {tipo}'))
+                adicionadas.add((tabela.name, coluna.name))
+    return adicionadas
+
+
+def criar_indices_faltantes():
+    """
+    create_all() não cria índices novos em tabelas que já existem (bancos
+    criados por versões antigas). Cria os índices declarados nos models que
+    ainda não estão no banco.
+    """
+    for tabela in db.metadata.sorted_tables:
+        for indice in tabela.indexes:
+            indice.create(bind=db.engine, checkfirst=True)
+
+
+def aplicar_migracoes():
+    """Deve ser chamada logo depois do db.create_all(), dentro do app_context."""
+    adicionadas = adicionar_colunas_faltantes()
+    if ('turmas', 'media_turma') in adicionadas:
+        # primeira execução com médias calculadas pelo servidor: preenche os dados existentes
+        recalcular_tudo(db.session.connection())
+    db.session.commit()
+    criar_indices_faltantes()
+    garantir_versoes()
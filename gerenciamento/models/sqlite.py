@@ -0,0 +1,40 @@
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import Config
+
+MODOS_JOURNAL = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+NIVEIS_SYNCHRONOUS = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def pragmas_sqlite():
+    """
+    Perfil de desempenho do SQLite definido no Config. Valores inválidos
+    geram ValueError na primeira conexão em vez de irem direto para o SQL.
+    """
+    journal = Config.SQLITE_JOURNAL_MODE.upper()
+    synchronous = Config.SQLITE_SYNCHRONOUS.upper()
+    if journal not in MODOS_JOURNAL:
+        raise ValueError(f"SQLITE_JOURNAL_MODE inválido: {journal}")
+    if synchronous not in NIVEIS_SYNCHRONOUS:
+        raise ValueError(f"SQLITE_SYNCHRONOUS inválido: {synchronous}")
+    return [
+        f"PRAGMA journal_mode={journal}",
+        f"PRAGMA busy_timeout={int(Config.SQLITE_BUSY_TIMEOUT)}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA cache_size={int(Config.SQLITE_CACHE_SIZE)}",
+        f"PRAGMA mmap_size={int(Config.SQLITE_MMAP_SIZE)}",
+    ]
+
+
+# Aplicado em toda conexão nova do pool; bancos que não são SQLite são ignorados.
+@event.listens_for(Engine, 'connect')
+def _aplicar_pragmas(conexao_dbapi, registro_conexao):
+    if not isinstance(conexao_dbapi, sqlite3.Connection):
+        return
+    cursor = conexao_dbapi.cursor()
+    for pragma in pragmas_sqlite():
+        cursor.execute(pragma)
+    cursor.close()
@@ -5,8 +5,12 @@ class Turma(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     descricao = db.Column(db.String(100), nullable=False)
-    professor_id = db.Column(db.Integer, db.ForeignKey("professores.id"), nullable=False)
+    professor_id = db.Column(db.Integer, db.ForeignKey("professores.id"), nullable=False, index=True)
     ativo = db.Column(db.Boolean, default=True)
+    # estatísticas mantidas pelo servidor a cada alteração de aluno (models/estatisticas.py)
+    media_turma = db.Column(db.Float)
+    total_avaliados = db.Column(db.Integer, default=0)
+    total_aprovados = db.Column(db.Integer, default=0)
 
     professor = db.relationship("Professor", back_populates="turmas")
     alunos = db.relationship("Aluno", back_populates="turma")
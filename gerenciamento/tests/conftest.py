@@ -0,0 +1,52 @@
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+# os módulos do serviço são importados a partir da pasta dele (como no app.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from models import db  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App com um banco SQLite novo em um diretório temporário."""
+    monkeypatch.setattr(Config, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'teste.db'}")
+    from app import create_app
+    from utils import cache_respostas
+    cache_respostas.usar_backend(cache_respostas.criar_backend())  # nada de respostas de outro teste
+    app = create_app()
+    app.config['TESTING'] = True
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def cliente(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def contar_consultas(app):
+    """Context manager que conta os comandos SQL executados dentro do bloco."""
+    @contextmanager
+    def contar():
+        comandos = []
+
+        def registrar(conn, cursor, statement, parameters, context, executemany):
+            comandos.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', registrar)
+        try:
+            yield comandos
+        finally:
+            event.remove(engine, 'before_cursor_execute', registrar)
+    return contar
@@ -0,0 +1,50 @@
+import pytest
+
+from models import db
+from models.turma import Turma
+from utils import cache_respostas
+
+
+@pytest.fixture
+def turma(cliente):
+    professor = cliente.post('/api/professores', json={'nome': 'Ana', 'idade': 40, 'materia': 'Física'}).get_json()
+    return cliente.post('/api/turmas', json={'descricao': 'T1', 'professor_id': professor['id']}).get_json()
+
+
+def test_resposta_repetida_sai_do_cache_sem_consultar_a_turma(cliente, contar_consultas, turma):
+    cliente.get(f"/api/turmas/{turma['id']}")
+
+    with contar_consultas() as comandos:
+        resposta = cliente.get(f"/api/turmas/{turma['id']}")
+
+    assert resposta.get_json()['descricao'] == 'T1'
+    assert len(comandos) == 1 and 'versoes_tabela' in comandos[0]
+
+
+@pytest.mark.parametrize('url', ['/api/turmas/{id}', '/api/turmas', '/api/professores'])
+def test_escrita_feita_por_outro_worker_invalida_o_cache(cliente, turma, url):
+    url = url.format(id=turma['id'])
+    antes = cliente.get(url)
+    assert b'T1' in antes.data
+
+    # outro worker, com o próprio cache em memória, atende o PUT
+    cache_deste_worker = cache_respostas.backend
+    cache_respostas.usar_backend(cache_respostas.criar_backend())
+    cliente.put(f"/api/turmas/{turma['id']}", json={'descricao': 'T2'})
+    cache_respostas.usar_backend(cache_deste_worker)
+
+    depois = cliente.get(url)
+    assert b'T2' in depois.data and b'T1' not in depois.data
+    assert depois.headers['ETag'] != antes.headers['ETag']
+    # o cliente com o ETag antigo recebe o conteúdo novo, não um 304
+    assert cliente.get(url, headers={'If-None-Match': antes.headers['ETag']}).status_code == 200
+
+
+def test_escrita_direta_no_banco_invalida_o_cache(app, cliente, turma):
+    cliente.get(f"/api/turmas/{turma['id']}")
+
+    with app.app_context():
+        db.session.get(Turma, turma['id']).descricao = 'T3'
+        db.session.commit()
+
+    assert cliente.get(f"/api/turmas/{turma['id']}").get_json()['descricao'] == 'T3'
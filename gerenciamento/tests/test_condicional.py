@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+from werkzeug.http import http_date
+
+import models.versoes
+import utils.condicional
+
+# depois das versões gravadas ao subir o app, com o relógio de verdade
+INICIO = models.versoes.agora_utc() + timedelta(hours=1)
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    """Relógio controlado pelo teste para as versões das tabelas e o Last-Modified."""
+    agora = [INICIO]
+    monkeypatch.setattr(models.versoes, 'agora_utc', lambda: agora[0])
+    monkeypatch.setattr(utils.condicional, 'agora_utc', lambda: agora[0], raising=False)
+    return agora
+
+
+def criar_professor(cliente, nome):
+    return cliente.post('/api/professores', json={'nome': nome, 'idade': 40, 'materia': 'Física'}).get_json()
+
+
+def test_duas_escritas_no_mesmo_segundo_nao_geram_304_por_data(cliente, relogio):
+    criar_professor(cliente, 'Ana')
+    primeira = cliente.get('/api/professores')
+    # o segundo da alteração ainda está em curso: nenhuma data é prometida ao cliente
+    assert primeira.last_modified is None
+
+    criar_professor(cliente, 'Bruno')  # mesmo segundo
+    segunda = cliente.get('/api/professores', headers={'If-Modified-Since': http_date(INICIO)})
+
+    assert segunda.status_code == 200
+    assert [p['nome'] for p in segunda.get_json()['items']] == ['Ana', 'Bruno']
+
+
+def test_if_modified_since_depois_que_o_segundo_termina(cliente, relogio):
+    criar_professor(cliente, 'Ana')
+    criar_professor(cliente, 'Bruno')
+    relogio[0] = INICIO + timedelta(seconds=3)
+
+    resposta = cliente.get('/api/professores')
+    assert resposta.last_modified.replace(tzinfo=None) == INICIO
+
+    nao_mudou = cliente.get('/api/professores', headers={'If-Modified-Since': resposta.headers['Last-Modified']})
+    assert nao_mudou.status_code == 304
+
+    criar_professor(cliente, 'Carla')
+    relogio[0] = INICIO + timedelta(seconds=6)
+    mudou = cliente.get('/api/professores', headers={'If-Modified-Since': resposta.headers['Last-Modified']})
+    assert mudou.status_code == 200
+
+
+def test_etag_continua_valendo_no_mesmo_segundo(cliente, relogio):
+    criar_professor(cliente, 'Ana')
+    etag = cliente.get('/api/professores').headers['ETag']
+
+    assert cliente.get('/api/professores', headers={'If-None-Match': etag}).status_code == 304
+    criar_professor(cliente, 'Bruno')
+    assert cliente.get('/api/professores', headers={'If-None-Match': etag}).status_code == 200
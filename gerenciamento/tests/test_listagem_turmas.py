@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import insert
+
+from models import db
+from models.aluno import Aluno
+from models.professor import Professor
+from models.turma import Turma
+
+# Consultas esperadas por listagem: versões das tabelas (ETag) + página + 1 por relacionamento expandido
+MAXIMO_CONSULTAS = 3
+
+
+def popular(app, turmas, alunos_por_turma=3):
+    with app.app_context():
+        db.session.execute(insert(Professor), [
+            dict(nome=f'Professor {i}', idade=40, materia='Matemática') for i in range(5)
+        ])
+        db.session.execute(insert(Turma), [
+            dict(descricao=f'Turma {i}', professor_id=1 + i % 5, ativo=True) for i in range(turmas)
+        ])
+        db.session.execute(insert(Aluno), [
+            dict(nome=f'Aluno {t}-{i}', idade=15, turma_id=t) for t in range(1, turmas + 1) for i in range(alunos_por_turma)
+        ])
+        db.session.commit()
+
+
+@pytest.mark.parametrize('turmas', [5, 60])
+@pytest.mark.parametrize('url', [
+    '/api/turmas',
+    '/api/turmas?all=true',
+    '/api/turmas?expand=alunos,professor',
+    '/api/turmas?fields=id,descricao',
+])
+def test_listagem_de_turmas_nao_cresce_com_o_numero_de_turmas(app, cliente, contar_consultas, url, turmas):
+    popular(app, turmas)
+
+    with contar_consultas() as comandos:
+        resposta = cliente.get(url)
+
+    assert resposta.status_code == 200
+    assert len(comandos) <= MAXIMO_CONSULTAS, comandos
+
+
+def test_listagem_completa_traz_professor_e_alunos(app, cliente):
+    popular(app, 2, alunos_por_turma=2)
+
+    itens = cliente.get('/api/turmas').get_json()['items']
+
+    assert itens[0]['professor'] == 'Professor 0'
+    assert itens[0]['alunos'] == ['Aluno 1-0', 'Aluno 1-1']
+    assert itens[1]['alunos'] == ['Aluno 2-0', 'Aluno 2-1']
+
+
+def test_campos_esparsos_nao_carregam_relacionamentos(app, cliente, contar_consultas):
+    popular(app, 3)
+
+    with contar_consultas() as comandos:
+        itens = cliente.get('/api/turmas?fields=descricao').get_json()['items']
+
+    assert itens[0] == {'id': 1, 'descricao': 'Turma 0'}
+    assert not any('alunos' in c or 'professores' in c for c in comandos if 'versoes_tabela' not in c)
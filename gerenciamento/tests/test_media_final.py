@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import select
+
+from models import db
+from models.aluno import Aluno
+from models.estatisticas import calcular_media_final, recalcular_tudo
+from models.turma import Turma
+
+
+@pytest.mark.parametrize('nota1, nota2, esperado', [
+    (7.5, 7.75, 7.63),   # 7.625: o round() do Python daria 7.62
+    (2.5, 2.85, 2.68),   # 2.675 não é exato em float
+    (8.0, 8.25, 8.13),
+    (6.0, None, 6.0),
+])
+def test_media_final_arredonda_meio_para_cima(nota1, nota2, esperado):
+    assert calcular_media_final(nota1, nota2) == esperado
+
+
+def test_flush_e_recalculo_no_banco_gravam_a_mesma_media(app, cliente):
+    professor = cliente.post('/api/professores', json={'nome': 'Ana', 'idade': 40, 'materia': 'Matemática'}).get_json()
+    turma = cliente.post('/api/turmas', json={'descricao': 'Turma A', 'professor_id': professor['id']}).get_json()
+    # as duas últimas têm uma nota só: o recálculo no banco também arredonda esse caso
+    for nota1, nota2 in [(7.5, 7.75), (2.5, 2.85), (8.0, 8.25), (1.0, 1.01), (6.125, None), (None, 7.333)]:
+        cliente.post('/api/alunos', json={
+            'nome': 'Aluno', 'idade': 15, 'turma_id': turma['id'],
+            'nota_primeiro_semestre': nota1, 'nota_segundo_semestre': nota2
+        })
+
+    with app.app_context():
+        consulta = select(Aluno.id, Aluno.media_final).order_by(Aluno.id)
+        no_flush = db.session.execute(consulta).all()
+        media_turma_no_flush = db.session.get(Turma, turma['id']).media_turma
+
+        recalcular_tudo(db.session.connection())
+        db.session.commit()
+        no_banco = db.session.execute(consulta).all()
+        media_turma_no_banco = db.session.get(Turma, turma['id']).media_turma
+
+    assert [m for _, m in no_flush] == [7.63, 2.68, 8.13, 1.01, 6.13, 7.33]
+    assert no_flush == no_banco
+    assert media_turma_no_flush == media_turma_no_banco
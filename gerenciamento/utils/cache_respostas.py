@@ -0,0 +1,99 @@
+from functools import wraps
+
+from flask import Response, make_response, request
+
+from config import Config
+from models.versoes import versoes_da_requisicao
+from utils.cache import CacheTTL
+
+# Prefixo das chaves num backend compartilhado por outros serviços
+PREFIXO = 'gerenciamento:'
+
+
+class BackendMemoria:
+    """Cache LRU do próprio processo (padrão). Cada worker do gunicorn tem o seu."""
+
+    def __init__(self, tamanho_maximo, ttl):
+        self.itens = CacheTTL(tamanho_maximo, ttl)
+
+    def obter(self, chave):
+        return self.itens.obter(chave)
+
+    def definir(self, chave, corpo):
+        self.itens.definir(chave, corpo)
+
+    def estatisticas(self):
+        return {'backend': 'memoria', **self.itens.estatisticas()}
+
+
+class BackendRedis:
+    """
+    Cache compartilhado entre processos e réplicas. `cliente` pode ser qualquer
+    objeto com a API do redis-py (get/set), por exemplo um substituto local nos
+    testes; sem ele, conecta em CACHE_RESPOSTAS_REDIS_URL.
+    """
+
+    def __init__(self, ttl, url=None, cliente=None):
+        if cliente is None:
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError("CACHE_RESPOSTAS_BACKEND=redis exige o pacote 'redis' instalado")
+            cliente = redis.Redis.from_url(url)
+        self.cliente = cliente
+        self.ttl = ttl
+
+    def obter(self, chave):
+        corpo = self.cliente.get(PREFIXO + chave)
+        return (corpo is not None), corpo
+
+    def definir(self, chave, corpo):
+        self.cliente.set(PREFIXO + chave, corpo, ex=int(self.ttl))
+
+    def estatisticas(self):
+        return {'backend': 'redis'}
+
+
+def criar_backend():
+    if Config.CACHE_RESPOSTAS_BACKEND == 'redis':
+        return BackendRedis(Config.CACHE_RESPOSTAS_TTL, url=Config.CACHE_RESPOSTAS_REDIS_URL)
+    return BackendMemoria(Config.CACHE_RESPOSTAS_TAMANHO, Config.CACHE_RESPOSTAS_TTL)
+
+
+backend = criar_backend()
+
+
+def usar_backend(novo):
+    """Troca o backend em uso (testes ou configuração programática)."""
+    global backend
+    backend = novo
+
+
+def em_cache(*tabelas):
+    """
+    Decorator que guarda o corpo das respostas 200 da view.
+
+    A chave é a URL mais a versão atual das tabelas das quais a resposta
+    depende (models/versoes.py, a mesma leitura do ETag na requisição). As versões ficam no
+    banco e sobem na mesma transação de cada escrita, então qualquer worker
+    que altere os dados invalida as respostas de todos os outros, sem chamada
+    explícita nos handlers; as respostas antigas só deixam de ser encontradas
+    e expiram pelo TTL. Como a versão é lida antes da view consultar o banco,
+    uma resposta montada durante uma escrita fica sob a versão antiga e não é
+    servida depois dela.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            estado = ','.join(f'{tabela}={versao}' for tabela, versao, _ in versoes_da_requisicao(*tabelas))
+            chave = f"{request.full_path}#{estado}"
+            encontrado, corpo = backend.obter(chave)
+            if encontrado:
+                return Response(corpo, status=200, mimetype='application/json')
+
+            resposta = make_response(view(*args, **kwargs))
+            if resposta.status_code == 200 and not resposta.is_streamed:
+                backend.definir(chave, resposta.get_data())
+            return resposta
+        return wrapper
+    return decorator
@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+from flask import request
+from sqlalchemy import select
+
+from models import db
+
+# Máximo de ids por SELECT ... IN ao carregar um relacionamento expandido
+LOTE_EXPANSAO = 500
+
+
+def ler_lista(parametro, permitidos):
+    """
+    Lê um parâmetro de lista separada por vírgulas (?fields=id,descricao).
+    Retorna None se o parâmetro não foi enviado; levanta ValueError com a
+    mensagem para o cliente se algum nome não estiver em permitidos.
+    """
+    valor = request.args.get(parametro)
+    if valor is None:
+        return None
+    nomes = [nome.strip() for nome in valor.split(',') if nome.strip()]
+    invalidos = [nome for nome in nomes if nome not in permitidos]
+    if invalidos:
+        raise ValueError(f"Valor inválido em '{parametro}': {', '.join(invalidos)}; use {', '.join(permitidos)}")
+    return nomes
+
+
+def campos_e_expansoes(colunas, relacionamentos):
+    """
+    Lê ?fields= (colunas) e ?expand= (relacionamentos) de uma listagem.
+
+    Sem nenhum dos dois devolve tudo, que é o formato completo de antes.
+    Com algum deles, fields ausente significa todas as colunas e expand
+    ausente significa nenhum relacionamento. O id sempre vem (é o cursor).
+    Retorna (campos, expandir).
+    """
+    campos = ler_lista('fields', colunas)
+    expandir = ler_lista('expand', relacionamentos)
+    if campos is None and expandir is None:
+        return list(colunas), list(relacionamentos)
+    campos = campos or list(colunas)
+    return ['id'] + [c for c in dict.fromkeys(campos) if c != 'id'], expandir or []
+
+
+def anexar_lista(itens, chave, coluna_pai, coluna_valor, ordem):
+    """
+    Preenche item[chave] com a lista de coluna_valor das linhas filhas de
+    cada item, carregadas com um SELECT ... WHERE coluna_pai IN (...) por
+    lote de ids (uma consulta por página, qualquer que seja o tamanho dela).
+    """
+    grupos = defaultdict(list)
+    ids = [item['id'] for item in itens]
+    for inicio in range(0, len(ids), LOTE_EXPANSAO):
+        consulta = (select(coluna_pai, coluna_valor)
+                    .where(coluna_pai.in_(ids[inicio:inicio + LOTE_EXPANSAO]))
+                    .order_by(ordem))
+        for pai, valor in db.session.execute(consulta):
+            grupos[pai].append(valor)
+    for item in itens:
+        item[chave] = grupos.get(item['id'], [])
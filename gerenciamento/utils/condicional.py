@@ -0,0 +1,74 @@
+import hashlib
+from datetime import timedelta
+from functools import wraps
+
+from flask import Response, make_response, request
+
+from models.versoes import agora_utc, versoes_da_requisicao
+
+# Folga entre o fim do segundo da última alteração e o uso dele no Last-Modified:
+# cobre a escrita que gravou atualizado_em num segundo e só fez commit no seguinte
+FOLGA_LAST_MODIFIED = timedelta(seconds=1)
+
+
+def segundo_encerrado(momento):
+    """
+    Indica se nenhuma alteração nova ainda pode cair no mesmo segundo de
+    `momento`. O Last-Modified só tem resolução de segundos: se o cliente
+    recebesse o segundo atual, outra escrita nesse mesmo segundo passaria
+    despercebida pelo If-Modified-Since.
+    """
+    return momento.replace(microsecond=0) + timedelta(seconds=1) + FOLGA_LAST_MODIFIED <= agora_utc()
+
+
+def lista_condicional(*tabelas):
+    """
+    Decorator para listagens: ETag e Last-Modified vêm da versão das tabelas
+    das quais a resposta depende (models/versoes.py). Se o cliente já tem a
+    versão atual (If-None-Match / If-Modified-Since), responde 304 sem
+    executar a view. O ETag também depende da query string e do Accept,
+    porque eles mudam o conteúdo. Enquanto o segundo da última alteração não
+    termina, vale só o ETag (sem Last-Modified e sem 304 por data).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            estado = versoes_da_requisicao(*tabelas)
+            assinatura = repr((estado, request.full_path, request.headers.get("Accept", ""))).encode()
+            etag = hashlib.sha1(assinatura).hexdigest()
+            ultima_alteracao = max((atualizado_em for _, _, atualizado_em in estado), default=None)
+            if ultima_alteracao is not None and not segundo_encerrado(ultima_alteracao):
+                ultima_alteracao = None
+
+            if request.if_none_match:
+                nao_mudou = request.if_none_match.contains_weak(etag)
+            else:
+                nao_mudou = (ultima_alteracao is not None and request.if_modified_since is not None
+                             and ultima_alteracao <= request.if_modified_since.replace(tzinfo=None))
+            if nao_mudou:
+                resposta = Response(status=304)
+            else:
+                resposta = make_response(view(*args, **kwargs))
+                if resposta.status_code != 200:
+                    return resposta
+            resposta.set_etag(etag, weak=True)
+            if ultima_alteracao is not None:  # atribuir None faria o werkzeug usar a hora atual
+                resposta.last_modified = ultima_alteracao
+            return resposta
+        return wrapper
+    return decorator
+
+
+def etag_conteudo(view):
+    """
+    Decorator para GET de um único recurso: ETag forte calculado sobre o corpo
+    da resposta, com 304 quando o cliente já tem a mesma representação.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        resposta = make_response(view(*args, **kwargs))
+        if resposta.status_code != 200 or resposta.is_streamed:
+            return resposta
+        resposta.add_etag()
+        return resposta.make_conditional(request)
+    return wrapper
@@ -0,0 +1,4 @@
+-- Executado pelo container postgres só na primeira inicialização do volume.
+-- Um banco por microsserviço (o "gerenciamento" é criado por POSTGRES_DB).
+CREATE DATABASE atividades;
+CREATE DATABASE reservas;
@@ -1,24 +1,33 @@
 from flask import Flask
 from flasgger import Swagger
 from models import db
+from config import Config
+from models.migracoes import aplicar_migracoes
+import models.sqlite  # registra os pragmas do SQLite em cada conexão
+from utils.provedor_json import ProvedorJSON
 from controllers.reserva_controller import reserva_bp
+from controllers.serie_controller import serie_bp
+from controllers.cache_controller import cache_bp
 
 def create_app():
     app = Flask(__name__)
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///reservas.db'
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['SWAGGER'] = {
-        'title': 'API de Reservas',
-        'uiversion': 3
-    }
+    # Banco, pool de conexões e integrações vêm do Config (variáveis de ambiente)
+    app.config.from_object(Config)
+    app.json = ProvedorJSON(app)  # orjson quando instalado, datas em ISO 8601
 
     db.init_app(app)
     Swagger(app)
 
     app.register_blueprint(reserva_bp, url_prefix='/api/reservas')
+    app.register_blueprint(serie_bp, url_prefix='/api/reservas/series')
+    app.register_blueprint(cache_bp, url_prefix='/api/_cache')
 
     with app.app_context():
         db.create_all()
+        aplicar_migracoes()
+        # com preload no gunicorn o app é criado antes do fork: nenhuma conexão
+        # aberta aqui pode ser herdada pelos workers
+        db.engine.dispose()
 
     return app
 
@@ -1,33 +1,262 @@
 from flask import Blueprint, jsonify, request
+from sqlalchemy import select
 from models import db
-from models.reserva import Reserva
-from datetime import date
+from models.reserva import Reserva, formatar_hora
+from config import Config
+from utils.paginacao import listar_paginado
+from utils.validacao import recurso_existe, validar_em_paralelo
+from utils.filtros import filtrar, data_iso, booleano
+from utils.condicional import lista_condicional, etag_conteudo
+from utils.agenda import conflitos, bloquear_salas, ler_horario, arvores_por_dia, intervalo, minutos, hora
+from datetime import date, time, timedelta
+import asyncio
 import requests  # ✅ para validação via microserviço
 
 reserva_bp = Blueprint("reserva_bp", __name__)
 
+# Filtros aceitos em GET /api/reservas/ (colunas indexadas)
+FILTROS_RESERVA = {
+    "turma_id": (Reserva.turma_id, int),
+    "num_sala": (Reserva.num_sala, str),
+    "data": (Reserva.data, data_iso),
+    "lab": (Reserva.lab, booleano),
+    "serie_id": (Reserva.serie_id, int)
+}
+
+# Colunas da listagem: lidas como linhas simples, sem montar objetos Reserva
+COLUNAS_RESERVA = (
+    Reserva.id, Reserva.num_sala, Reserva.lab, Reserva.data,
+    Reserva.hora_inicio, Reserva.hora_fim, Reserva.turma_id, Reserva.serie_id
+)
+
+
+def linha_para_dict(linha):
+    """Linha de select(*COLUNAS_RESERVA) no mesmo formato de Reserva.to_dict()."""
+    return {
+        **linha,
+        "hora_inicio": formatar_hora(linha["hora_inicio"]),
+        "hora_fim": formatar_hora(linha["hora_fim"])
+    }
+
+# Máximo de dias consultados de uma vez em /salas/<num_sala>/horarios-livres
+LIMITE_DIAS_HORARIOS = 60
+
+
+def montar_reserva(dados, turma_id):
+    """Reserva (ainda não adicionada à sessão) a partir do corpo da requisição."""
+    hora_inicio, hora_fim = ler_horario(dados)
+    return Reserva(
+        num_sala=dados["num_sala"],
+        lab=dados.get("lab", False),
+        data=date.fromisoformat(dados["data"]),
+        hora_inicio=hora_inicio,
+        hora_fim=hora_fim,
+        turma_id=turma_id
+    )
+
+
+def mensagem_conflito(reserva):
+    horario = f" das {reserva.hora_inicio:%H:%M} às {reserva.hora_fim:%H:%M}" if reserva.hora_inicio else ""
+    return f"Sala {reserva.num_sala} já reservada em {reserva.data.isoformat()}{horario}"
+
 # 🟢 LISTAR TODAS AS RESERVAS
 @reserva_bp.route("/", methods=["GET"])
+@lista_condicional("reservas")
 def listar_reservas():
     """
-    Lista todas as reservas
+    Lista as reservas (paginação por cursor)
+    Filtros opcionais viram cláusulas WHERE no banco; cada campo aceita os
+    sufixos __gt, __gte, __lt, __lte, __in (a,b,c) e __between (a,b).
+    ---
+    tags:
+      - Reservas
+    parameters:
+      - name: turma_id
+        in: query
+        type: integer
+        required: false
+      - name: num_sala
+        in: query
+        type: string
+        required: false
+      - name: lab
+        in: query
+        type: boolean
+        required: false
+      - name: data__between
+        in: query
+        type: string
+        required: false
+        description: Intervalo de datas inclusivo, ex. 2025-11-01,2025-11-30
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação (formato antigo)
+    responses:
+      200:
+        description: Página de reservas
+        examples:
+          application/json: {
+            "items": [
+              {"id": 1, "num_sala": "101", "lab": false, "data": "2025-11-20", "turma_id": 2}
+            ],
+            "next_cursor": null
+          }
+      400:
+        description: Parâmetros de paginação ou filtros inválidos
+    """
+    try:
+        consulta = filtrar(select(*COLUNAS_RESERVA), FILTROS_RESERVA)
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+    return listar_paginado(consulta, Reserva.id, linha_para_dict)
+
+
+# 🔎 SALAS DISPONÍVEIS EM UM DIA
+@reserva_bp.route("/disponibilidade", methods=["GET"])
+@lista_condicional("reservas")
+def disponibilidade():
+    """
+    Lista as salas livres em uma data (opcionalmente num horário)
+    Diferença entre o catálogo de salas (config SALAS / LABORATORIOS) e as
+    salas ocupadas no dia, buscadas pelo índice da coluna data. Com
+    hora_inicio/hora_fim, só contam as reservas que se sobrepõem ao horário.
     ---
     tags:
       - Reservas
+    parameters:
+      - name: data
+        in: query
+        type: string
+        format: date
+        required: true
+        example: "2025-11-20"
+      - name: lab
+        in: query
+        type: boolean
+        required: false
+        description: true para apenas laboratórios, false para apenas salas comuns
+      - name: hora_inicio
+        in: query
+        type: string
+        required: false
+        example: "08:00"
+      - name: hora_fim
+        in: query
+        type: string
+        required: false
+        example: "10:00"
     responses:
       200:
-        description: Lista de reservas
+        description: Salas livres
         examples:
-          application/json: [
-            {"id": 1, "num_sala": "101", "lab": false, "data": "2025-11-20", "turma_id": 2}
-          ]
+          application/json: {"data": "2025-11-20", "lab": null, "salas_livres": ["102", "LAB2"]}
+      400:
+        description: Data ausente ou inválida
     """
-    reservas = Reserva.query.all()
-    return jsonify([r.to_dict() for r in reservas]), 200
+    try:
+        dia = date.fromisoformat(request.args.get("data", ""))
+    except ValueError:
+        return jsonify({"erro": "Informe 'data' no formato AAAA-MM-DD"}), 400
+    try:
+        hora_inicio, hora_fim = ler_horario(request.args)
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    lab = request.args.get("lab")
+    if lab is None:
+        catalogo = Config.SALAS + Config.LABORATORIOS
+    elif lab.lower() in ("1", "true"):
+        lab, catalogo = True, Config.LABORATORIOS
+    else:
+        lab, catalogo = False, Config.SALAS
+
+    inicio, fim = intervalo(hora_inicio, hora_fim)
+    ocupadas = set()
+    for num_sala, r_inicio, r_fim in db.session.query(Reserva.num_sala, Reserva.hora_inicio, Reserva.hora_fim).filter(Reserva.data == dia):
+        r_ini, r_fi = intervalo(r_inicio, r_fim)
+        if r_ini < fim and r_fi > inicio:
+            ocupadas.add(num_sala)
+    livres = [sala for sala in catalogo if sala not in ocupadas]
+    return jsonify({"data": dia, "lab": lab, "salas_livres": livres}), 200
+
+
+# 🕒 HORÁRIOS LIVRES DE UMA SALA
+@reserva_bp.route("/salas/<num_sala>/horarios-livres", methods=["GET"])
+def horarios_livres(num_sala):
+    """
+    Lista os horários livres de uma sala nos próximos dias
+    As reservas do período vêm de uma única consulta pelo índice (num_sala, data)
+    e cada dia vira uma árvore de intervalos; as lacunas dentro do horário de
+    funcionamento (HORARIO_ABERTURA / HORARIO_FECHAMENTO) saem em O(log n + k).
+    ---
+    tags:
+      - Reservas
+    parameters:
+      - name: num_sala
+        in: path
+        type: string
+        required: true
+      - name: inicio
+        in: query
+        type: string
+        format: date
+        required: false
+        description: Primeiro dia da busca (padrão hoje)
+      - name: dias
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de dias (padrão 7, máximo 60)
+    responses:
+      200:
+        description: Lacunas livres por dia
+        examples:
+          application/json: {
+            "num_sala": "101",
+            "dias": [{"data": "2025-11-20", "livres": [{"hora_inicio": "07:00", "hora_fim": "08:00"}]}]
+          }
+      400:
+        description: Parâmetros inválidos
+    """
+    try:
+        inicio = date.fromisoformat(request.args["inicio"]) if "inicio" in request.args else date.today()
+        dias = int(request.args.get("dias", 7))
+    except ValueError:
+        return jsonify({"erro": "Use 'inicio' no formato AAAA-MM-DD e 'dias' inteiro"}), 400
+    if not 1 <= dias <= LIMITE_DIAS_HORARIOS:
+        return jsonify({"erro": f"'dias' deve estar entre 1 e {LIMITE_DIAS_HORARIOS}"}), 400
+
+    fim = inicio + timedelta(days=dias - 1)
+    abertura = minutos(time.fromisoformat(Config.HORARIO_ABERTURA))
+    fechamento = minutos(time.fromisoformat(Config.HORARIO_FECHAMENTO))
+    arvores = arvores_por_dia(num_sala, inicio, fim)
+
+    resultado = []
+    for i in range(dias):
+        dia = inicio + timedelta(days=i)
+        lacunas = arvores[dia].lacunas(abertura, fechamento)
+        resultado.append({
+            "data": dia,
+            "livres": [{"hora_inicio": hora(a), "hora_fim": hora(b)} for a, b in lacunas]
+        })
+    return jsonify({"num_sala": num_sala, "dias": resultado}), 200
 
 
 # 🟡 OBTER RESERVA POR ID
 @reserva_bp.route("/<int:id>", methods=["GET"])
+@etag_conteudo
 def obter_reserva(id):
     """
     Retorna uma reserva específica pelo ID
@@ -82,6 +311,13 @@ def criar_reserva():
               type: string
               format: date
               example: "2025-11-20"
+            hora_inicio:
+              type: string
+              example: "08:00"
+              description: Opcional; sem horário a reserva ocupa o dia inteiro
+            hora_fim:
+              type: string
+              example: "10:00"
             turma_id:
               type: integer
               example: 3
@@ -90,14 +326,15 @@ def criar_reserva():
         description: Reserva criada com sucesso
       400:
         description: Erro ao criar a reserva
+      409:
+        description: Sala já reservada neste horário
     """
     dados = request.get_json()
 
     # ✅ valida se a turma existe via microserviço gerenciamento
     try:
         turma_id = dados["turma_id"]
-        resp = requests.get(f"http://gerenciamento:5001/api/turmas/{turma_id}")
-        if resp.status_code != 200:
+        if not recurso_existe("turmas", turma_id):
             return jsonify({"erro": "Turma não encontrada"}), 404
     except KeyError:
         return jsonify({"erro": "Campo 'turma_id' é obrigatório"}), 400
@@ -105,12 +342,86 @@ def criar_reserva():
         return jsonify({"erro": f"Erro ao validar turma: {str(e)}"}), 500
 
     try:
-        nova_reserva = Reserva(
-            num_sala=dados["num_sala"],
-            lab=dados.get("lab", False),
-            data=date.fromisoformat(dados["data"]),
-            turma_id=turma_id
-        )
+        nova_reserva = montar_reserva(dados, turma_id)
+        # verificação e gravação sob o mesmo lock: duas requisições não levam o mesmo horário
+        bloquear_salas(nova_reserva.num_sala)
+        if conflitos(nova_reserva.num_sala, nova_reserva.data, nova_reserva.hora_inicio, nova_reserva.hora_fim):
+            db.session.rollback()
+            return jsonify({"erro": mensagem_conflito(nova_reserva)}), 409
+        db.session.add(nova_reserva)
+        db.session.commit()
+        return jsonify(nova_reserva.to_dict()), 201
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"erro": str(e)}), 400
+
+
+# ⚡ CRIAR UMA RESERVA (validação em paralelo com o banco)
+@reserva_bp.route("/async", methods=["POST"])
+async def criar_reserva_async():
+    """
+    Cria uma nova reserva sem esperar a validação da turma para consultar o banco
+    Mesmo corpo e mesmas respostas do POST /api/reservas/. A consulta da turma
+    ao gerenciamento sai primeiro (cliente httpx com pool compartilhado) e,
+    enquanto ela está em andamento, a reserva é montada e os conflitos de
+    horário são verificados no banco; a latência é a maior das duas etapas.
+    ---
+    tags:
+      - Reservas
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        description: Dados da reserva (mesmo formato do POST /api/reservas/)
+        required: true
+        schema:
+          type: object
+          required:
+            - num_sala
+            - data
+            - turma_id
+    responses:
+      201:
+        description: Reserva criada com sucesso
+      400:
+        description: Erro ao criar a reserva
+      404:
+        description: Turma não encontrada
+      409:
+        description: Sala já reservada neste horário
+    """
+    dados = request.get_json()
+    if "turma_id" not in dados:
+        return jsonify({"erro": "Campo 'turma_id' é obrigatório"}), 400
+    futuro = validar_em_paralelo(("turmas", dados["turma_id"]))
+
+    # trabalho local enquanto o gerenciamento responde
+    erro, conflito = None, False
+    try:
+        nova_reserva = montar_reserva(dados, dados["turma_id"])
+        conflito = bool(conflitos(nova_reserva.num_sala, nova_reserva.data, nova_reserva.hora_inicio, nova_reserva.hora_fim))
+    except Exception as e:
+        erro = e
+
+    try:
+        (turma_ok,) = await asyncio.wrap_future(futuro)
+    except requests.exceptions.RequestException as e:
+        return jsonify({"erro": f"Erro ao validar turma: {str(e)}"}), 500
+    if not turma_ok:
+        return jsonify({"erro": "Turma não encontrada"}), 404
+    if erro is not None:
+        return jsonify({"erro": str(erro)}), 400
+    if conflito:
+        return jsonify({"erro": mensagem_conflito(nova_reserva)}), 409
+
+    try:
+        # a verificação acima só evita esperar a validação à toa; a que vale é
+        # repetida sob o lock, junto da gravação
+        bloquear_salas(nova_reserva.num_sala)
+        if conflitos(nova_reserva.num_sala, nova_reserva.data, nova_reserva.hora_inicio, nova_reserva.hora_fim):
+            db.session.rollback()
+            return jsonify({"erro": mensagem_conflito(nova_reserva)}), 409
         db.session.add(nova_reserva)
         db.session.commit()
         return jsonify(nova_reserva.to_dict()), 201
@@ -150,6 +461,13 @@ def atualizar_reserva(id):
               type: string
               format: date
               example: "2025-11-25"
+            hora_inicio:
+              type: string
+              example: "14:00"
+              description: Envie junto com hora_fim; null nos dois volta para o dia inteiro
+            hora_fim:
+              type: string
+              example: "16:00"
             turma_id:
               type: integer
               example: 2
@@ -158,6 +476,8 @@ def atualizar_reserva(id):
         description: Reserva atualizada com sucesso
       404:
         description: Reserva não encontrada
+      409:
+        description: Sala já reservada neste horário
     """
     dados = request.get_json()
     reserva = Reserva.query.get(id)
@@ -167,19 +487,27 @@ def atualizar_reserva(id):
     # ✅ valida turma se estiver atualizando
     if "turma_id" in dados:
         try:
-            resp = requests.get(f"http://gerenciamento:5001/api/turmas/{dados['turma_id']}")
-            if resp.status_code != 200:
+            if not recurso_existe("turmas", dados["turma_id"]):
                 return jsonify({"erro": "Turma não encontrada"}), 404
         except requests.exceptions.RequestException as e:
             return jsonify({"erro": f"Erro ao validar turma: {str(e)}"}), 500
 
     try:
+        # verificação e gravação sob o mesmo lock (sala atual e sala nova)
+        bloquear_salas(reserva.num_sala, dados.get("num_sala", reserva.num_sala))
         reserva.num_sala = dados.get("num_sala", reserva.num_sala)
         reserva.lab = dados.get("lab", reserva.lab)
         if "data" in dados:
             reserva.data = date.fromisoformat(dados["data"])
+        if "hora_inicio" in dados or "hora_fim" in dados:
+            reserva.hora_inicio, reserva.hora_fim = ler_horario(dados)
         reserva.turma_id = dados.get("turma_id", reserva.turma_id)
 
+        if conflitos(reserva.num_sala, reserva.data, reserva.hora_inicio, reserva.hora_fim, ignorar_ids=[reserva.id]):
+            mensagem = mensagem_conflito(reserva)
+            db.session.rollback()
+            return jsonify({"erro": mensagem}), 409
+
         db.session.commit()
         return jsonify(reserva.to_dict()), 200
     except Exception as e:
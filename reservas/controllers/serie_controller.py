@@ -0,0 +1,394 @@
+from flask import Blueprint, jsonify, request
+from models import db
+from models.reserva import Reserva
+from models.serie_reserva import SerieReserva
+from models.versoes import registrar_alteracao
+from utils.paginacao import listar_paginado
+from utils.condicional import lista_condicional, etag_conteudo
+from utils.validacao import recurso_existe
+from utils.agenda import ler_horario, expandir_semanal, conflitos_em_datas, bloquear_salas
+from datetime import date
+import requests  # ✅ para validação via microserviço
+
+serie_bp = Blueprint("serie_bp", __name__)
+
+# Máximo de reservas geradas por uma série (um ano letivo com folga)
+LIMITE_OCORRENCIAS_SERIE = 400
+
+
+def ler_regra(dados, serie=None):
+    """
+    Monta a regra semanal a partir do corpo da requisição; campos ausentes
+    vêm da série existente (atualização). Levanta KeyError/ValueError.
+    """
+    data_inicio = date.fromisoformat(dados["data_inicio"]) if "data_inicio" in dados else serie.data_inicio
+    data_fim = date.fromisoformat(dados["data_fim"]) if "data_fim" in dados else serie.data_fim
+    if data_fim < data_inicio:
+        raise ValueError("'data_fim' deve ser igual ou posterior a 'data_inicio'")
+
+    if "dias_semana" in dados:
+        dias_semana = sorted({int(d) for d in dados["dias_semana"]})
+    elif serie is not None:
+        dias_semana = serie.lista_dias_semana
+    else:
+        dias_semana = [data_inicio.weekday()]
+    if not dias_semana or any(d < 0 or d > 6 for d in dias_semana):
+        raise ValueError("'dias_semana' deve ter valores de 0 (segunda) a 6 (domingo)")
+
+    intervalo_semanas = int(dados.get("intervalo_semanas", serie.intervalo_semanas if serie else 1))
+    if intervalo_semanas < 1:
+        raise ValueError("'intervalo_semanas' deve ser maior que zero")
+
+    if "hora_inicio" in dados or "hora_fim" in dados or serie is None:
+        hora_inicio, hora_fim = ler_horario(dados)
+    else:
+        hora_inicio, hora_fim = serie.hora_inicio, serie.hora_fim
+
+    return {
+        "data_inicio": data_inicio,
+        "data_fim": data_fim,
+        "dias_semana": ",".join(str(d) for d in dias_semana),
+        "intervalo_semanas": intervalo_semanas,
+        "hora_inicio": hora_inicio,
+        "hora_fim": hora_fim
+    }
+
+
+def gerar_reservas(serie):
+    """
+    Expande a série em memória, confere os conflitos de todas as datas numa
+    única consulta e insere as reservas em lote (sem commit).
+    Retorna (datas, conflitos); se houver conflitos nada é inserido.
+    """
+    datas = expandir_semanal(serie.data_inicio, serie.data_fim, serie.lista_dias_semana, serie.intervalo_semanas)
+    if not datas:
+        raise ValueError("A regra não gera nenhuma data no período")
+    if len(datas) > LIMITE_OCORRENCIAS_SERIE:
+        raise ValueError(f"Máximo de {LIMITE_OCORRENCIAS_SERIE} reservas por série")
+
+    conflitos = conflitos_em_datas(serie.num_sala, datas, serie.hora_inicio, serie.hora_fim)
+    if conflitos:
+        return datas, conflitos
+
+    db.session.bulk_insert_mappings(Reserva, [{
+        "num_sala": serie.num_sala,
+        "lab": serie.lab,
+        "data": dia,
+        "hora_inicio": serie.hora_inicio,
+        "hora_fim": serie.hora_fim,
+        "turma_id": serie.turma_id,
+        "serie_id": serie.id
+    } for dia in datas])
+    registrar_alteracao(db.session.connection(), "reservas")  # bulk não dispara o flush do ORM
+    return datas, {}
+
+
+def resposta_conflitos(serie, conflitos):
+    return jsonify({
+        "erro": f"Sala {serie.num_sala} já reservada em {len(conflitos)} data(s) da série",
+        "conflitos": [{"data": dia, "reservas": ids} for dia, ids in sorted(conflitos.items())]
+    }), 409
+
+
+def serie_para_dict(serie, datas):
+    return {**serie.to_dict(), "total_reservas": len(datas), "datas": datas}
+
+
+# 🟢 LISTAR SÉRIES
+@serie_bp.route("/", methods=["GET"])
+@lista_condicional("series_reserva")
+def listar_series():
+    """
+    Lista as séries de reservas recorrentes (paginação por cursor)
+    ---
+    tags:
+      - Séries de Reservas
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Quantidade de itens por página (padrão 50, máximo 500)
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor retornado em next_cursor pela página anterior
+      - name: all
+        in: query
+        type: boolean
+        required: false
+        description: Se true, retorna a lista completa sem paginação
+    responses:
+      200:
+        description: Página de séries
+      400:
+        description: Parâmetros de paginação inválidos
+    """
+    return listar_paginado(SerieReserva.query, SerieReserva.id, lambda s: s.to_dict())
+
+
+# 🔵 BUSCAR SÉRIE POR ID
+@serie_bp.route("/<int:id>", methods=["GET"])
+@etag_conteudo
+def obter_serie(id):
+    """
+    Retorna uma série com as datas reservadas
+    ---
+    tags:
+      - Séries de Reservas
+    parameters:
+      - name: id
+        in: path
+        type: integer
+        required: true
+    responses:
+      200:
+        description: Série encontrada
+      404:
+        description: Série não encontrada
+    """
+    serie = db.session.get(SerieReserva, id)
+    if not serie:
+        return jsonify({"erro": "Série não encontrada"}), 404
+    datas = [d for (d,) in db.session.query(Reserva.data).filter(Reserva.serie_id == id).order_by(Reserva.data)]
+    return jsonify(serie_para_dict(serie, datas)), 200
+
+
+# 🟡 CRIAR SÉRIE
+@serie_bp.route("/", methods=["POST"])
+def criar_serie():
+    """
+    Cria uma série semanal de reservas
+    A turma é validada uma vez, as datas são expandidas em memória, os
+    conflitos de todas elas saem de uma única consulta por intervalo e a
+    série inteira é gravada numa só transação (tudo ou nada).
+    ---
+    tags:
+      - Séries de Reservas
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - num_sala
+            - turma_id
+            - data_inicio
+            - data_fim
+          properties:
+            num_sala:
+              type: string
+              example: "LAB1"
+            lab:
+              type: boolean
+              example: true
+            turma_id:
+              type: integer
+              example: 3
+            data_inicio:
+              type: string
+              format: date
+              example: "2025-08-04"
+            data_fim:
+              type: string
+              format: date
+              example: "2025-12-12"
+            dias_semana:
+              type: array
+              items:
+                type: integer
+              example: [0, 2]
+              description: 0 = segunda ... 6 = domingo (padrão o dia da semana de data_inicio)
+            intervalo_semanas:
+              type: integer
+              example: 1
+              description: 1 = toda semana, 2 = semana sim, semana não...
+            hora_inicio:
+              type: string
+              example: "08:00"
+              description: Opcional; sem horário cada reserva ocupa o dia inteiro
+            hora_fim:
+              type: string
+              example: "10:00"
+    responses:
+      201:
+        description: Série criada com as datas reservadas
+      400:
+        description: Erro ao criar a série
+      404:
+        description: Turma não encontrada
+      409:
+        description: Alguma data da série conflita com reservas existentes
+    """
+    dados = request.get_json()
+
+    # ✅ valida a turma uma única vez para a série inteira
+    try:
+        turma_id = dados["turma_id"]
+        if not recurso_existe("turmas", turma_id):
+            return jsonify({"erro": "Turma não encontrada"}), 404
+    except KeyError:
+        return jsonify({"erro": "Campo 'turma_id' é obrigatório"}), 400
+    except requests.exceptions.RequestException as e:
+        return jsonify({"erro": f"Erro ao validar turma: {str(e)}"}), 500
+
+    try:
+        serie = SerieReserva(
+            num_sala=dados["num_sala"],
+            lab=dados.get("lab", False),
+            turma_id=turma_id,
+            **ler_regra(dados)
+        )
+        # conflitos e inserção sob o mesmo lock das reservas avulsas da sala
+        bloquear_salas(serie.num_sala)
+        db.session.add(serie)
+        db.session.flush()  # precisa do id para as reservas
+
+        datas, conflitos = gerar_reservas(serie)
+        if conflitos:
+            resposta = resposta_conflitos(serie, conflitos)
+            db.session.rollback()
+            return resposta
+
+        db.session.commit()
+        return jsonify(serie_para_dict(serie, datas)), 201
+    except KeyError as e:
+        db.session.rollback()
+        return jsonify({"erro": f"Campo {e} é obrigatório"}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"erro": str(e)}), 400
+
+
+# 🟠 ATUALIZAR SÉRIE
+@serie_bp.route("/<int:id>", methods=["PUT"])
+def atualizar_serie(id):
+    """
+    Atualiza uma série inteira
+    As reservas da série são regeradas pela nova regra numa só transação;
+    se alguma data nova conflitar, nada é alterado.
+    ---
+    tags:
+      - Séries de Reservas
+    consumes:
+      - application/json
+    parameters:
+      - name: id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          properties:
+            num_sala:
+              type: string
+              example: "LAB2"
+            lab:
+              type: boolean
+              example: true
+            turma_id:
+              type: integer
+              example: 3
+            data_inicio:
+              type: string
+              format: date
+            data_fim:
+              type: string
+              format: date
+              example: "2025-11-28"
+            dias_semana:
+              type: array
+              items:
+                type: integer
+              example: [1, 3]
+            intervalo_semanas:
+              type: integer
+            hora_inicio:
+              type: string
+              example: "14:00"
+            hora_fim:
+              type: string
+              example: "16:00"
+    responses:
+      200:
+        description: Série atualizada
+      404:
+        description: Série não encontrada
+      409:
+        description: Alguma data da série conflita com reservas existentes
+    """
+    dados = request.get_json()
+    serie = db.session.get(SerieReserva, id)
+    if not serie:
+        return jsonify({"erro": "Série não encontrada"}), 404
+
+    # ✅ valida turma se estiver atualizando
+    if "turma_id" in dados:
+        try:
+            if not recurso_existe("turmas", dados["turma_id"]):
+                return jsonify({"erro": "Turma não encontrada"}), 404
+        except requests.exceptions.RequestException as e:
+            return jsonify({"erro": f"Erro ao validar turma: {str(e)}"}), 500
+
+    try:
+        regra = ler_regra(dados, serie)
+        # exclusão, conflitos e reinserção sob o mesmo lock (sala atual e sala nova):
+        # nenhuma reserva avulsa entra no horário liberado no meio da troca
+        bloquear_salas(serie.num_sala, dados.get("num_sala", serie.num_sala))
+        serie.num_sala = dados.get("num_sala", serie.num_sala)
+        serie.lab = dados.get("lab", serie.lab)
+        serie.turma_id = dados.get("turma_id", serie.turma_id)
+        for campo, valor in regra.items():
+            setattr(serie, campo, valor)
+
+        # as reservas antigas da série não contam como conflito
+        Reserva.query.filter(Reserva.serie_id == id).delete(synchronize_session=False)
+        registrar_alteracao(db.session.connection(), "reservas")
+        datas, conflitos = gerar_reservas(serie)
+        if conflitos:
+            resposta = resposta_conflitos(serie, conflitos)
+            db.session.rollback()
+            return resposta
+
+        db.session.commit()
+        return jsonify(serie_para_dict(serie, datas)), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"erro": str(e)}), 400
+
+
+# 🔴 DELETAR SÉRIE
+@serie_bp.route("/<int:id>", methods=["DELETE"])
+def deletar_serie(id):
+    """
+    Exclui uma série e todas as suas reservas
+    ---
+    tags:
+      - Séries de Reservas
+    parameters:
+      - name: id
+        in: path
+        type: integer
+        required: true
+    responses:
+      200:
+        description: Série excluída com sucesso
+      404:
+        description: Série não encontrada
+    """
+    serie = db.session.get(SerieReserva, id)
+    if not serie:
+        return jsonify({"erro": "Série não encontrada"}), 404
+
+    removidas = Reserva.query.filter(Reserva.serie_id == id).delete(synchronize_session=False)
+    registrar_alteracao(db.session.connection(), "reservas")
+    db.session.delete(serie)
+    db.session.commit()
+    return jsonify({"mensagem": "Série deletada com sucesso", "reservas_removidas": removidas}), 200
@@ -0,0 +1,31 @@
+# Configuração de produção do gunicorn (substitui o servidor de desenvolvimento do Flask).
+# Uso: gunicorn -c gunicorn.conf.py
+# Reload sem derrubar conexões: kill -HUP <pid do master> (workers novos sobem antes
+# dos antigos saírem). Com preload_app o código é carregado no master, então uma
+# versão nova do código exige reiniciar o processo.
+import multiprocessing
+import os
+
+wsgi_app = "app:create_app()"
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Processos x threads: o SQLAlchemy e o cliente HTTP liberam o GIL durante I/O
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+
+# Carrega o app uma vez no master e compartilha a memória com os workers (copy-on-write)
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true")
+reload = os.getenv("GUNICORN_RELOAD", "false").lower() in ("1", "true")  # só em desenvolvimento
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Recicla workers periodicamente (vazamentos de memória não se acumulam)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "info")
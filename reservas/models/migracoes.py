@@ -0,0 +1,37 @@
+from sqlalchemy import inspect, text
+
+from models import db
+from models.versoes import garantir_versoes
+
+
+def adicionar_colunas_faltantes():
+    """
+    Adiciona via ALTER TABLE as colunas dos models que ainda não existem em
+    bancos criados por versões antigas (create_all() não altera tabelas).
+    """
+    inspetor = inspect(db.engine)
+    for tabela in db.metadata.sorted_tables:
+        existentes = {c['name'] for c in inspetor.get_columns(tabela.name)}
+        for coluna in tabela.columns:
+            if coluna.name not in existentes:
+                tipo = coluna.type.compile(dialect=db.engine.dialect)
+                db.session.execute(text(f'ALTER TABLE {tabela.name} ADD COLUMN {coluna.name} {tipo}'))
+    db.session.commit()
+
+
+def criar_indices_faltantes():
+    """
+    create_all() não cria índices novos em tabelas que já existem (bancos
+    criados por versões antigas). Cria os índices declarados nos models que
+    ainda não estão no banco.
+    """
+    for tabela in db.metadata.sorted_tables:
+        for indice in tabela.indexes:
+            indice.create(bind=db.engine, checkfirst=True)
+
+
+def aplicar_migracoes():
+    """Deve ser chamada logo depois do db.create_all(), dentro do app_context."""
+    adicionar_colunas_faltantes()
+    criar_indices_faltantes()
+    garantir_versoes()
@@ -1,19 +1,36 @@
 from models import db
 
+
+def formatar_hora(valor):
+    return valor.strftime("%H:%M") if valor else None
+
+
 class Reserva(db.Model):
     __tablename__ = 'reservas'
+    __table_args__ = (
+        # conflito de sala: uma busca indexada por (num_sala, data)
+        db.Index('ix_reservas_num_sala_data', 'num_sala', 'data'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     num_sala = db.Column(db.String(50), nullable=False)
     lab = db.Column(db.Boolean, default=False)
-    data = db.Column(db.Date, nullable=False)
-    turma_id = db.Column(db.Integer, nullable=False)
+    data = db.Column(db.Date, nullable=False, index=True)  # busca de salas livres num dia
+    # horário da reserva; reservas sem horário ocupam o dia inteiro
+    hora_inicio = db.Column(db.Time, nullable=True)
+    hora_fim = db.Column(db.Time, nullable=True)
+    turma_id = db.Column(db.Integer, nullable=False, index=True)
+    # reservas criadas por uma série recorrente (null nas avulsas)
+    serie_id = db.Column(db.Integer, db.ForeignKey('series_reserva.id'), nullable=True, index=True)
 
     def to_dict(self):
         return {
             "id": self.id,
             "num_sala": self.num_sala,
             "lab": self.lab,
-            "data": self.data.isoformat(),
-            "turma_id": self.turma_id
+            "data": self.data,
+            "hora_inicio": formatar_hora(self.hora_inicio),
+            "hora_fim": formatar_hora(self.hora_fim),
+            "turma_id": self.turma_id,
+            "serie_id": self.serie_id
         }
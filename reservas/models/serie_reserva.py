@@ -0,0 +1,35 @@
+from models import db
+from models.reserva import formatar_hora
+
+class SerieReserva(db.Model):
+    __tablename__ = 'series_reserva'
+
+    id = db.Column(db.Integer, primary_key=True)
+    num_sala = db.Column(db.String(50), nullable=False)
+    lab = db.Column(db.Boolean, default=False)
+    turma_id = db.Column(db.Integer, nullable=False)
+    # regra semanal: dias da semana (0 = segunda ... 6 = domingo) a cada N semanas
+    data_inicio = db.Column(db.Date, nullable=False)
+    data_fim = db.Column(db.Date, nullable=False)
+    dias_semana = db.Column(db.String(20), nullable=False)  # ex.: "0,2"
+    intervalo_semanas = db.Column(db.Integer, nullable=False, default=1)
+    hora_inicio = db.Column(db.Time, nullable=True)
+    hora_fim = db.Column(db.Time, nullable=True)
+
+    @property
+    def lista_dias_semana(self):
+        return [int(d) for d in self.dias_semana.split(",")]
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "num_sala": self.num_sala,
+            "lab": self.lab,
+            "turma_id": self.turma_id,
+            "data_inicio": self.data_inicio,
+            "data_fim": self.data_fim,
+            "dias_semana": self.lista_dias_semana,
+            "intervalo_semanas": self.intervalo_semanas,
+            "hora_inicio": formatar_hora(self.hora_inicio),
+            "hora_fim": formatar_hora(self.hora_fim)
+        }
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+from flask import g
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from models import db
+
+
+def agora_utc():
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+class VersaoTabela(db.Model):
+    """
+    Contador de alterações por tabela. As listagens montam o ETag/Last-Modified
+    a partir daqui e respondem 304 sem carregar nenhuma linha.
+    """
+    __tablename__ = 'versoes_tabela'
+
+    tabela = db.Column(db.String(64), primary_key=True)
+    versao = db.Column(db.Integer, nullable=False, default=0)
+    atualizado_em = db.Column(db.DateTime, nullable=False, default=agora_utc)
+
+
+def registrar_alteracao(conexao, *tabelas):
+    """
+    Incrementa a versão das tabelas na mesma transação da alteração. Chamado
+    automaticamente a cada flush do ORM; operações em lote (bulk_insert_mappings,
+    query.delete(), UPDATE direto) precisam chamar explicitamente.
+    """
+    if tabelas:
+        conexao.execute(
+            update(VersaoTabela)
+            .where(VersaoTabela.tabela.in_(tabelas))
+            .values(versao=VersaoTabela.versao + 1, atualizado_em=agora_utc())
+        )
+
+
+def garantir_versoes():
+    """Cria a linha de versão das tabelas que ainda não têm (chamada nas migrações)."""
+    existentes = {t for (t,) in db.session.query(VersaoTabela.tabela)}
+    for tabela in db.metadata.sorted_tables:
+        if tabela.name != VersaoTabela.__tablename__ and tabela.name not in existentes:
+            db.session.add(VersaoTabela(tabela=tabela.name, versao=0))
+    db.session.commit()
+
+
+def versoes(*tabelas):
+    """[(tabela, versao, atualizado_em)] numa única consulta pela chave primária."""
+    return db.session.query(VersaoTabela.tabela, VersaoTabela.versao, VersaoTabela.atualizado_em) \
+        .filter(VersaoTabela.tabela.in_(tabelas)).order_by(VersaoTabela.tabela).all()
+
+
+def versoes_da_requisicao(*tabelas):
+    """
+    versoes() lida uma única vez por requisição: o ETag e o cache de respostas
+    de uma mesma leitura usam o mesmo estado, com uma consulta só.
+    """
+    lidas = g.setdefault('versoes_lidas', {})
+    chave = tuple(sorted(tabelas))
+    if chave not in lidas:
+        lidas[chave] = versoes(*chave)
+    return lidas[chave]
+
+
+@event.listens_for(Session, 'after_flush')
+def _versionar_tabelas_alteradas(session, flush_context):
+    tabelas = {
+        obj.__table__.name
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+        if hasattr(obj, '__table__') and not isinstance(obj, VersaoTabela)
+    }
+    registrar_alteracao(session.connection(), *sorted(tabelas))
@@ -0,0 +1,97 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+# os módulos do serviço são importados a partir da pasta dele (como no app.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+from models import db  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App com um banco SQLite novo em um diretório temporário."""
+    monkeypatch.setattr(Config, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'teste.db'}")
+    from app import create_app
+    app = create_app()
+    app.config['TESTING'] = True
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def cliente(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def contar_consultas(app):
+    """Context manager que conta os comandos SQL executados dentro do bloco."""
+    @contextmanager
+    def contar():
+        comandos = []
+
+        def registrar(conn, cursor, statement, parameters, context, executemany):
+            comandos.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', registrar)
+        try:
+            yield comandos
+        finally:
+            event.remove(engine, 'before_cursor_execute', registrar)
+    return contar
+
+
+# Pausa entre a verificação de conflitos e a gravação: sem lock, requisições
+# simultâneas passariam todas pela verificação antes de qualquer commit
+PAUSA_CORRIDA = 0.3
+
+
+@pytest.fixture
+def janela_de_corrida(monkeypatch):
+    """Turmas sempre existem e toda verificação de conflitos demora PAUSA_CORRIDA."""
+    import controllers.reserva_controller as reserva_controller
+    import controllers.serie_controller as serie_controller
+
+    def lento(funcao):
+        def verificar(*args, **kwargs):
+            encontrados = funcao(*args, **kwargs)
+            time.sleep(PAUSA_CORRIDA)
+            return encontrados
+        return verificar
+
+    for modulo in (reserva_controller, serie_controller):
+        monkeypatch.setattr(modulo, 'recurso_existe', lambda recurso, recurso_id: True)
+    monkeypatch.setattr(reserva_controller, 'conflitos', lento(reserva_controller.conflitos))
+    monkeypatch.setattr(serie_controller, 'conflitos_em_datas', lento(serie_controller.conflitos_em_datas))
+
+
+@pytest.fixture
+def em_paralelo(app):
+    """Dispara as requisições (metodo, url, corpo) ao mesmo tempo, cada uma com seu cliente; retorna os status."""
+    def disparar(*requisicoes):
+        status = [None] * len(requisicoes)
+        barreira = threading.Barrier(len(requisicoes))
+
+        def executar(i, metodo, url, corpo):
+            cliente = app.test_client()
+            barreira.wait()
+            status[i] = getattr(cliente, metodo)(url, json=corpo).status_code
+
+        threads = [threading.Thread(target=executar, args=(i, *r)) for i, r in enumerate(requisicoes)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return sorted(status)
+    return disparar
@@ -0,0 +1,48 @@
+from concurrent.futures import Future
+
+import controllers.reserva_controller as reserva_controller
+
+
+def reserva(**campos):
+    return {'num_sala': 'LAB1', 'data': '2025-09-01', 'hora_inicio': '08:00', 'hora_fim': '10:00', 'turma_id': 1, **campos}
+
+
+def total_reservas(cliente):
+    return len(cliente.get('/api/reservas/?all=true').get_json())
+
+
+def test_duas_reservas_simultaneas_do_mesmo_horario(cliente, janela_de_corrida, em_paralelo):
+    status = em_paralelo(('post', '/api/reservas/', reserva()),
+                         ('post', '/api/reservas/', reserva(hora_inicio='09:00', hora_fim='11:00')))
+
+    assert status == [201, 409]
+    assert total_reservas(cliente) == 1
+
+
+def test_reserva_e_atualizacao_simultaneas_para_o_mesmo_horario(cliente, janela_de_corrida, em_paralelo):
+    existente = cliente.post('/api/reservas/', json=reserva(hora_inicio='14:00', hora_fim='15:00')).get_json()
+
+    status = em_paralelo(('post', '/api/reservas/', reserva()),
+                         ('put', f"/api/reservas/{existente['id']}", {'hora_inicio': '08:30', 'hora_fim': '09:30'}))
+
+    horarios = sorted((r['hora_inicio'], r['hora_fim']) for r in cliente.get('/api/reservas/?all=true').get_json())
+    # ou a nova reserva entrou e a atualização foi recusada, ou o contrário
+    if status == [201, 409]:
+        assert horarios == [('08:00', '10:00'), ('14:00', '15:00')]
+    else:
+        assert status == [200, 409]
+        assert horarios == [('08:30', '09:30')]
+
+
+def test_reservas_simultaneas_pelo_endpoint_async(cliente, janela_de_corrida, em_paralelo, monkeypatch):
+    def turma_validada(*pares):
+        futuro = Future()
+        futuro.set_result([True] * len(pares))
+        return futuro
+    monkeypatch.setattr(reserva_controller, 'validar_em_paralelo', turma_validada)
+
+    status = em_paralelo(('post', '/api/reservas/async', reserva()),
+                         ('post', '/api/reservas/async', reserva(hora_inicio='09:30', hora_fim='10:30')))
+
+    assert status == [201, 409]
+    assert total_reservas(cliente) == 1
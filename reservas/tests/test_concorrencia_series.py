@@ -0,0 +1,37 @@
+from itertools import combinations
+
+
+def serie(**campos):
+    # segundas-feiras de setembro de 2025, das 8h às 10h
+    return {'num_sala': 'LAB1', 'turma_id': 1, 'data_inicio': '2025-09-01', 'data_fim': '2025-09-29',
+            'dias_semana': [0], 'hora_inicio': '08:00', 'hora_fim': '10:00', **campos}
+
+
+def reserva(**campos):
+    return {'num_sala': 'LAB1', 'turma_id': 1, 'data': '2025-09-15', 'hora_inicio': '09:00', 'hora_fim': '11:00', **campos}
+
+
+def sobreposicoes(cliente):
+    reservas = cliente.get('/api/reservas/?all=true').get_json()
+    return [(a['id'], b['id']) for a, b in combinations(reservas, 2)
+            if a['num_sala'] == b['num_sala'] and a['data'] == b['data']
+            and a['hora_inicio'] < b['hora_fim'] and b['hora_inicio'] < a['hora_fim']]
+
+
+def test_serie_e_reserva_avulsa_simultaneas(cliente, janela_de_corrida, em_paralelo):
+    status = em_paralelo(('post', '/api/reservas/series/', serie()),
+                         ('post', '/api/reservas/', reserva()))
+
+    assert status == [201, 409]
+    assert sobreposicoes(cliente) == []
+
+
+def test_reserva_avulsa_nao_entra_no_meio_da_atualizacao_da_serie(cliente, janela_de_corrida, em_paralelo):
+    existente = cliente.post('/api/reservas/series/', json=serie()).get_json()
+
+    # a série passa para 10h-12h enquanto alguém reserva 10h-11h numa das segundas
+    status = em_paralelo(('put', f"/api/reservas/series/{existente['id']}", {'hora_inicio': '10:00', 'hora_fim': '12:00'}),
+                         ('post', '/api/reservas/', reserva(data='2025-09-08', hora_inicio='10:00', hora_fim='11:00')))
+
+    assert status in ([200, 409], [201, 409])
+    assert sobreposicoes(cliente) == []
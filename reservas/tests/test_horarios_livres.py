@@ -0,0 +1,72 @@
+from datetime import date, time
+
+import pytest
+
+from config import Config
+from models import db
+from models.reserva import Reserva
+
+DIA = date(2025, 11, 20)
+
+
+@pytest.fixture
+def agenda(app, monkeypatch):
+    """Sala 101: três reservas no DIA (duas encostadas), uma antiga sem horário no dia seguinte."""
+    monkeypatch.setattr(Config, 'HORARIO_ABERTURA', '07:00')
+    monkeypatch.setattr(Config, 'HORARIO_FECHAMENTO', '23:00')
+    monkeypatch.setattr(Config, 'SALAS', ['101', '102'])
+    monkeypatch.setattr(Config, 'LABORATORIOS', ['LAB1'])
+    reservas = [
+        ('101', DIA, time(8), time(10)),
+        ('101', DIA, time(10), time(11)),
+        ('101', DIA, time(14), time(15, 30)),
+        ('101', date(2025, 11, 21), None, None),
+        ('101', date(2025, 11, 22), time(22), time(23, 30)),
+        ('102', date(2025, 11, 23), time(7), time(23)),
+    ]
+    with app.app_context():
+        db.session.add_all(Reserva(num_sala=sala, data=dia, hora_inicio=inicio, hora_fim=fim, turma_id=1)
+                           for sala, dia, inicio, fim in reservas)
+        db.session.commit()
+
+
+def livres(*trechos):
+    return [{"hora_inicio": a, "hora_fim": b} for a, b in trechos]
+
+
+def test_horarios_livres_entre_abertura_e_fechamento(cliente, agenda):
+    resposta = cliente.get('/api/reservas/salas/101/horarios-livres?inicio=2025-11-20&dias=4')
+
+    assert resposta.status_code == 200
+    assert resposta.get_json() == {"num_sala": "101", "dias": [
+        {"data": "2025-11-20", "livres": livres(("07:00", "08:00"), ("11:00", "14:00"), ("15:30", "23:00"))},
+        {"data": "2025-11-21", "livres": []},  # reserva antiga: dia inteiro
+        {"data": "2025-11-22", "livres": livres(("07:00", "22:00"))},
+        {"data": "2025-11-23", "livres": livres(("07:00", "23:00"))},  # reserva de outra sala
+    ]}
+
+
+@pytest.mark.parametrize('consulta', ['inicio=20-11-2025', 'dias=x', 'dias=0', 'dias=61'])
+def test_horarios_livres_parametros_invalidos(cliente, consulta):
+    assert cliente.get(f'/api/reservas/salas/101/horarios-livres?{consulta}').status_code == 400
+
+
+@pytest.mark.parametrize('consulta, esperado', [
+    ('data=2025-11-20', ['102', 'LAB1']),
+    ('data=2025-11-20&hora_inicio=10:00&hora_fim=11:00', ['102', 'LAB1']),
+    ('data=2025-11-20&hora_inicio=11:00&hora_fim=14:00', ['101', '102', 'LAB1']),  # encosta, não conflita
+    ('data=2025-11-20&hora_inicio=10:59&hora_fim=11:30', ['102', 'LAB1']),
+    ('data=2025-11-21&hora_inicio=07:00&hora_fim=08:00', ['102', 'LAB1']),         # dia inteiro ocupado
+    ('data=2025-11-21&lab=true', ['LAB1']),
+    ('data=2025-11-21&lab=false', ['102']),
+])
+def test_disponibilidade(cliente, agenda, consulta, esperado):
+    resposta = cliente.get(f'/api/reservas/disponibilidade?{consulta}')
+    assert resposta.status_code == 200
+    assert resposta.get_json()["salas_livres"] == esperado
+
+
+@pytest.mark.parametrize('consulta', ['', 'data=ontem', 'data=2025-11-20&hora_inicio=10:00',
+                                      'data=2025-11-20&hora_inicio=11:00&hora_fim=10:00'])
+def test_disponibilidade_parametros_invalidos(cliente, consulta):
+    assert cliente.get(f'/api/reservas/disponibilidade?{consulta}').status_code == 400
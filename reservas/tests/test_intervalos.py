@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from utils.agenda import DIA_INTEIRO, intervalo
+from utils.intervalos import ArvoreIntervalos
+
+# (inicio, fim, id) em minutos: 08:00-10:00, 10:00-11:00, 14:00-15:30
+RESERVAS = [(480, 600, 'a'), (600, 660, 'b'), (840, 930, 'c')]
+
+
+@pytest.mark.parametrize('inicio, fim, esperado', [
+    (540, 570, ['a']),            # dentro de uma reserva
+    (570, 630, ['a', 'b']),       # pega duas, na ordem do início
+    (420, 1000, ['a', 'b', 'c']),
+    (660, 840, []),               # exatamente a lacuna entre b e c
+    (420, 480, []),               # termina quando a começa
+    (930, 960, []),               # começa quando c termina
+    (479, 481, ['a']),
+])
+def test_sobrepostos_usa_intervalos_semiabertos(inicio, fim, esperado):
+    arvore = ArvoreIntervalos(RESERVAS)
+    assert arvore.sobrepostos(inicio, fim) == esperado
+    assert arvore.livre(inicio, fim) is (not esperado)
+
+
+def test_arvore_vazia():
+    arvore = ArvoreIntervalos()
+    assert arvore.tamanho == 0
+    assert arvore.sobrepostos(0, 1440) == []
+    assert arvore.livre(0, 1440)
+    assert arvore.lacunas(420, 1380) == [(420, 1380)]
+
+
+def test_lacunas_dentro_do_funcionamento():
+    arvore = ArvoreIntervalos(RESERVAS + [(360, 450, 'cedo'), (1350, 1440, 'tarde')])
+    # 06:00-07:30 e 22:30-24:00 passam das bordas de 07:00-23:00 e são cortadas
+    assert arvore.lacunas(420, 1380) == [(450, 480), (660, 840), (930, 1350)]
+
+
+def test_reserva_sem_horario_ocupa_o_dia_inteiro():
+    assert intervalo(None, None) == DIA_INTEIRO
+    arvore = ArvoreIntervalos([(*DIA_INTEIRO, 'legado')])
+    assert arvore.sobrepostos(0, 1) == ['legado']
+    assert arvore.sobrepostos(1439, 1440) == ['legado']
+    assert arvore.lacunas(420, 1380) == []
+
+
+def test_confere_com_busca_linear():
+    sorteio = random.Random(7)
+    intervalos = []
+    for i in range(300):
+        inicio = sorteio.randrange(0, 1400)
+        intervalos.append((inicio, inicio + sorteio.randrange(1, 120), i))
+    arvore = ArvoreIntervalos(intervalos)
+    for _ in range(500):
+        inicio = sorteio.randrange(0, 1440)
+        fim = inicio + sorteio.randrange(1, 90)
+        esperado = sorted((i for i in intervalos if i[0] < fim and i[1] > inicio), key=lambda i: (i[0], i[1]))
+        assert arvore.sobrepostos(inicio, fim) == [i[2] for i in esperado]
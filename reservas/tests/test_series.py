@@ -0,0 +1,137 @@
+from datetime import date, time
+
+import pytest
+
+from controllers import serie_controller
+from models import db
+from models.reserva import Reserva
+from models.serie_reserva import SerieReserva
+from utils.agenda import expandir_semanal
+
+# segundas e quartas, semana sim, semana não, em novembro de 2025 (03/11 é segunda)
+SERIE = {
+    "num_sala": "101", "turma_id": 1, "data_inicio": "2025-11-03", "data_fim": "2025-11-30",
+    "dias_semana": [0, 2], "intervalo_semanas": 2, "hora_inicio": "08:00", "hora_fim": "10:00",
+}
+
+
+@pytest.fixture(autouse=True)
+def turmas_existem(monkeypatch):
+    monkeypatch.setattr(serie_controller, 'recurso_existe', lambda recurso, recurso_id: True)
+
+
+def reservar(app, dia, inicio=None, fim=None, sala="101"):
+    """Reserva avulsa gravada direto no banco; devolve o id."""
+    with app.app_context():
+        reserva = Reserva(num_sala=sala, data=dia, hora_inicio=inicio, hora_fim=fim, turma_id=2)
+        db.session.add(reserva)
+        db.session.commit()
+        return reserva.id
+
+
+def reservas_da_serie(app, serie_id):
+    with app.app_context():
+        return db.session.execute(
+            db.select(Reserva.data, Reserva.hora_inicio, Reserva.hora_fim)
+            .where(Reserva.serie_id == serie_id).order_by(Reserva.data)
+        ).all()
+
+
+def test_expansao_a_cada_duas_semanas_conta_da_semana_do_inicio():
+    # começando numa quarta, a segunda da mesma semana já passou; a semana 1 é pulada
+    assert expandir_semanal(date(2025, 11, 5), date(2025, 12, 3), [0, 2], 2) == [
+        date(2025, 11, 5), date(2025, 11, 17), date(2025, 11, 19), date(2025, 12, 1), date(2025, 12, 3)
+    ]
+
+
+def test_criar_serie_gera_as_reservas(app, cliente):
+    resposta = cliente.post('/api/reservas/series/', json=SERIE)
+
+    assert resposta.status_code == 201
+    corpo = resposta.get_json()
+    assert corpo["datas"] == ["2025-11-03", "2025-11-05", "2025-11-17", "2025-11-19"]
+    assert corpo["total_reservas"] == 4
+    assert corpo["dias_semana"] == [0, 2]
+    assert (corpo["hora_inicio"], corpo["hora_fim"]) == ("08:00", "10:00")
+    assert reservas_da_serie(app, corpo["id"]) == [
+        (date(2025, 11, d), time(8), time(10)) for d in (3, 5, 17, 19)
+    ]
+
+
+def test_serie_acima_do_limite_nao_grava_nada(app, cliente):
+    limite = serie_controller.LIMITE_OCORRENCIAS_SERIE
+    resposta = cliente.post('/api/reservas/series/', json={
+        **SERIE, "data_inicio": "2025-01-01", "data_fim": "2027-12-31",
+        "dias_semana": list(range(7)), "intervalo_semanas": 1,
+    })
+
+    assert resposta.status_code == 400
+    assert resposta.get_json() == {"erro": f"Máximo de {limite} reservas por série"}
+    with app.app_context():
+        assert db.session.query(SerieReserva).count() == 0
+        assert db.session.query(Reserva).count() == 0
+
+
+@pytest.mark.parametrize('alteracao', [
+    {"intervalo_semanas": 0},
+    {"data_fim": "2025-11-01"},
+    {"dias_semana": [7]},
+    {"hora_inicio": "10:00", "hora_fim": "08:00"},
+])
+def test_regra_invalida(cliente, alteracao):
+    assert cliente.post('/api/reservas/series/', json={**SERIE, **alteracao}).status_code == 400
+
+
+def test_conflitos_listam_as_datas_e_nada_e_gravado(app, cliente):
+    sobreposta = reservar(app, date(2025, 11, 5), time(9), time(11))
+    dia_inteiro = reservar(app, date(2025, 11, 17))       # reserva antiga, sem horário
+    reservar(app, date(2025, 11, 19), time(10), time(11))  # encosta no fim: não conflita
+    reservar(app, date(2025, 11, 3), time(8), time(10), sala="102")
+
+    resposta = cliente.post('/api/reservas/series/', json=SERIE)
+
+    assert resposta.status_code == 409
+    assert resposta.get_json() == {
+        "erro": "Sala 101 já reservada em 2 data(s) da série",
+        "conflitos": [
+            {"data": "2025-11-05", "reservas": [sobreposta]},
+            {"data": "2025-11-17", "reservas": [dia_inteiro]},
+        ],
+    }
+    with app.app_context():
+        assert db.session.query(SerieReserva).count() == 0
+        assert db.session.query(Reserva).count() == 4
+
+
+def test_atualizar_serie_regera_as_reservas(app, cliente):
+    serie_id = cliente.post('/api/reservas/series/', json=SERIE).get_json()["id"]
+
+    # mesmo horário de antes: as reservas antigas da própria série não contam como conflito
+    resposta = cliente.put(f'/api/reservas/series/{serie_id}', json={"dias_semana": [4], "intervalo_semanas": 1})
+
+    assert resposta.status_code == 200
+    assert resposta.get_json()["datas"] == ["2025-11-07", "2025-11-14", "2025-11-21", "2025-11-28"]
+    assert reservas_da_serie(app, serie_id) == [
+        (date(2025, 11, d), time(8), time(10)) for d in (7, 14, 21, 28)
+    ]
+
+    resposta = cliente.put(f'/api/reservas/series/{serie_id}', json={"hora_inicio": "13:00", "hora_fim": "14:30"})
+    assert resposta.status_code == 200
+    assert reservas_da_serie(app, serie_id) == [
+        (date(2025, 11, d), time(13), time(14, 30)) for d in (7, 14, 21, 28)
+    ]
+
+
+def test_atualizacao_com_conflito_mantem_as_reservas_antigas(app, cliente):
+    serie_id = cliente.post('/api/reservas/series/', json=SERIE).get_json()["id"]
+    avulsa = reservar(app, date(2025, 11, 10), time(8), time(9))
+
+    resposta = cliente.put(f'/api/reservas/series/{serie_id}', json={"intervalo_semanas": 1})
+
+    assert resposta.status_code == 409
+    assert resposta.get_json()["conflitos"] == [{"data": "2025-11-10", "reservas": [avulsa]}]
+    assert [dia for dia, _, _ in reservas_da_serie(app, serie_id)] == [
+        date(2025, 11, d) for d in (3, 5, 17, 19)
+    ]
+    with app.app_context():
+        assert db.session.get(SerieReserva, serie_id).intervalo_semanas == 2
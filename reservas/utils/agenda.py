@@ -0,0 +1,127 @@
+from collections import defaultdict
+from datetime import time, timedelta
+
+from sqlalchemy import text
+
+from models import db
+from models.reserva import Reserva
+from utils.intervalos import ArvoreIntervalos
+
+# Reservas antigas (sem horário) ocupam o dia inteiro
+DIA_INTEIRO = (0, 24 * 60)
+
+
+def minutos(hora):
+    """datetime.time -> minutos desde a meia-noite."""
+    return hora.hour * 60 + hora.minute
+
+
+def hora(minutos_do_dia):
+    """Minutos desde a meia-noite -> "HH:MM" (24:00 para o fim do dia)."""
+    return f"{minutos_do_dia // 60:02d}:{minutos_do_dia % 60:02d}"
+
+
+def ler_horario(dados):
+    """
+    Lê hora_inicio/hora_fim ("HH:MM") de um dict. Retorna (inicio, fim) em
+    datetime.time ou (None, None) se nenhum foi enviado.
+    Levanta ValueError se só um foi enviado ou se o intervalo é inválido.
+    """
+    inicio, fim = dados.get("hora_inicio"), dados.get("hora_fim")
+    if inicio is None and fim is None:
+        return None, None
+    if inicio is None or fim is None:
+        raise ValueError("Informe 'hora_inicio' e 'hora_fim' juntos")
+    inicio, fim = time.fromisoformat(inicio), time.fromisoformat(fim)
+    if inicio >= fim:
+        raise ValueError("'hora_inicio' deve ser anterior a 'hora_fim'")
+    return inicio, fim
+
+
+def intervalo(hora_inicio, hora_fim):
+    """Intervalo em minutos ocupado por uma reserva (dia inteiro se não tiver horário)."""
+    if hora_inicio is None or hora_fim is None:
+        return DIA_INTEIRO
+    return minutos(hora_inicio), minutos(hora_fim)
+
+
+def bloquear_salas(*salas):
+    """
+    Serializa, até o fim da transação, a verificação de conflitos e a gravação
+    de reservas nas salas indicadas: quem chega depois espera o commit e já
+    enxerga a reserva nova. Chamar antes da consulta de conflitos e de
+    qualquer escrita da transação.
+
+    PostgreSQL: lock consultivo por sala (pg_advisory_xact_lock).
+    SQLite: BEGIN IMMEDIATE, que pega o lock de escrita do banco já no início
+    (os outros escritores esperam até SQLITE_BUSY_TIMEOUT).
+    """
+    conexao = db.session.connection()
+    if conexao.dialect.name == "postgresql":
+        for sala in sorted(set(salas)):  # sempre na mesma ordem, sem deadlock entre duas salas
+            conexao.execute(text("SELECT pg_advisory_xact_lock(hashtext(:sala))"), {"sala": sala})
+    elif conexao.dialect.name == "sqlite":
+        # o driver só abre a transação na primeira escrita, que já pega o lock de
+        # escrita; se ela ainda não foi aberta, abrimos com o lock imediato
+        if not conexao.connection.dbapi_connection.in_transaction:
+            conexao.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def arvores_por_dia(num_sala, data_inicio, data_fim, ignorar_ids=()):
+    """
+    Uma árvore de intervalos por dia com as reservas da sala entre data_inicio
+    e data_fim (inclusive), carregadas numa única consulta pelo índice (num_sala, data).
+    """
+    consulta = Reserva.query.filter(
+        Reserva.num_sala == num_sala,
+        Reserva.data >= data_inicio,
+        Reserva.data <= data_fim
+    )
+    if ignorar_ids:
+        consulta = consulta.filter(Reserva.id.notin_(ignorar_ids))
+
+    por_dia = defaultdict(list)
+    for r in consulta:
+        por_dia[r.data].append((*intervalo(r.hora_inicio, r.hora_fim), r.id))
+    return defaultdict(ArvoreIntervalos, {dia: ArvoreIntervalos(ints) for dia, ints in por_dia.items()})
+
+
+def conflitos(num_sala, data, hora_inicio, hora_fim, ignorar_ids=()):
+    """Ids das reservas da sala que se sobrepõem ao horário pedido no dia."""
+    arvore = arvores_por_dia(num_sala, data, data, ignorar_ids)[data]
+    return arvore.sobrepostos(*intervalo(hora_inicio, hora_fim))
+
+
+def expandir_semanal(data_inicio, data_fim, dias_semana, intervalo_semanas=1):
+    """
+    Datas entre data_inicio e data_fim (inclusive) que caem nos dias_semana
+    (0 = segunda ... 6 = domingo), a cada intervalo_semanas semanas contadas
+    a partir da semana de data_inicio.
+    """
+    semana_zero = data_inicio - timedelta(days=data_inicio.weekday())
+    dias = set(dias_semana)
+    datas = []
+    dia = data_inicio
+    while dia <= data_fim:
+        if dia.weekday() in dias and ((dia - semana_zero).days // 7) % intervalo_semanas == 0:
+            datas.append(dia)
+        dia += timedelta(days=1)
+    return datas
+
+
+def conflitos_em_datas(num_sala, datas, hora_inicio, hora_fim, ignorar_ids=()):
+    """
+    {data: [ids conflitantes]} para um conjunto de datas da mesma sala, com uma
+    única consulta cobrindo o intervalo entre a primeira e a última data.
+    """
+    if not datas:
+        return {}
+    arvores = arvores_por_dia(num_sala, min(datas), max(datas), ignorar_ids)
+    pedido = intervalo(hora_inicio, hora_fim)
+    resultado = {}
+    for dia in datas:
+        if dia in arvores:
+            ids = arvores[dia].sobrepostos(*pedido)
+            if ids:
+                resultado[dia] = ids
+    return resultado
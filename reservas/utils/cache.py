@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheTTL:
+    """
+    Cache LRU com tamanho máximo e expiração por item, seguro entre threads.
+    Quando cheio, descarta o item usado há mais tempo.
+    """
+
+    def __init__(self, tamanho_maximo, ttl):
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._itens = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obter(self, chave):
+        """Retorna (True, valor) se a chave estiver no cache e válida, senão (False, None)."""
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is not None:
+                valor, expira_em = item
+                if expira_em > time.monotonic():
+                    self._itens.move_to_end(chave)
+                    self.hits += 1
+                    return True, valor
+                del self._itens[chave]
+            self.misses += 1
+            return False, None
+
+    def definir(self, chave, valor, ttl=None):
+        expira_em = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._itens[chave] = (valor, expira_em)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+
+    def invalidar(self, chave):
+        with self._lock:
+            self._itens.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+
+    def estatisticas(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "taxa_acerto": round(self.hits / total, 4) if total else 0.0,
+                "tamanho": len(self._itens),
+                "tamanho_maximo": self.tamanho_maximo
+            }
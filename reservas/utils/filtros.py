@@ -0,0 +1,65 @@
+from datetime import date
+
+from flask import request
+
+# Sufixos aceitos na query string: ?campo=valor, ?campo__gte=valor, ?campo__between=a,b ...
+OPERADORES = ("eq", "gt", "gte", "lt", "lte", "in", "between")
+
+
+def data_iso(valor):
+    """Conversor para colunas Date (AAAA-MM-DD)."""
+    return date.fromisoformat(valor)
+
+
+def booleano(valor):
+    """Conversor para colunas Boolean (true/false, 1/0)."""
+    if valor.lower() in ("1", "true"):
+        return True
+    if valor.lower() in ("0", "false"):
+        return False
+    raise ValueError(valor)
+
+
+def filtrar(consulta, campos):
+    """
+    Traduz os filtros da query string em cláusulas WHERE na consulta.
+
+    campos mapeia o nome do parâmetro para (coluna, conversor), por exemplo
+    {"turma_id": (Atividade.turma_id, int)}. Parâmetros de outros campos
+    (limit, after, all...) são ignorados. Levanta ValueError com a mensagem
+    para o cliente se o operador ou o valor forem inválidos.
+    """
+    for parametro, valor in request.args.items():
+        nome, _, operador = parametro.partition("__")
+        if nome not in campos:
+            continue
+        operador = operador or "eq"
+        if operador not in OPERADORES:
+            raise ValueError(f"Operador '{operador}' inválido em '{parametro}'; use um de {', '.join(OPERADORES)}")
+
+        coluna, converter = campos[nome]
+        try:
+            if operador in ("in", "between"):
+                valores = [converter(v.strip()) for v in valor.split(",")]
+            else:
+                valores = [converter(valor)]
+        except ValueError:
+            raise ValueError(f"Valor inválido para '{parametro}': {valor}")
+
+        if operador == "eq":
+            consulta = consulta.filter(coluna == valores[0])
+        elif operador == "gt":
+            consulta = consulta.filter(coluna > valores[0])
+        elif operador == "gte":
+            consulta = consulta.filter(coluna >= valores[0])
+        elif operador == "lt":
+            consulta = consulta.filter(coluna < valores[0])
+        elif operador == "lte":
+            consulta = consulta.filter(coluna <= valores[0])
+        elif operador == "in":
+            consulta = consulta.filter(coluna.in_(valores))
+        else:
+            if len(valores) != 2:
+                raise ValueError(f"'{parametro}' espera dois valores separados por vírgula")
+            consulta = consulta.filter(coluna.between(*valores))
+    return consulta
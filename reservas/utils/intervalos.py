@@ -0,0 +1,66 @@
+class _No:
+    __slots__ = ("inicio", "fim", "dado", "esquerda", "direita", "maior_fim")
+
+    def __init__(self, inicio, fim, dado):
+        self.inicio = inicio
+        self.fim = fim
+        self.dado = dado
+        self.esquerda = None
+        self.direita = None
+        self.maior_fim = fim
+
+
+class ArvoreIntervalos:
+    """
+    Árvore de intervalos semiabertos [inicio, fim) montada de uma vez a partir
+    de uma lista (árvore balanceada ordenada pelo início). Cada nó guarda o
+    maior fim da sua subárvore, o que permite descartar ramos inteiros:
+    as buscas custam O(log n + k), k = intervalos encontrados.
+    """
+
+    def __init__(self, intervalos=()):
+        ordenados = sorted(intervalos, key=lambda i: (i[0], i[1]))
+        self.tamanho = len(ordenados)
+        self._raiz = self._construir(ordenados, 0, len(ordenados))
+
+    def _construir(self, ordenados, ini, fim):
+        if ini >= fim:
+            return None
+        meio = (ini + fim) // 2
+        no = _No(*ordenados[meio])
+        no.esquerda = self._construir(ordenados, ini, meio)
+        no.direita = self._construir(ordenados, meio + 1, fim)
+        for filho in (no.esquerda, no.direita):
+            if filho is not None and filho.maior_fim > no.maior_fim:
+                no.maior_fim = filho.maior_fim
+        return no
+
+    def _sobrepostos(self, no, inicio, fim):
+        # percorre em ordem, então os intervalos saem ordenados pelo início
+        if no is None or no.maior_fim <= inicio:
+            return
+        yield from self._sobrepostos(no.esquerda, inicio, fim)
+        if no.inicio < fim and no.fim > inicio:
+            yield no
+        if no.inicio < fim:
+            yield from self._sobrepostos(no.direita, inicio, fim)
+
+    def sobrepostos(self, inicio, fim):
+        """Dados dos intervalos que se sobrepõem a [inicio, fim)."""
+        return [no.dado for no in self._sobrepostos(self._raiz, inicio, fim)]
+
+    def livre(self, inicio, fim):
+        """True se nenhum intervalo se sobrepõe a [inicio, fim)."""
+        return next(self._sobrepostos(self._raiz, inicio, fim), None) is None
+
+    def lacunas(self, inicio, fim):
+        """Trechos livres dentro de [inicio, fim), como lista de (inicio, fim)."""
+        livres = []
+        cursor = inicio
+        for no in self._sobrepostos(self._raiz, inicio, fim):
+            if no.inicio > cursor:
+                livres.append((cursor, no.inicio))
+            cursor = max(cursor, no.fim)
+        if cursor < fim:
+            livres.append((cursor, fim))
+        return livres
@@ -0,0 +1,79 @@
+from flask import jsonify, request
+from sqlalchemy import Select
+from sqlalchemy.engine import RowMapping
+
+from models import db
+
+# Quantidade de itens por página quando o cliente não informa ?limit=
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 500
+
+
+def parametros_paginacao():
+    """
+    Lê os parâmetros de paginação da query string.
+
+    Retorna (limite, apos). Quando o cliente pede explicitamente a listagem
+    completa (?all=true) retorna (None, None). Levanta ValueError se os
+    valores forem inválidos.
+    """
+    if request.args.get('all', '').lower() in ('1', 'true'):
+        return None, None
+
+    try:
+        limite = int(request.args.get('limit', LIMITE_PADRAO))
+        apos = int(request.args.get('after', 0))
+    except ValueError:
+        raise ValueError("Os parâmetros 'limit' e 'after' devem ser inteiros")
+
+    if not 1 <= limite <= LIMITE_MAXIMO:
+        raise ValueError(f"O parâmetro 'limit' deve estar entre 1 e {LIMITE_MAXIMO}")
+    return limite, apos
+
+
+def buscar(consulta):
+    """
+    Executa a consulta. Uma Query do ORM devolve instâncias dos modelos; um
+    select() de colunas devolve linhas leves (RowMapping, acessadas por
+    linha['coluna']), sem identity map nem instrumentação do ORM.
+    """
+    if isinstance(consulta, Select):
+        return db.session.execute(consulta).mappings().all()
+    return consulta.all()
+
+
+def paginar(consulta, coluna_id, limite, apos):
+    """
+    Paginação por cursor (keyset) usando o id: WHERE id > apos ORDER BY id LIMIT limite.
+    Diferente do OFFSET, o custo não cresce conforme o cliente avança nas páginas.
+    Aceita tanto Query do ORM quanto select() de colunas.
+
+    Retorna (itens, proximo_cursor); proximo_cursor é None na última página.
+    """
+    itens = buscar(consulta.filter(coluna_id > apos).order_by(coluna_id).limit(limite + 1))
+    proximo_cursor = None
+    if len(itens) > limite:
+        itens = itens[:limite]
+        ultimo = itens[-1]
+        proximo_cursor = ultimo[coluna_id.key] if isinstance(ultimo, RowMapping) else getattr(ultimo, coluna_id.key)
+    return itens, proximo_cursor
+
+
+def listar_paginado(consulta, coluna_id, serializar):
+    """
+    Monta a resposta de uma listagem paginada: {"items": [...], "next_cursor": ...}.
+    Com ?all=true devolve a lista completa no formato antigo (array simples).
+    """
+    try:
+        limite, apos = parametros_paginacao()
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    if limite is None:
+        return jsonify([serializar(item) for item in buscar(consulta.order_by(coluna_id))]), 200
+
+    itens, proximo_cursor = paginar(consulta, coluna_id, limite, apos)
+    return jsonify({
+        "items": [serializar(item) for item in itens],
+        "next_cursor": proximo_cursor
+    }), 200
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+
+
+class CircuitoAberto(requests.exceptions.RequestException):
+    """A chamada nem foi feita: o circuit breaker do serviço está aberto."""
+
+
+class CircuitBreaker:
+    """
+    Depois de `limite_falhas` falhas seguidas o circuito abre e as chamadas
+    falham na hora durante `tempo_aberto` segundos. Passado esse tempo, uma
+    chamada de teste é liberada: se der certo o circuito fecha, senão reabre.
+    """
+
+    def __init__(self, limite_falhas, tempo_aberto):
+        self.limite_falhas = limite_falhas
+        self.tempo_aberto = tempo_aberto
+        self.falhas = 0
+        self.aberto_ate = 0.0
+        self._lock = threading.Lock()
+
+    def permitir(self):
+        with self._lock:
+            agora = time.monotonic()
+            if self.falhas < self.limite_falhas:
+                return True
+            if agora >= self.aberto_ate:
+                # meio-aberto: deixa uma chamada passar e segura as demais
+                self.aberto_ate = agora + self.tempo_aberto
+                return True
+            return False
+
+    def registrar_sucesso(self):
+        with self._lock:
+            self.falhas = 0
+
+    def registrar_falha(self):
+        with self._lock:
+            self.falhas += 1
+            if self.falhas >= self.limite_falhas:
+                self.aberto_ate = time.monotonic() + self.tempo_aberto
+
+
+class ClienteServico:
+    """
+    Cliente HTTP para outro microsserviço: conexões keep-alive reaproveitadas
+    (requests.Session com pool), timeouts de conexão/leitura, retries com
+    backoff para falhas de rede e 502/503/504, e circuit breaker.
+    """
+
+    def __init__(self, url_base):
+        self.url_base = url_base.rstrip("/")
+        self.timeout = (Config.HTTP_TIMEOUT_CONEXAO, Config.HTTP_TIMEOUT_LEITURA)
+        self.circuito = CircuitBreaker(Config.CIRCUITO_LIMITE_FALHAS, Config.CIRCUITO_TEMPO_ABERTO)
+
+        retry = Retry(
+            total=Config.HTTP_RETRIES,
+            backoff_factor=Config.HTTP_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            # POST entra porque só é usado em consultas somente leitura (/api/_exists)
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False
+        )
+        adaptador = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=Config.HTTP_POOL_TAMANHO,
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adaptador)
+        self.session.mount("https://", adaptador)
+
+    def get(self, caminho, **kwargs):
+        return self._requisitar("GET", caminho, **kwargs)
+
+    def post(self, caminho, **kwargs):
+        return self._requisitar("POST", caminho, **kwargs)
+
+    def _requisitar(self, metodo, caminho, **kwargs):
+        if not self.circuito.permitir():
+            raise CircuitoAberto(f"Serviço {self.url_base} indisponível (circuito aberto)")
+
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            resp = self.session.request(metodo, f"{self.url_base}{caminho}", **kwargs)
+        except requests.exceptions.RequestException:
+            self.circuito.registrar_falha()
+            raise
+
+        if resp.status_code >= 500:
+            self.circuito.registrar_falha()
+        else:
+            self.circuito.registrar_sucesso()
+        return resp
+
+
+# Clientes compartilhados por todas as requisições deste processo
+gerenciamento = ClienteServico(Config.GERENCIAMENTO_URL)
@@ -0,0 +1,105 @@
+import asyncio
+
+import requests
+
+from config import Config
+from utils.cache import CacheTTL
+from utils import servicos, servicos_async
+
+# Recursos validados em lote no gerenciamento (POST /api/_exists)
+RECURSOS = ("turmas",)
+
+cache_validacao = CacheTTL(Config.VALIDACAO_CACHE_TAMANHO, Config.VALIDACAO_CACHE_TTL)
+
+
+def ids_existentes(recurso, ids):
+    """
+    Retorna o conjunto dos `ids` que existem no gerenciamento.
+
+    Os ids já conhecidos saem do cache; os demais são consultados numa única
+    chamada ao POST /api/_exists. Ids encontrados ficam em cache por
+    VALIDACAO_CACHE_TTL segundos e ids inexistentes por VALIDACAO_CACHE_TTL_NEGATIVO.
+    """
+    existentes, pendentes = set(), []
+    for recurso_id in set(ids):
+        encontrado, existe = cache_validacao.obter((recurso, recurso_id))
+        if not encontrado:
+            pendentes.append(recurso_id)
+        elif existe:
+            existentes.add(recurso_id)
+
+    if pendentes:
+        resp = servicos.gerenciamento.post("/api/_exists", json={recurso: pendentes})
+        resp.raise_for_status()
+        encontrados = set(resp.json()[recurso])
+        for recurso_id in pendentes:
+            if recurso_id in encontrados:
+                cache_validacao.definir((recurso, recurso_id), True)
+                existentes.add(recurso_id)
+            else:
+                cache_validacao.definir((recurso, recurso_id), False, ttl=Config.VALIDACAO_CACHE_TTL_NEGATIVO)
+
+    return existentes
+
+
+def recurso_existe(recurso, recurso_id):
+    """Verifica se um único id existe no microsserviço dono do recurso."""
+    try:
+        recurso_id = int(recurso_id)
+    except (TypeError, ValueError):
+        return False
+    return recurso_id in ids_existentes(recurso, [recurso_id])
+
+
+async def ids_existentes_async(recurso, ids):
+    """Igual a ids_existentes, mas pelo cliente assíncrono (roda no loop dele)."""
+    existentes, pendentes = set(), []
+    for recurso_id in set(ids):
+        encontrado, existe = cache_validacao.obter((recurso, recurso_id))
+        if not encontrado:
+            pendentes.append(recurso_id)
+        elif existe:
+            existentes.add(recurso_id)
+
+    if pendentes:
+        resp = await servicos_async.gerenciamento.post("/api/_exists", json={recurso: pendentes})
+        if resp.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{resp.status_code} ao consultar {resp.url}")
+        encontrados = set(resp.json()[recurso])
+        for recurso_id in pendentes:
+            if recurso_id in encontrados:
+                cache_validacao.definir((recurso, recurso_id), True)
+                existentes.add(recurso_id)
+            else:
+                cache_validacao.definir((recurso, recurso_id), False, ttl=Config.VALIDACAO_CACHE_TTL_NEGATIVO)
+
+    return existentes
+
+
+async def recurso_existe_async(recurso, recurso_id):
+    try:
+        recurso_id = int(recurso_id)
+    except (TypeError, ValueError):
+        return False
+    return recurso_id in await ids_existentes_async(recurso, [recurso_id])
+
+
+def validar_em_paralelo(*pares):
+    """
+    Dispara as validações (recurso, id) ao mesmo tempo com asyncio.gather no
+    cliente assíncrono e devolve na hora um Future com a lista de booleanos.
+    Quem chama pode fazer trabalho local enquanto espera e depois usar
+    `await asyncio.wrap_future(futuro)`; a latência total é a da validação
+    mais lenta, não a soma delas.
+    """
+    async def todas():
+        return await asyncio.gather(*(recurso_existe_async(recurso, recurso_id) for recurso, recurso_id in pares))
+    return servicos_async.gerenciamento.submeter(todas())
+
+
+def invalidar_validacao(recurso=None, recurso_id=None):
+    """Remove do cache um id específico ou, sem argumentos, limpa o cache inteiro."""
+    if recurso is None:
+        cache_validacao.limpar()
+    else:
+        cache_validacao.invalidar((recurso, int(recurso_id)))